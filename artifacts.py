@@ -0,0 +1,330 @@
+"""
+Writing, serving and garbage-collecting scrape artifacts.
+"""
+import asyncio
+import gzip
+import json
+import mimetypes
+import os
+import re
+import stat
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import anyio
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+# Brotli is optional; gzip siblings are always written
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+# Artifact names are timestamped and never rewritten, so browsers may keep them for good
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+class ArtifactWriter:
+    """Write an artifact and its ``.gz`` (and ``.br``) siblings incrementally.
+
+    Chunks go to temporary dot-files, so memory stays flat however large the
+    artifact grows. ``commit`` moves the siblings and then the artifact into
+    place atomically, so it never appears half-written or without them.
+    Used as a context manager, it commits on success and aborts on error.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._moves: List[Tuple[Path, Path]] = []
+        self._files = []
+        self._plain = self._open(self.path)
+        gzip_file = self._open(self.path.with_name(self.path.name + ".gz"))
+        # mtime=0 and no filename keep the gzip bytes, and therefore the ETag, stable for equal content
+        self._gzip = gzip.GzipFile(filename="", mode="wb", fileobj=gzip_file, compresslevel=9, mtime=0)
+        self._brotli = self._brotli_file = None
+        if BROTLI_AVAILABLE:
+            self._brotli_file = self._open(self.path.with_name(self.path.name + ".br"))
+            self._brotli = brotli.Compressor(quality=11)
+        # The artifact itself is moved into place last
+        self._moves.append(self._moves.pop(0))
+
+    def _open(self, final_path: Path):
+        tmp_path = final_path.with_name(f".{final_path.name}.tmp")
+        handle = open(tmp_path, "wb")
+        self._files.append(handle)
+        self._moves.append((tmp_path, final_path))
+        return handle
+
+    def write(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self._plain.write(data)
+        self._gzip.write(data)
+        if self._brotli is not None:
+            self._brotli_file.write(self._brotli.process(data))
+
+    def _close(self) -> None:
+        self._gzip.close()
+        if self._brotli is not None:
+            self._brotli_file.write(self._brotli.finish())
+            self._brotli = None
+        for handle in self._files:
+            handle.close()
+
+    def commit(self) -> None:
+        self._close()
+        for tmp_path, final_path in self._moves:
+            tmp_path.replace(final_path)
+
+    def abort(self) -> None:
+        try:
+            self._close()
+        finally:
+            for tmp_path, _ in self._moves:
+                try:
+                    tmp_path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def __enter__(self) -> "ArtifactWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+def write_artifact(path: Path, content: str) -> None:
+    """Write ``content`` to ``path`` along with its compressed siblings."""
+    with ArtifactWriter(path) as writer:
+        writer.write(content)
+
+
+def write_json_artifact(path: Path, payload, indent: int = 2) -> None:
+    """Encode ``payload`` straight into an artifact, chunk by chunk."""
+    with ArtifactWriter(path) as writer:
+        for chunk in json.JSONEncoder(indent=indent).iterencode(payload):
+            writer.write(chunk)
+
+
+def accepted_encodings(scope: Scope) -> List[str]:
+    """Return the precompressed encodings the client accepts, best first."""
+    header = ""
+    for name, value in scope.get("headers", []):
+        if name == b"accept-encoding":
+            header = value.decode("latin-1")
+            break
+    accepted = {}
+    for part in header.split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token.strip().lower()] = quality
+    return [
+        encoding for encoding in ENCODING_SUFFIXES
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0
+    ]
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves ``.br``/``.gz`` siblings when the client accepts them.
+
+    Every response carries an immutable ``Cache-Control`` and varies on
+    ``Accept-Encoding``. ETags come from ``FileResponse`` and differ per
+    encoding because each variant is a separate file.
+    """
+
+    def __init__(self, *args, cache_control: str = IMMUTABLE_CACHE_CONTROL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = None
+        if scope["method"] in ("GET", "HEAD"):
+            response = await self._encoded_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+        if response.status_code in (200, 206, 304):
+            response.headers["Cache-Control"] = self.cache_control
+            response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    async def _encoded_response(self, path: str, scope: Scope) -> Optional[Response]:
+        for encoding in accepted_encodings(scope):
+            full_path, stat_result = await self._lookup_file(path + ENCODING_SUFFIXES[encoding])
+            if full_path is None:
+                continue
+            response = self.file_response(full_path, stat_result, scope)
+            response.headers["Content-Encoding"] = encoding
+            media_type = mimetypes.guess_type(path)[0]
+            if media_type and response.status_code != 304:
+                charset = "; charset=utf-8" if media_type.startswith("text/") else ""
+                response.headers["Content-Type"] = media_type + charset
+            return response
+        return None
+
+    async def _lookup_file(self, path: str) -> Tuple[Optional[str], Optional[os.stat_result]]:
+        try:
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path)
+        except OSError:
+            return None, None
+        if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+            return None, None
+        return full_path, stat_result
+
+
+# semantic_scholar_<author>_<timestamp>[_top<n>].html and debug_<author>_<timestamp>.json
+ARTIFACT_NAME_RE = re.compile(
+    r"^(?P<kind>semantic_scholar|debug)_(?P<author>\d+)_(?P<timestamp>\d{14})(?:_top\d+)?\.(?:html|json)$"
+)
+
+
+class _ArtifactGroup:
+    """An artifact and its compressed siblings, which are kept or deleted together."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.paths: List[Path] = []
+        self.size = 0
+        self.mtime = 0.0
+        match = ARTIFACT_NAME_RE.match(name)
+        self.kind = match.group("kind") if match else None
+        self.author = match.group("author") if match else None
+        # Newest first by the timestamp in the name; full checklists beat trimmed _top<n> copies
+        self.recency = (match.group("timestamp") if match else "", "_top" not in name)
+
+
+class ArtifactRetention:
+    """Garbage-collects old artifacts by age, total size and per-author recency.
+
+    A pass deletes artifacts older than ``max_age`` seconds, then the oldest
+    remaining ones until the directories fit in ``max_bytes``. The newest
+    ``keep_per_author`` checklists and debug reports of each author survive
+    both rules, as does any name passed in ``protected``.
+    """
+
+    def __init__(
+        self,
+        directories: Iterable[Path],
+        max_age: float = 7 * 24 * 60 * 60,
+        max_bytes: int = 500 * 1024 * 1024,
+        keep_per_author: int = 1,
+        interval: float = 600.0,
+    ):
+        self.directories = [Path(directory) for directory in directories]
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.keep_per_author = max(0, keep_per_author)
+        self.interval = interval
+        self.stats = {"runs": 0, "removed": 0, "freed_bytes": 0}
+
+    @classmethod
+    def from_env(cls, directories: Iterable[Path]) -> "ArtifactRetention":
+        """Build a collector configured by the ``ARTIFACT_*`` environment variables."""
+        return cls(
+            directories,
+            max_age=float(os.getenv("ARTIFACT_MAX_AGE_SECONDS", str(7 * 24 * 60 * 60))),
+            max_bytes=int(os.getenv("ARTIFACT_MAX_BYTES", str(500 * 1024 * 1024))),
+            keep_per_author=int(os.getenv("ARTIFACT_KEEP_PER_AUTHOR", "1")),
+            interval=float(os.getenv("ARTIFACT_GC_INTERVAL_SECONDS", "600")),
+        )
+
+    def _scan(self) -> List[_ArtifactGroup]:
+        groups: Dict[Path, _ArtifactGroup] = {}
+        for directory in self.directories:
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                # Dot-files are in-progress atomic writes
+                if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                    continue
+                base = entry.name
+                for suffix in ENCODING_SUFFIXES.values():
+                    if base.endswith(suffix):
+                        base = base[: -len(suffix)]
+                        break
+                group = groups.setdefault(Path(directory) / base, _ArtifactGroup(base))
+                try:
+                    info = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                group.paths.append(Path(entry.path))
+                group.size += info.st_size
+                group.mtime = max(group.mtime, info.st_mtime)
+        return list(groups.values())
+
+    def collect(self, protected: Optional[Set[str]] = None) -> Dict[str, int]:
+        """Run one pass and return how many artifacts were removed and bytes freed."""
+        protected = protected or set()
+        now = time.time()
+        groups = sorted(self._scan(), key=lambda group: group.mtime, reverse=True)
+
+        kept: Set[str] = set()
+        seen: Dict[Tuple[str, str], int] = {}
+        for group in sorted(groups, key=lambda group: (group.recency, group.mtime), reverse=True):
+            if group.author is None:
+                continue
+            key = (group.kind, group.author)
+            if seen.get(key, 0) < self.keep_per_author:
+                seen[key] = seen.get(key, 0) + 1
+                kept.add(group.name)
+
+        def removable(group: _ArtifactGroup) -> bool:
+            return group.name not in protected and group.name not in kept
+
+        doomed = [group for group in groups if removable(group) and now - group.mtime > self.max_age]
+        survivors = [group for group in groups if group not in doomed]
+        total = sum(group.size for group in survivors)
+        for group in reversed(survivors):  # oldest first
+            if total <= self.max_bytes:
+                break
+            if removable(group):
+                doomed.append(group)
+                total -= group.size
+
+        removed = freed = 0
+        for group in doomed:
+            for path in group.paths:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as exc:
+                    print(f"⚠️ Could not delete artifact {path}: {exc}")
+                    continue
+            removed += 1
+            freed += group.size
+        self.stats["runs"] += 1
+        self.stats["removed"] += removed
+        self.stats["freed_bytes"] += freed
+        return {"removed": removed, "freed_bytes": freed}
+
+    async def run_periodically(self, protected: Callable[[], Set[str]]) -> None:
+        """Collect every ``interval`` seconds; ``protected`` is evaluated on the event loop."""
+        while True:
+            try:
+                result = await asyncio.to_thread(self.collect, protected())
+                if result["removed"]:
+                    print(
+                        f"🧹 Removed {result['removed']} artifact(s), "
+                        f"freed {result['freed_bytes'] / 1024 / 1024:.1f} MB"
+                    )
+            except Exception:  # pylint: disable=broad-except
+                traceback.print_exc()
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,171 @@
+"""
+End-to-end scrape benchmark against the local stand-in upstream.
+
+Runs ``SemanticScholarScraper`` for synthetic authors of different sizes and
+reports papers/second, p50/p95 per-paper latency, API calls, upstream
+requests and peak RSS. Each author runs in a fresh process so peak RSS
+belongs to that run alone. Run from the repository root:
+
+    python -m benchmarks.bench_scrape
+    python -m benchmarks.bench_scrape --sizes 200 --latency 0.05 --error-rate 0.02 --rate-limit-rate 0.01
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from benchmarks.fake_upstream import Corpus, FakeUpstream, FaultProfile
+
+DEFAULT_SIZES = [50, 200, 1000]
+
+
+def author_id_for(size: int) -> str:
+    """Synthetic author IDs are numeric so the scraper looks them up directly."""
+    return str(9_000_000 + size)
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def _scrape(author_id: str, size: int, base_urls: Dict[str, str], options: Dict[str, Any]) -> Dict[str, Any]:
+    from browser_pool import BrowserPool
+    from rate_limiter import AsyncRateLimiter
+    from result_cache import AuthorResultCache
+    from semantic_scholar_scraper import SemanticScholarScraper
+    from validation_cache import ValidationCache
+
+    # Chromium launches would dominate the timings, so the Playwright tier stays off
+    browser_pool = BrowserPool()
+    browser_pool.available = False
+    limiter = AsyncRateLimiter(rate=options["api_rps"], burst=10, backoff_base=0.2, backoff_cap=2.0)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        scraper = SemanticScholarScraper(
+            max_papers=size,
+            concurrency=options["concurrency"],
+            browser_pool=browser_pool,
+            rate_limiter=limiter,
+            validation_cache=ValidationCache(Path(cache_dir) / "validation.sqlite3"),
+            result_cache=AuthorResultCache(Path(cache_dir) / "results.sqlite3"),
+            use_cache=False,
+            race_strategies=options["race_strategies"],
+            base_urls=base_urls,
+        )
+        latencies: List[float] = []
+        started = time.perf_counter()
+        try:
+            async for record in scraper.iter_profile(author_id):
+                latencies.append(record["elapsed"])
+        finally:
+            await scraper.aclose()
+            scraper.validation_cache.close()
+            scraper.result_cache.close()
+        wall = time.perf_counter() - started
+
+    return {
+        "papers": len(latencies),
+        "pdf_links": scraper.stats["download_links_found"],
+        "seconds": wall,
+        "papers_per_second": len(latencies) / wall if wall else 0.0,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "api_calls": scraper.stats["api_calls"],
+        "api_rate_limited": int(limiter.stats["rate_limited"]),
+    }
+
+
+def run_case(author_id: str, size: int, base_urls: Dict[str, str], options: Dict[str, Any]) -> Dict[str, Any]:
+    """Child-process entry point: scrape one author quietly and measure it."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = asyncio.run(_scrape(author_id, size, base_urls, options))
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+def run_benchmarks(sizes: List[int], faults: FaultProfile, options: Dict[str, Any], seed: int = 0) -> List[Dict[str, Any]]:
+    corpus = Corpus({author_id_for(size): size for size in sizes}, seed=seed)
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with FakeUpstream(corpus, faults) as upstream:
+        for size in sizes:
+            before = upstream.requests.copy()
+            with context.Pool(1) as pool:
+                result = pool.apply(run_case, (author_id_for(size), size, upstream.base_urls(), options))
+            requests = upstream.requests - before
+            result.update(author_papers=size, upstream_requests=dict(requests))
+            results.append(result)
+    return results
+
+
+def _print_table(results: List[Dict[str, Any]]) -> None:
+    header = f"{'author':>7} {'papers':>7} {'PDFs':>6} {'papers/s':>9} {'p50 ms':>8} {'p95 ms':>8} " \
+             f"{'API':>5} {'429s':>5} {'upstream':>9} {'RSS MB':>8}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        upstream = sum(count for key, count in result["upstream_requests"].items() if not key.startswith("injected"))
+        print(
+            f"{result['author_papers']:>7} {result['papers']:>7} {result['pdf_links']:>6} "
+            f"{result['papers_per_second']:>9.1f} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+            f"{result['api_calls']:>5} {result['api_rate_limited']:>5} {upstream:>9} {result['peak_rss_mb']:>8.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the scrape pipeline against a local fake upstream")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Papers per synthetic author")
+    parser.add_argument("--latency", type=float, default=0.02, help="Upstream latency per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="Extra random latency per request in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with a 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with a 429")
+    parser.add_argument("--concurrency", type=int, default=4, help="Papers enriched in parallel")
+    parser.add_argument("--race-strategies", action="store_true", help="Race the PDF discovery tiers")
+    parser.add_argument("--api-rps", type=float, default=50.0, help="Rate limit for Semantic Scholar API calls")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic corpus and fault injection")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    faults = FaultProfile(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    options = {
+        "concurrency": args.concurrency,
+        "race_strategies": args.race_strategies,
+        "api_rps": args.api_rps,
+    }
+    if not args.json:
+        print(
+            f"📊 Scrape benchmark: latency {args.latency * 1000:.0f}±{args.jitter * 1000:.0f} ms, "
+            f"errors {args.error_rate:.0%}, 429s {args.rate_limit_rate:.0%}, concurrency {args.concurrency}\n"
+        )
+    results = run_benchmarks(args.sizes, faults, options, seed=args.seed)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+
+
+if __name__ == "__main__":
+    main()
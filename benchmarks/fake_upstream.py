@@ -0,0 +1,594 @@
+"""
+Local stand-in for Semantic Scholar, Unpaywall, doi.org, arXiv and PDF hosts.
+
+Every service lives under its own path prefix on one ``ThreadingHTTPServer``,
+so a scraper built with ``base_urls=upstream.base_urls()`` (or the exported
+``upstream.env()`` variables) never touches the network. Authors and papers
+are synthetic but deterministic for a given seed.
+
+Run it on its own to point the CLI or web server at it:
+
+    python -m benchmarks.fake_upstream --port 8765 --author 9000200:200 --latency 0.05 --faults faults.json
+
+While it runs, ``GET /_control/stats`` returns request counts,
+``PUT /_control/faults`` replaces the fault script and
+``POST /_control/reset`` zeroes the counters.
+"""
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+PDF_BODY = b"%PDF-1.4\n% synthetic paper\n%%EOF\n"
+
+
+class FaultRule:
+    """One scripted fault for requests whose path matches ``match`` (a regex).
+
+    A matching request gets ``latency`` extra seconds and, if ``status`` is
+    set, that error status instead of its normal answer. The rule skips the
+    first ``after`` matches, then fires with ``probability`` until it has
+    fired ``times`` times (forever when ``times`` is None).
+    """
+
+    def __init__(
+        self,
+        match: str = ".*",
+        status: Optional[int] = None,
+        latency: float = 0.0,
+        probability: float = 1.0,
+        times: Optional[int] = None,
+        after: int = 0,
+        retry_after: Optional[float] = None,
+    ):
+        self.match = match
+        self.status = status
+        self.latency = latency
+        self.probability = probability
+        self.times = times
+        self.after = after
+        self.retry_after = retry_after
+        self.pattern = re.compile(match)
+        self.seen = 0
+        self.fired = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FaultRule":
+        fields = ("match", "status", "latency", "probability", "times", "after", "retry_after")
+        return cls(**{key: data[key] for key in fields if key in data})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "match": self.match,
+            "status": self.status,
+            "latency": self.latency,
+            "probability": self.probability,
+            "times": self.times,
+            "after": self.after,
+            "retry_after": self.retry_after,
+            "fired": self.fired,
+        }
+
+    def applies(self, path: str, rng: random.Random) -> bool:
+        if not self.pattern.search(path):
+            return False
+        self.seen += 1
+        if self.seen <= self.after or (self.times is not None and self.fired >= self.times):
+            return False
+        if rng.random() >= self.probability:
+            return False
+        self.fired += 1
+        return True
+
+
+class FaultProfile:
+    """Latency and failure injection applied to every request.
+
+    Each request sleeps ``latency`` seconds (plus up to ``jitter``), then fails
+    with a 500 with probability ``error_rate`` or a 429 carrying
+    ``Retry-After: retry_after`` with probability ``rate_limit_rate``.
+    ``rules`` are checked first, in order; the first one that fires decides
+    the request's extra latency and status.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = 0.1,
+        rules: Iterable[FaultRule] = (),
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.rules = list(rules)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], seed: int = 0) -> "FaultProfile":
+        """Build a profile from the JSON accepted by ``--faults`` and ``PUT /_control/faults``."""
+        return cls(
+            latency=data.get("latency", 0.0),
+            jitter=data.get("jitter", 0.0),
+            error_rate=data.get("error_rate", 0.0),
+            rate_limit_rate=data.get("rate_limit_rate", 0.0),
+            retry_after=data.get("retry_after", 0.1),
+            rules=[FaultRule.from_dict(rule) for rule in data.get("rules", [])],
+            seed=data.get("seed", seed),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "latency": self.latency,
+                "jitter": self.jitter,
+                "error_rate": self.error_rate,
+                "rate_limit_rate": self.rate_limit_rate,
+                "retry_after": self.retry_after,
+                "rules": [rule.to_dict() for rule in self.rules],
+            }
+
+    def draw(self, path: str = "/") -> Tuple[float, Optional[int], float]:
+        """Return ``(delay, status, retry_after)`` for one request; ``status`` is None when it should succeed."""
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            for rule in self.rules:
+                if rule.applies(path, self._random):
+                    retry_after = self.retry_after if rule.retry_after is None else rule.retry_after
+                    return delay + rule.latency, rule.status, retry_after
+            roll = self._random.random()
+        if roll < self.rate_limit_rate:
+            return delay, 429, self.retry_after
+        if roll < self.rate_limit_rate + self.error_rate:
+            return delay, 500, self.retry_after
+        return delay, None, self.retry_after
+
+
+class Corpus:
+    """Synthetic authors and their papers, generated on first use.
+
+    ``authors`` maps author IDs to paper counts. Each paper gets a fixed mix
+    of the things the PDF waterfall looks at: an openAccessPdf in the listing
+    or only in the batch details, an arXiv ID, a DOI that Unpaywall or the
+    doi.org redirect resolves, and a share of dead PDF links.
+    """
+
+    def __init__(self, authors: Dict[str, int], seed: int = 0):
+        self.authors = dict(authors)
+        self.seed = seed
+        self.base_url = ""
+        self._papers: Dict[str, List[Dict[str, Any]]] = {}
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def papers(self, author_id: str) -> Optional[List[Dict[str, Any]]]:
+        if author_id not in self.authors:
+            return None
+        with self._lock:
+            if author_id not in self._papers:
+                self._papers[author_id] = self._generate(author_id, self.authors[author_id])
+                for paper in self._papers[author_id]:
+                    self._by_id[paper["paperId"]] = paper
+            return self._papers[author_id]
+
+    def paper(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        author_id = paper_id.split("p", 1)[0]
+        if self.papers(author_id) is None:
+            return None
+        return self._by_id.get(paper_id)
+
+    def pdf_url(self, paper_id: str) -> str:
+        return f"{self.base_url}/pdf/{paper_id}.pdf"
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        """Authors whose name or ID contains ``query``, case-insensitively."""
+        needle = query.strip().lower()
+        matches = []
+        for author_id, count in self.authors.items():
+            name = f"Author {author_id}"
+            if needle in name.lower() or needle == author_id:
+                matches.append({"authorId": author_id, "name": name, "paperCount": count})
+        return matches
+
+    def _generate(self, author_id: str, count: int) -> List[Dict[str, Any]]:
+        rng = random.Random(f"{self.seed}:{author_id}")
+        papers = []
+        for index in range(count):
+            paper_id = f"{author_id}p{index:05d}"
+            external_ids: Dict[str, str] = {}
+            if rng.random() < 0.7:
+                external_ids["DOI"] = f"10.5555/{paper_id}"
+            if rng.random() < 0.25:
+                external_ids["ArXiv"] = f"2101.{index:05d}"
+            placement = rng.random()
+            papers.append({
+                "paperId": paper_id,
+                "title": f"Synthetic paper {index} by author {author_id}",
+                "year": 2000 + rng.randrange(25),
+                "venue": rng.choice(["NeurIPS", "ICML", "Nature", "arXiv", ""]),
+                "citationCount": int(rng.paretovariate(1.2) * 10),
+                "authors": [{"authorId": author_id, "name": f"Author {author_id}"}],
+                "externalIds": external_ids,
+                # Waterfall tiers: listing openAccessPdf, batch-details-only openAccessPdf, or neither
+                "_oa": "listing" if placement < 0.35 else "details" if placement < 0.5 else None,
+                "_dead_pdf": rng.random() < 0.1,
+                "_unpaywall_oa": rng.random() < 0.4,
+                "_doi_to_pdf": rng.random() < 0.3,
+                # Only reachable through the paper page, i.e. the Playwright tier
+                "_page_pdf": rng.random() < 0.6,
+            })
+        return papers
+
+    def listing(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+        """The paper as returned by ``/author/{id}/papers``."""
+        data = {key: value for key, value in paper.items() if not key.startswith("_")}
+        data["journal"] = {"name": paper["venue"]} if paper["venue"] else None
+        data["openAccessPdf"] = self._open_access(paper) if paper["_oa"] == "listing" else None
+        return data
+
+    def details(self, paper: Dict[str, Any]) -> Dict[str, Any]:
+        """The paper as returned by ``/paper/{id}`` and ``/paper/batch``."""
+        return {
+            "paperId": paper["paperId"],
+            "externalIds": paper["externalIds"],
+            "openAccessPdf": self._open_access(paper) if paper["_oa"] else None,
+        }
+
+    def _open_access(self, paper: Dict[str, Any]) -> Dict[str, str]:
+        return {"url": self.pdf_url(paper["paperId"]), "status": "GREEN"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_HEAD(self):
+        self._dispatch("HEAD")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def _dispatch(self, method: str) -> None:
+        upstream = self.server.upstream
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        body = b""
+        if method in ("POST", "PUT"):
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if path.startswith("/_control/"):
+            upstream.control(self, method, path, body)
+            return
+
+        service = path.strip("/").split("/", 1)[0]
+        upstream.count(service)
+        delay, status, retry_after = upstream.faults.draw(path)
+        if delay:
+            time.sleep(delay)
+        if status is not None:
+            upstream.count(f"injected_{status}")
+            headers = {"Retry-After": f"{retry_after:g}"} if status == 429 else {}
+            self._send_json(status, {"error": "Injected failure"}, method, headers)
+            return
+
+        query = parse_qs(parts.query)
+        for pattern, handler in upstream.routes:
+            match = pattern.match(path)
+            if match:
+                handler(self, method, match, query, body)
+                return
+        self._send_json(404, {"error": "Not found"}, method)
+
+    def _send(self, status: int, body: bytes, content_type: str, method: str, headers=None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if method != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, status: int, payload, method: str, headers=None) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), "application/json", method, headers)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    upstream: "FakeUpstream"
+
+
+class FakeUpstream:
+    """Runs the stand-in services on ``127.0.0.1`` in a background thread.
+
+    ``requests`` counts requests per service prefix (``s2``, ``unpaywall``,
+    ``doi``, ``arxiv``, ``pdf``, ``landing``, ``paper``, ``mirror``) plus
+    ``injected_<status>`` for the faults handed out.
+    """
+
+    def __init__(self, corpus: Corpus, faults: Optional[FaultProfile] = None):
+        self.corpus = corpus
+        self.faults = faults or FaultProfile()
+        self.requests: Counter = Counter()
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self.routes = [
+            (re.compile(r"^/s2/graph/v1/author/search$"), self._author_search),
+            (re.compile(r"^/s2/graph/v1/author/(?P<author_id>[^/]+)/papers$"), self._author_papers),
+            (re.compile(r"^/s2/graph/v1/author/(?P<author_id>[^/]+)$"), self._author),
+            (re.compile(r"^/s2/graph/v1/paper/batch$"), self._paper_batch),
+            (re.compile(r"^/s2/graph/v1/paper/(?P<paper_id>[^/]+)$"), self._paper),
+            (re.compile(r"^/unpaywall/v2/(?P<doi>.+)$"), self._unpaywall),
+            (re.compile(r"^/doi/(?P<doi>.+)$"), self._doi),
+            (re.compile(r"^/arxiv/pdf/(?P<arxiv_id>[^/]+)\.pdf$"), self._arxiv_pdf),
+            (re.compile(r"^/pdf/(?P<paper_id>[^/]+)\.pdf$"), self._pdf),
+            (re.compile(r"^/landing/(?P<paper_id>[^/]+)$"), self._landing),
+            (re.compile(r"^/paper/(?:[^/]+/)?(?P<paper_id>[^/]+)$"), self._paper_page),
+            (re.compile(r"^/mirror/(?P<paper_id>[^/]+)\.pdf$"), self._mirror_pdf),
+        ]
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def base_urls(self) -> Dict[str, str]:
+        """``SemanticScholarScraper(base_urls=...)`` overrides pointing at this server."""
+        return {
+            "api": f"{self.url}/s2",
+            "unpaywall": f"{self.url}/unpaywall",
+            "doi": f"{self.url}/doi",
+            "arxiv": f"{self.url}/arxiv",
+            "paper_page": self.url,
+        }
+
+    def env(self) -> Dict[str, str]:
+        """The same overrides as environment variables, for the CLI or web server."""
+        from semantic_scholar_scraper import SemanticScholarScraper
+
+        return {
+            SemanticScholarScraper.BASE_URL_ENV_VARS[service]: url
+            for service, url in self.base_urls().items()
+        }
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self.requests[key] += 1
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> "FakeUpstream":
+        self._server = _Server((host, port), _Handler)
+        self._server.upstream = self
+        self.corpus.base_url = self.url
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-upstream", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "FakeUpstream":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def control(self, request: _Handler, method: str, path: str, body: bytes) -> None:
+        """Handle ``/_control/*``: stats, fault scripting and counter resets."""
+        if path == "/_control/stats" and method in ("GET", "HEAD"):
+            with self._lock:
+                requests = dict(self.requests)
+            request._send_json(200, {"requests": requests, "faults": self.faults.to_dict()}, method)
+        elif path == "/_control/faults" and method in ("PUT", "POST"):
+            try:
+                self.faults = FaultProfile.from_dict(json.loads(body or b"{}"))
+            except (ValueError, TypeError, re.error) as exc:
+                request._send_json(400, {"error": f"Invalid fault script: {exc}"}, method)
+                return
+            request._send_json(200, self.faults.to_dict(), method)
+        elif path == "/_control/reset" and method == "POST":
+            with self._lock:
+                self.requests.clear()
+            request._send_json(200, {"requests": {}}, method)
+        else:
+            request._send_json(404, {"error": "Unknown control endpoint"}, method)
+
+    # Semantic Scholar Graph API
+
+    def _author_search(self, request: _Handler, method, match, query, body) -> None:
+        authors = self.corpus.search(query.get("query", [""])[0])
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", ["100"])[0])
+        page = {"total": len(authors), "offset": offset, "data": authors[offset:offset + limit]}
+        if offset + limit < len(authors):
+            page["next"] = offset + limit
+        request._send_json(200, page, method)
+
+    def _author(self, request: _Handler, method, match, query, body) -> None:
+        author_id = match.group("author_id")
+        papers = self.corpus.papers(author_id)
+        if papers is None:
+            request._send_json(404, {"error": "Author not found"}, method)
+            return
+        request._send_json(200, {
+            "authorId": author_id,
+            "name": f"Author {author_id}",
+            "paperCount": len(papers),
+        }, method)
+
+    def _author_papers(self, request: _Handler, method, match, query, body) -> None:
+        papers = self.corpus.papers(match.group("author_id"))
+        if papers is None:
+            request._send_json(404, {"error": "Author not found"}, method)
+            return
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", ["100"])[0])
+        page = {"offset": offset, "data": [self.corpus.listing(paper) for paper in papers[offset:offset + limit]]}
+        if offset + limit < len(papers):
+            page["next"] = offset + limit
+        request._send_json(200, page, method)
+
+    def _paper(self, request: _Handler, method, match, query, body) -> None:
+        paper = self.corpus.paper(match.group("paper_id"))
+        if paper is None:
+            request._send_json(404, {"error": "Paper not found"}, method)
+            return
+        request._send_json(200, self.corpus.details(paper), method)
+
+    def _paper_batch(self, request: _Handler, method, match, query, body) -> None:
+        ids = json.loads(body or b"{}").get("ids", [])
+        results = []
+        for paper_id in ids:
+            paper = self.corpus.paper(paper_id)
+            results.append(self.corpus.details(paper) if paper else None)
+        request._send_json(200, results, method)
+
+    # Unpaywall, doi.org and PDF hosts
+
+    def _paper_for_doi(self, doi: str) -> Optional[Dict[str, Any]]:
+        return self.corpus.paper(doi.split("/", 1)[-1])
+
+    def _unpaywall(self, request: _Handler, method, match, query, body) -> None:
+        paper = self._paper_for_doi(match.group("doi"))
+        if paper is None:
+            request._send_json(404, {"error": True, "message": "DOI not found"}, method)
+            return
+        best = {"url_for_pdf": self.corpus.pdf_url(paper["paperId"])} if paper["_unpaywall_oa"] else None
+        request._send_json(200, {
+            "doi": match.group("doi"),
+            "is_oa": best is not None,
+            "best_oa_location": best,
+        }, method)
+
+    def _doi(self, request: _Handler, method, match, query, body) -> None:
+        paper = self._paper_for_doi(match.group("doi"))
+        if paper is None:
+            request._send_json(404, {"error": "DOI not found"}, method)
+            return
+        if paper["_doi_to_pdf"]:
+            location = self.corpus.pdf_url(paper["paperId"])
+        else:
+            location = f"{self.url}/landing/{paper['paperId']}"
+        request._send(302, b"", "text/plain", method, {"Location": location})
+
+    def _arxiv_pdf(self, request: _Handler, method, match, query, body) -> None:
+        request._send(200, PDF_BODY, "application/pdf", method)
+
+    def _pdf(self, request: _Handler, method, match, query, body) -> None:
+        paper = self.corpus.paper(match.group("paper_id"))
+        if paper is None or paper["_dead_pdf"]:
+            request._send(404, b"Not found", "text/plain", method)
+            return
+        request._send(200, PDF_BODY, "application/pdf", method)
+
+    def _landing(self, request: _Handler, method, match, query, body) -> None:
+        paper = self.corpus.paper(match.group("paper_id"))
+        title = paper["title"] if paper else "Unknown paper"
+        request._send(200, f"<html><body><h1>{title}</h1></body></html>".encode("utf-8"), "text/html", method)
+
+    # Semantic Scholar paper pages, for the Playwright tier
+
+    def _paper_page(self, request: _Handler, method, match, query, body) -> None:
+        paper = self.corpus.paper(match.group("paper_id"))
+        if paper is None:
+            request._send(404, b"<html><body>Paper not found</body></html>", "text/html", method)
+            return
+        links = ""
+        if paper["_page_pdf"]:
+            mirror = f"{self.url}/mirror/{paper['paperId']}.pdf"
+            links = (
+                f'<a class="alternate-sources__dropdown-button" data-heap-direct-pdf-link="true" href="{mirror}">'
+                f"View PDF</a>"
+            )
+        arxiv_id = paper["externalIds"].get("ArXiv")
+        if arxiv_id:
+            links += f' <a href="https://arxiv.org/abs/{arxiv_id}">arXiv</a>'
+        html = (
+            f"<!DOCTYPE html><html><head><title>{paper['title']}</title></head><body>"
+            f'<main><h1 data-test-id="paper-detail-title">{paper["title"]}</h1>'
+            f'<div class="flex-paper-actions__group">{links}</div></main></body></html>'
+        )
+        request._send(200, html.encode("utf-8"), "text/html; charset=utf-8", method)
+
+    def _mirror_pdf(self, request: _Handler, method, match, query, body) -> None:
+        if self.corpus.paper(match.group("paper_id")) is None:
+            request._send(404, b"Not found", "text/plain", method)
+            return
+        request._send(200, PDF_BODY, "application/pdf", method)
+
+
+def _parse_author(value: str) -> Tuple[str, int]:
+    author_id, _, count = value.partition(":")
+    if not author_id.isdigit() or not count.isdigit():
+        raise argparse.ArgumentTypeError("expected AUTHOR_ID:PAPER_COUNT, e.g. 9000200:200")
+    return author_id, int(count)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve fake Semantic Scholar, Unpaywall, doi.org and PDF hosts")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on (0 picks a free one)")
+    parser.add_argument(
+        "--author", type=_parse_author, action="append", default=[], metavar="ID:PAPERS",
+        help="Synthetic author and paper count; may be repeated (default: 9000050:50, 9000200:200, 9001000:1000)",
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency per request in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency per request in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with a 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with a 429")
+    parser.add_argument("--faults", type=str, default=None, help="JSON fault script (see FaultProfile.from_dict)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic corpus and fault injection")
+    args = parser.parse_args()
+
+    authors = dict(args.author) or {"9000050": 50, "9000200": 200, "9001000": 1000}
+    if args.faults:
+        with open(args.faults, encoding="utf-8") as handle:
+            faults = FaultProfile.from_dict(json.load(handle), seed=args.seed)
+    else:
+        faults = FaultProfile(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            seed=args.seed,
+        )
+
+    upstream = FakeUpstream(Corpus(authors, seed=args.seed), faults).start(args.host, args.port)
+    print(f"🧪 Fake upstream listening on {upstream.url}")
+    print(f"   Authors: {', '.join(f'{author_id} ({count} papers)' for author_id, count in authors.items())}")
+    print("   Point the scraper at it with:")
+    for name, value in upstream.env().items():
+        print(f"   export {name}={value}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        upstream.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,430 @@
+"""
+Shared Playwright browser pool for paper-page scraping.
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set
+
+# Optional Playwright import for advanced scraping
+try:
+    from playwright.async_api import async_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+    async_playwright = None
+
+LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+]
+
+CONTEXT_OPTIONS = {
+    "viewport": {'width': 1920, 'height': 1080},
+    "user_agent": 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+}
+
+# Remove webdriver detection
+STEALTH_INIT_SCRIPT = """
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+"""
+
+
+READINESS_CACHE_PATH = Path(__file__).parent / ".cache" / "playwright_ready.json"
+
+
+def _playwright_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("playwright")
+    except Exception:
+        return ""
+
+
+async def probe_chromium(launch: bool = False) -> str:
+    """Return Chromium's executable path, launching it once if ``launch`` is set.
+
+    Returns an empty string if the driver can't start or the launch fails.
+    """
+    playwright = None
+    try:
+        playwright = await async_playwright().start()
+        executable = playwright.chromium.executable_path or ""
+        if launch:
+            browser = await playwright.chromium.launch(headless=True, args=LAUNCH_ARGS, timeout=30000)
+            await browser.close()
+        return executable
+    except Exception as exc:
+        print(f"[Playwright] ⚠️  Chromium check failed: {exc}")
+        return ""
+    finally:
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception:
+                pass
+
+
+async def _install_chromium(timeout: float) -> bool:
+    """Run ``playwright install chromium`` without blocking the event loop."""
+    print("[Playwright] Installing Chromium...")
+    try:
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "playwright", "install", "chromium",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+    except OSError as exc:
+        print(f"[Playwright] ⚠️  Could not start installer: {exc}")
+        return False
+    try:
+        output, _ = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        print(f"[Playwright] ⚠️  Chromium install timed out after {timeout:.0f}s")
+        return False
+    if process.returncode != 0:
+        print(f"[Playwright] ⚠️  Chromium install failed (exit code: {process.returncode})")
+        if output:
+            print(f"[Playwright] Output: {output.decode(errors='replace')[-500:]}")
+        return False
+    print("[Playwright] ✅ Chromium installed")
+    return True
+
+
+def _read_readiness(cache_path: Path) -> Optional[Dict[str, str]]:
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return {key: data.get(key) for key in ("playwright_version", "executable_path")}
+
+
+def _write_readiness(cache_path: Path, key: Dict[str, str]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(dict(key, checked_at=time.time())), encoding="utf-8")
+        tmp_path.replace(cache_path)
+    except OSError as exc:
+        print(f"[Playwright] ⚠️  Could not write readiness cache: {exc}")
+
+
+async def check_playwright_ready(
+    cache_path: Optional[Path] = None,
+    install: bool = True,
+    install_timeout: float = 300.0,
+) -> bool:
+    """Make sure Chromium is installed and launches, installing it if missing.
+
+    A successful check is remembered in ``cache_path`` keyed by the Playwright
+    version and the Chromium executable path, so later starts on the same
+    image skip the test launch.
+    """
+    if not PLAYWRIGHT_AVAILABLE:
+        return False
+    cache_path = Path(cache_path) if cache_path else READINESS_CACHE_PATH
+    executable = await probe_chromium(launch=False)
+    key = {"playwright_version": _playwright_version(), "executable_path": executable}
+    installed = bool(executable) and Path(executable).exists()
+    if installed and _read_readiness(cache_path) == key:
+        print(f"[Playwright] ✅ Chromium ready at {executable} (cached)")
+        return True
+
+    if not installed:
+        if not install or not await _install_chromium(install_timeout):
+            return False
+
+    executable = await probe_chromium(launch=True)
+    if not executable or not Path(executable).exists():
+        return False
+    key["executable_path"] = executable
+    _write_readiness(cache_path, key)
+    print(f"[Playwright] ✅ Chromium ready at {executable}")
+    return True
+
+
+def _child_pids(pid: int) -> List[int]:
+    """Return the direct children of ``pid`` (Linux only, empty elsewhere)."""
+    children: List[int] = []
+    try:
+        for task in Path(f"/proc/{pid}/task").iterdir():
+            children.extend(int(child) for child in (task / "children").read_text().split())
+    except (OSError, ValueError):
+        pass
+    return children
+
+
+def _descendant_pids(pid: Optional[int] = None) -> Set[int]:
+    """Return every descendant of ``pid`` (this process by default), excluding ``pid`` itself."""
+    found: Set[int] = set()
+    pending = _child_pids(pid or os.getpid())
+    while pending:
+        current = pending.pop()
+        if current not in found:
+            found.add(current)
+            pending.extend(_child_pids(current))
+    return found
+
+
+def _parent_pid(pid: int) -> Optional[int]:
+    try:
+        # The command name in field 2 may contain spaces, so split after its closing paren
+        return int(Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _rss_bytes(pid: int) -> int:
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+def _process_tree_rss_bytes(pids: Iterable[int]) -> int:
+    """Sum the resident memory of ``pids`` and all of their descendants (Linux only, 0 elsewhere)."""
+    tree: Set[int] = set()
+    for pid in pids:
+        tree.add(pid)
+        tree |= _descendant_pids(pid)
+    return sum(_rss_bytes(pid) for pid in tree)
+
+
+class _PooledBrowser:
+    """Book-keeping for one launched Chromium instance."""
+
+    def __init__(self, browser, root_pids: Iterable[int] = ()):
+        self.browser = browser
+        # Chromium's top-level process(es), whose trees make up this browser's memory
+        self.root_pids = set(root_pids)
+        self.pages_served = 0
+        self.active_pages = 0
+        self.retired = False
+
+
+class BrowserPool:
+    """Hands out isolated pages backed by a few long-lived Chromium instances.
+
+    Browsers are launched lazily, up to ``size`` at a time. Each call to
+    :meth:`page` gets a fresh browser context, so cookies and storage never
+    leak between papers or jobs. A browser is retired once it has served
+    ``max_pages_per_browser`` pages, or once its own processes exceed
+    ``max_rss_mb`` of resident memory, and is closed when its last page is
+    released.
+
+    ``available`` tells scrapers whether to use the browser tier at all; the
+    server clears it until its background readiness check has passed.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_pages_per_browser: int = 50,
+        max_rss_mb: Optional[int] = None,
+        max_concurrent_pages: int = 4,
+        launch_timeout: float = 12.0,
+        warm_start: bool = False,
+        health_check_interval: float = 60.0,
+    ):
+        self.size = max(1, size)
+        self.max_pages_per_browser = max(1, max_pages_per_browser)
+        self.max_rss_mb = max_rss_mb
+        self.launch_timeout = launch_timeout
+        self.warm_start = warm_start
+        self.health_check_interval = health_check_interval
+        self.available = PLAYWRIGHT_AVAILABLE
+        self._playwright = None
+        self._browsers: List[_PooledBrowser] = []
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max(1, max_concurrent_pages))
+        self.stats: Dict[str, int] = {"launches": 0, "recycled": 0, "pages": 0, "health_failures": 0}
+
+    @classmethod
+    def from_env(cls) -> "BrowserPool":
+        """Build a pool sized from ``BROWSER_POOL_*`` environment variables."""
+        max_rss = os.getenv("BROWSER_POOL_MAX_RSS_MB")
+        return cls(
+            size=int(os.getenv("BROWSER_POOL_SIZE", "1")),
+            max_pages_per_browser=int(os.getenv("BROWSER_POOL_MAX_PAGES", "50")),
+            max_rss_mb=int(max_rss) if max_rss else None,
+            max_concurrent_pages=int(os.getenv("BROWSER_POOL_MAX_CONCURRENT_PAGES", "4")),
+            warm_start=os.getenv("BROWSER_WARM_START", "").lower() in ("1", "true", "yes"),
+            health_check_interval=float(os.getenv("BROWSER_HEALTH_CHECK_INTERVAL", "60")),
+        )
+
+    async def ensure_ready(self, **kwargs) -> bool:
+        """Disable the pool while ``check_playwright_ready`` runs, then enable it if it passed."""
+        self.available = False
+        try:
+            self.available = await check_playwright_ready(**kwargs)
+        except Exception as exc:
+            print(f"[Playwright] ⚠️  Readiness check failed: {exc}")
+        if not self.available:
+            print("[Playwright] ⚠️  Browser tier disabled; papers fall back to API and open-access sources")
+        return self.available
+
+    async def warm(self) -> bool:
+        """Launch a browser now if none is running, so the first page doesn't wait for it."""
+        if not self.available:
+            return False
+        async with self._lock:
+            if any(not entry.retired and entry.browser.is_connected() for entry in self._browsers):
+                return True
+            try:
+                await self._launch()
+                return True
+            except Exception as exc:
+                print(f"[Browser Pool] ⚠️  Warm start failed: {exc}")
+                return False
+
+    async def health_check(self) -> int:
+        """Retire idle browsers that are disconnected or stop responding; return how many.
+
+        Browsers are probed without holding the pool lock, so pages can still
+        be checked out while a hung browser runs into its timeout.
+        """
+        async with self._lock:
+            idle = [entry for entry in self._browsers if not entry.retired and entry.active_pages == 0]
+        healthy = await asyncio.gather(*(self._probe(entry) for entry in idle))
+        unhealthy = [entry for entry, ok in zip(idle, healthy) if not ok]
+
+        to_close = []
+        async with self._lock:
+            for entry in unhealthy:
+                if entry not in self._browsers:
+                    continue
+                entry.retired = True
+                self.stats["health_failures"] += 1
+                # A page checked out during the probe closes the browser on checkin
+                if entry.active_pages <= 0:
+                    self._browsers.remove(entry)
+                    to_close.append(entry)
+        for entry in to_close:
+            await self._close_entry(entry)
+        return len(unhealthy)
+
+    @staticmethod
+    async def _probe(entry: _PooledBrowser) -> bool:
+        try:
+            # A context round-trip proves the browser process still answers
+            context = await asyncio.wait_for(entry.browser.new_context(), timeout=5)
+            await context.close()
+            return True
+        except Exception:
+            return False
+
+    async def keep_warm(self) -> None:
+        """Keep one healthy browser running, checking every ``health_check_interval`` seconds."""
+        while True:
+            if await self.health_check():
+                print("[Browser Pool] ⚠️  Replaced an unresponsive browser")
+            await self.warm()
+            await asyncio.sleep(self.health_check_interval)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator:
+        """Yield a page in a new, isolated browser context."""
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright is not installed")
+        async with self._slots:
+            entry = await self._checkout()
+            context = None
+            try:
+                context = await entry.browser.new_context(**CONTEXT_OPTIONS)
+                page = await context.new_page()
+                await page.add_init_script(STEALTH_INIT_SCRIPT)
+                yield page
+            finally:
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception:
+                        pass
+                await self._checkin(entry)
+
+    async def close(self) -> None:
+        """Close every browser and stop the Playwright driver."""
+        async with self._lock:
+            browsers, self._browsers = self._browsers, []
+            for entry in browsers:
+                await self._close_entry(entry)
+            if self._playwright is not None:
+                try:
+                    await self._playwright.stop()
+                except Exception:
+                    pass
+                self._playwright = None
+
+    async def _checkout(self) -> _PooledBrowser:
+        async with self._lock:
+            live = [
+                entry for entry in self._browsers
+                if not entry.retired and entry.browser.is_connected()
+            ]
+            all_busy = all(entry.active_pages > 0 for entry in live)
+            if not live or (all_busy and len(live) < self.size):
+                entry = await self._launch()
+            else:
+                entry = min(live, key=lambda candidate: candidate.active_pages)
+            entry.active_pages += 1
+            entry.pages_served += 1
+            self.stats["pages"] += 1
+            return entry
+
+    async def _checkin(self, entry: _PooledBrowser) -> None:
+        async with self._lock:
+            entry.active_pages -= 1
+            if not entry.retired and self._should_recycle(entry):
+                entry.retired = True
+                self.stats["recycled"] += 1
+            if (entry.retired or not entry.browser.is_connected()) and entry.active_pages <= 0:
+                if entry in self._browsers:
+                    self._browsers.remove(entry)
+                await self._close_entry(entry)
+
+    def _should_recycle(self, entry: _PooledBrowser) -> bool:
+        if entry.pages_served >= self.max_pages_per_browser:
+            return True
+        if self.max_rss_mb and entry.root_pids:
+            return _process_tree_rss_bytes(entry.root_pids) > self.max_rss_mb * 1024 * 1024
+        return False
+
+    async def _launch(self) -> _PooledBrowser:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        # Launches are serialised by the pool lock, so the processes that appear
+        # during this one belong to this browser
+        before = _descendant_pids()
+        browser = await asyncio.wait_for(
+            self._playwright.chromium.launch(
+                headless=True,
+                args=LAUNCH_ARGS,
+                timeout=self.launch_timeout * 1000,
+            ),
+            timeout=self.launch_timeout + 2,
+        )
+        self.stats["launches"] += 1
+        print(f"[Browser Pool] 🚀 Launched Chromium ({len(self._browsers) + 1}/{self.size})")
+        spawned = _descendant_pids() - before
+        entry = _PooledBrowser(browser, (pid for pid in spawned if _parent_pid(pid) not in spawned))
+        self._browsers.append(entry)
+        return entry
+
+    @staticmethod
+    async def _close_entry(entry: _PooledBrowser) -> None:
+        try:
+            await entry.browser.close()
+        except Exception as close_exc:
+            print(f"[Browser Pool] ⚠️  Error closing browser: {close_exc}")
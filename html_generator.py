@@ -1,46 +1,27 @@
 """
 HTML Generator for creating interactive checklist table
 """
-from typing import List, Dict
+import hashlib
+import json
+from typing import AsyncIterable, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 
-
-class HTMLGenerator:
-    """Generates interactive HTML checklist table for papers"""
-    
-    @staticmethod
-    def generate_html(papers: List[Dict], author_id: str) -> str:
-        """
-        Generate HTML file with interactive checklist table
-        
-        Args:
-            papers: List of paper dictionaries
-            author_id: Semantic Scholar author identifier
-            
-        Returns:
-            HTML string
-        """
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Semantic Scholar Papers - {author_id}</title>
-    <style>
-        * {{
+# Shared stylesheet and script for every checklist. They are inlined by default
+# (single-file output for the CLI) or served once as content-hashed assets.
+CHECKLIST_CSS = """        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             background: linear-gradient(135deg, #1e3a8a 0%, #0ea5e9 50%, #06b6d4 100%);
             background-attachment: fixed;
             padding: 30px 20px;
             min-height: 100vh;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1600px;
             margin: 0 auto;
             background: #ffffff;
@@ -48,29 +29,29 @@ class HTMLGenerator:
             box-shadow: 0 25px 80px rgba(30, 58, 138, 0.4), 0 0 0 1px rgba(14, 165, 233, 0.1);
             overflow: hidden;
             animation: fadeInUp 0.6s ease-out;
-        }}
+        }
         
-        @keyframes fadeInUp {{
-            from {{
+        @keyframes fadeInUp {
+            from {
                 opacity: 0;
                 transform: translateY(20px);
-            }}
-            to {{
+            }
+            to {
                 opacity: 1;
                 transform: translateY(0);
-            }}
-        }}
+            }
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #1e3a8a 0%, #0ea5e9 100%);
             color: #ffffff;
             padding: 50px 40px;
             text-align: center;
             position: relative;
             overflow: hidden;
-        }}
+        }
         
-        .header::before {{
+        .header::before {
             content: '';
             position: absolute;
             top: 0;
@@ -79,9 +60,9 @@ class HTMLGenerator:
             bottom: 0;
             background: linear-gradient(135deg, rgba(6, 182, 212, 0.15) 0%, rgba(14, 165, 233, 0.1) 100%);
             pointer-events: none;
-        }}
+        }
         
-        .header::after {{
+        .header::after {
             content: '';
             position: absolute;
             bottom: 0;
@@ -89,9 +70,9 @@ class HTMLGenerator:
             right: 0;
             height: 3px;
             background: linear-gradient(90deg, transparent, #06b6d4, transparent);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 12px;
             font-weight: 700;
@@ -100,18 +81,18 @@ class HTMLGenerator:
             text-shadow: 0 2px 10px rgba(6, 182, 212, 0.4);
             position: relative;
             z-index: 1;
-        }}
+        }
         
-        .header p {{
+        .header p {
             font-size: 1.15em;
             color: #06b6d4;
             font-weight: 500;
             letter-spacing: 0.5px;
             position: relative;
             z-index: 1;
-        }}
+        }
         
-        .controls {{
+        .controls {
             padding: 25px 40px;
             background: linear-gradient(to bottom, #f8f8f8, #ffffff);
             border-bottom: 2px solid #e8e8e8;
@@ -120,29 +101,29 @@ class HTMLGenerator:
             align-items: center;
             flex-wrap: wrap;
             gap: 15px;
-        }}
+        }
         
-        .stats {{
+        .stats {
             font-size: 1em;
             color: #2d2d2d;
             font-weight: 600;
-        }}
+        }
         
-        .stats strong {{
+        .stats strong {
             color: #1a1a1a;
-        }}
+        }
         
-        .stats span#checked-count {{
+        .stats span#checked-count {
             color: #0ea5e9;
             font-weight: 700;
-        }}
+        }
         
-        .button-group {{
+        .button-group {
             display: flex;
             gap: 12px;
-        }}
+        }
         
-        button {{
+        button {
             padding: 12px 24px;
             border: none;
             border-radius: 8px;
@@ -154,9 +135,9 @@ class HTMLGenerator:
             box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
             position: relative;
             overflow: hidden;
-        }}
+        }
         
-        button::before {{
+        button::before {
             content: '';
             position: absolute;
             top: 50%;
@@ -167,82 +148,82 @@ class HTMLGenerator:
             background: rgba(255, 255, 255, 0.2);
             transform: translate(-50%, -50%);
             transition: width 0.6s, height 0.6s;
-        }}
+        }
         
-        button:hover::before {{
+        button:hover::before {
             width: 300px;
             height: 300px;
-        }}
+        }
         
-        button:active {{
+        button:active {
             transform: scale(0.98);
-        }}
+        }
         
-        .btn-select-all {{
+        .btn-select-all {
             background: linear-gradient(135deg, #0ea5e9 0%, #06b6d4 100%);
             color: #ffffff;
-        }}
+        }
         
-        .btn-select-all:hover {{
+        .btn-select-all:hover {
             background: linear-gradient(135deg, #06b6d4 0%, #0ea5e9 100%);
             box-shadow: 0 4px 16px rgba(14, 165, 233, 0.4);
             transform: translateY(-2px);
-        }}
+        }
         
-        .btn-deselect-all {{
+        .btn-deselect-all {
             background: linear-gradient(135deg, #475569 0%, #334155 100%);
             color: #ffffff;
-        }}
+        }
         
-        .btn-deselect-all:hover {{
+        .btn-deselect-all:hover {
             background: linear-gradient(135deg, #334155 0%, #1e293b 100%);
             box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
             transform: translateY(-2px);
-        }}
+        }
         
-        .btn-export {{
+        .btn-export {
             background: linear-gradient(135deg, #10b981 0%, #059669 100%);
             color: #ffffff;
-        }}
+        }
         
-        .btn-export:hover {{
+        .btn-export:hover {
             background: linear-gradient(135deg, #059669 0%, #047857 100%);
             box-shadow: 0 4px 16px rgba(16, 185, 129, 0.4);
             transform: translateY(-2px);
-        }}
+        }
         
-        .btn-clear-history {{
+        .btn-clear-history {
             background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%);
             color: #ffffff;
-        }}
+        }
         
-        .btn-clear-history:hover {{
+        .btn-clear-history:hover {
             background: linear-gradient(135deg, #dc2626 0%, #b91c1c 100%);
             box-shadow: 0 4px 16px rgba(239, 68, 68, 0.4);
             transform: translateY(-2px);
-        }}
+        }
         
-        .table-wrapper {{
+        .table-wrapper {
             overflow-x: auto;
             padding: 30px 40px;
             background: #ffffff;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: separate;
             border-spacing: 0;
             font-size: 0.95em;
-        }}
+        }
         
-        thead {{
+        thead {
             background: linear-gradient(to bottom, #1e3a8a, #0ea5e9);
             position: sticky;
             top: 0;
             z-index: 10;
-        }}
+        }
         
-        th {{
+        th {
             padding: 18px 15px;
             text-align: left;
             font-weight: 700;
@@ -252,24 +233,24 @@ class HTMLGenerator:
             font-size: 0.9em;
             letter-spacing: 0.5px;
             text-transform: uppercase;
-        }}
+        }
         
-        th:first-child {{
+        th:first-child {
             width: 50px;
             text-align: center;
             border-top-left-radius: 8px;
-        }}
+        }
         
-        th:last-child {{
+        th:last-child {
             border-top-right-radius: 8px;
-        }}
+        }
         
-        th:nth-child(2) {{
+        th:nth-child(2) {
             width: 70px;
             text-align: center;
-        }}
+        }
         
-        th:nth-child(9) {{
+        th:nth-child(9) {
             width: 150px;
             min-width: 150px;
             max-width: 150px;
@@ -278,77 +259,89 @@ class HTMLGenerator:
             word-break: break-word;
             line-height: 1.2;
             padding: 12px 8px;
-        }}
+        }
         
-        td:nth-child(9) {{
+        td:nth-child(9) {
             text-align: center;
             padding: 8px;
             width: 150px;
             min-width: 150px;
             max-width: 150px;
             overflow: hidden;
-        }}
+        }
         
-        th:nth-child(10) {{
+        th:nth-child(10) {
             width: 120px;
             text-align: center;
             white-space: normal;
-        }}
+        }
         
-        td:nth-child(10) {{
+        td:nth-child(10) {
             text-align: center;
             padding: 8px;
-        }}
+        }
         
-        tbody tr {{
+        tbody tr {
             border-bottom: 1px solid #e8e8e8;
             transition: all 0.2s ease;
             background: #ffffff;
-        }}
+        }
         
-        tbody tr:nth-child(even) {{
+        tbody tr.even {
             background: #fafafa;
-        }}
+        }
         
-        tbody tr:hover {{
+        tbody tr.spacer,
+        tbody tr.spacer:hover {
+            background: transparent !important;
+            border: 0;
+            box-shadow: none;
+            transform: none;
+        }
+        
+        tbody tr.spacer td {
+            padding: 0;
+        }
+        
+        tbody tr:hover {
             background: linear-gradient(to right, #f0f9ff, #ffffff) !important;
             box-shadow: 0 2px 8px rgba(14, 165, 233, 0.15);
             transform: scale(1.001);
-        }}
+        }
         
-        tbody tr.checked {{
+        tbody tr.checked {
             background: linear-gradient(to right, #e0f2fe, #f0f9ff) !important;
             border-left: 4px solid #0ea5e9;
-        }}
+        }
         
-        tbody tr.checked:hover {{
+        tbody tr.checked:hover {
             background: linear-gradient(to right, #e0f2fe, #f0f9ff) !important;
-        }}
+        }
         
-        td {{
+        td {
             padding: 18px 15px;
             vertical-align: top;
-        }}
+        }
         
         td:first-child,
-        td:nth-child(2) {{
+        td:nth-child(2) {
             text-align: center;
-        }}
+        }
         
-        input[type="checkbox"] {{
+        input[type="checkbox"] {
             width: 22px;
             height: 22px;
             cursor: pointer;
             accent-color: #0ea5e9;
             border-radius: 4px;
             border: 2px solid #0ea5e9;
-        }}
+        }
         
-        input[type="checkbox"]:checked {{
+        input[type="checkbox"]:checked {
             background-color: #0ea5e9;
-        }}
+        }
         
-        .sr-no {{
+        .sr-no {
             font-weight: 700;
             color: #0ea5e9;
             font-size: 1.05em;
@@ -356,37 +349,37 @@ class HTMLGenerator:
             padding: 4px 10px;
             border-radius: 6px;
             display: inline-block;
-        }}
+        }
         
-        .title {{
+        .title {
             font-weight: 600;
             color: #1a1a1a;
             line-height: 1.5;
             font-size: 1.02em;
-        }}
+        }
         
-        .authors {{
+        .authors {
             color: #4a4a4a;
             line-height: 1.6;
             font-size: 0.95em;
-        }}
+        }
         
-        .year {{
+        .year {
             color: #2d2d2d;
             font-weight: 600;
             background: #f5f5f5;
             padding: 4px 10px;
             border-radius: 6px;
             display: inline-block;
-        }}
+        }
         
-        .publication {{
+        .publication {
             color: #555555;
             font-style: italic;
             font-size: 0.93em;
-        }}
+        }
         
-        .citations {{
+        .citations {
             color: #1e3a8a;
             font-weight: 600;
             background: linear-gradient(135deg, #e0f2fe, #f0f9ff);
@@ -394,9 +387,9 @@ class HTMLGenerator:
             border-radius: 6px;
             display: inline-block;
             font-size: 0.95em;
-        }}
+        }
         
-        .doi {{
+        .doi {
             color: #2563eb;
             font-family: 'Courier New', monospace;
             font-size: 0.85em;
@@ -407,14 +400,14 @@ class HTMLGenerator:
             padding: 4px 8px;
             border-radius: 4px;
             border: 1px solid #e8e8e8;
-        }}
+        }
         
-        .doi:hover {{
+        .doi:hover {
             color: #1d4ed8;
             text-decoration: underline;
-        }}
+        }
         
-        .download-link {{
+        .download-link {
             color: #10b981;
             text-decoration: none;
             font-weight: 600;
@@ -425,255 +418,339 @@ class HTMLGenerator:
             display: inline-block;
             transition: all 0.2s ease;
             white-space: nowrap;
-        }}
+        }
         
-        .download-link:hover {{
+        .download-link:hover {
             background: linear-gradient(135deg, #d1fae5, #a7f3d0);
             transform: translateY(-1px);
             box-shadow: 0 2px 8px rgba(16, 185, 129, 0.2);
-        }}
+        }
         
-        .download-link.accessed {{
+        .download-link.accessed {
             color: #2563eb;
             background: linear-gradient(135deg, #dbeafe, #bfdbfe);
             border: 1px solid #3b82f6;
             white-space: nowrap;
-        }}
+        }
         
-        .download-link.accessed:hover {{
+        .download-link.accessed:hover {
             background: linear-gradient(135deg, #bfdbfe, #93c5fd);
             box-shadow: 0 2px 8px rgba(59, 130, 246, 0.3);
-        }}
+        }
         
-        .no-link {{
+        .no-link {
             color: #999999;
             font-style: italic;
             font-size: 0.9em;
-        }}
+        }
         
         
-        .footer {{
+        .footer {
             padding: 25px 40px;
             text-align: center;
             color: #666666;
             font-size: 0.9em;
             background: linear-gradient(to bottom, #f8f8f8, #f0f0f0);
             border-top: 2px solid #e8e8e8;
-        }}
+        }
         
-        .footer::before {{
+        .footer::before {
             content: '';
             display: block;
             width: 60px;
             height: 2px;
             background: linear-gradient(90deg, transparent, #06b6d4, transparent);
             margin: 0 auto 15px;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            body {{
+        @media (max-width: 768px) {
+            body {
                 padding: 15px 10px;
-            }}
+            }
             
-            .container {{
+            .container {
                 border-radius: 12px;
-            }}
+            }
             
-            .header {{
+            .header {
                 padding: 35px 25px;
-            }}
+            }
             
-            .header h1 {{
+            .header h1 {
                 font-size: 1.8em;
-            }}
+            }
             
-            .controls {{
+            .controls {
                 flex-direction: column;
                 align-items: stretch;
                 padding: 20px 25px;
-            }}
+            }
             
-            .stats {{
+            .stats {
                 text-align: center;
                 margin-bottom: 5px;
-            }}
+            }
             
-            .button-group {{
+            .button-group {
                 width: 100%;
                 flex-direction: column;
-            }}
+            }
             
-            button {{
+            button {
                 width: 100%;
-            }}
+            }
             
-            .table-wrapper {{
+            .table-wrapper {
                 padding: 15px 10px;
-            }}
+            }
             
-            table {{
+            table {
                 font-size: 0.85em;
-            }}
+            }
             
-            th {{
+            th {
                 padding: 12px 8px;
                 font-size: 0.8em;
-            }}
+            }
             
-            td {{
+            td {
                 padding: 12px 8px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>📚 Research Papers Checklist</h1>
-            <p>Semantic Scholar Profile: {author_id}</p>
-        </div>
-        
-        <div class="controls">
-            <div class="stats">
-                <strong>Total Papers:</strong> {len(papers)} | 
-                <strong>Checked:</strong> <span id="checked-count">0</span>
-            </div>
-            <div class="button-group">
-                <button class="btn-select-all" onclick="selectAll()">✓ Select All for Export</button>
-                <button class="btn-deselect-all" onclick="deselectAll()">✗ Deselect All</button>
-                <button class="btn-export" onclick="exportChecked()">📥 Export Checked</button>
-                <button class="btn-clear-history" onclick="clearDownloadHistory()">🗑️ Clear Download History</button>
-            </div>
-        </div>
-        
-        <div class="table-wrapper">
-            <table>
-                <thead>
-                    <tr>
-                        <th title="Select papers to include in CSV export">✓ Select</th>
-                        <th>Sr. No</th>
-                        <th>Title</th>
-                        <th>Authors</th>
-                        <th>Year</th>
-                        <th>Publication</th>
-                        <th>Citations</th>
-                        <th>DOI</th>
-                        <th>Download Link</th>
-                        <th>Download Status</th>
-                    </tr>
-                </thead>
-                <tbody>
-{HTMLGenerator._generate_table_rows(papers)}
-                </tbody>
-            </table>
-        </div>
-        
-        <div class="footer">
-            Generated by Semantic Scholar Scraper | {HTMLGenerator._get_current_date()}
-        </div>
-    </div>
-    
-    <script>
-        // Error display function
-        function showError(message) {{
+            }
+        }
+"""
+
+CHECKLIST_JS = """        // Error display function
+        function showError(message) {
             // Create or update error banner
             let errorBanner = document.getElementById('error-banner');
-            if (!errorBanner) {{
+            if (!errorBanner) {
                 errorBanner = document.createElement('div');
                 errorBanner.id = 'error-banner';
                 errorBanner.style.cssText = 'position: fixed; top: 20px; right: 20px; background: #ef4444; color: white; padding: 15px 20px; border-radius: 8px; box-shadow: 0 4px 12px rgba(0,0,0,0.3); z-index: 10000; max-width: 400px;';
                 document.body.appendChild(errorBanner);
-            }}
+            }
             errorBanner.textContent = message;
             errorBanner.style.display = 'block';
             
             // Auto-hide after 5 seconds
-            setTimeout(() => {{
+            setTimeout(() => {
                 errorBanner.style.display = 'none';
-            }}, 5000);
-        }}
+            }, 5000);
+        }
+        
+        // Paper data lives in the #paper-data JSON island as
+        // [title, authors, year, publication, citations, doi, downloadLink] arrays.
+        // Only the rows around the viewport are in the DOM; spacer rows stand in for the rest.
+        const FIELD = { title: 0, authors: 1, year: 2, publication: 3, citations: 4, doi: 5, link: 6 };
+        const OVERSCAN_ROWS = 20;
+        let papers = [];
+        let selected = new Uint8Array(0);
+        let checkedCount = 0;
+        let downloadStatuses = {};
+        let accessedPapers = {};
+        let tableBody = null;
+        let rowHeight = 60;
+        let rowHeightMeasured = false;
+        let renderedStart = -1;
+        let renderedEnd = -1;
+        let renderScheduled = false;
+        
+        function escapeHtml(text) {
+            return String(text == null ? '' : text)
+                .replace(/&/g, '&amp;')
+                .replace(/</g, '&lt;')
+                .replace(/>/g, '&gt;')
+                .replace(/"/g, '&quot;')
+                .replace(/'/g, '&#39;');
+        }
+        
+        function spacerRow(height) {
+            if (height <= 0) {
+                return '';
+            }
+            return '<tr class="spacer" aria-hidden="true"><td colspan="10" style="height: ' + height + 'px"></td></tr>';
+        }
+        
+        function rowHtml(index) {
+            const paper = papers[index];
+            const paperId = index + 1;
+            const doi = paper[FIELD.doi];
+            const link = paper[FIELD.link];
+            const citations = paper[FIELD.citations];
+            
+            const classes = [];
+            if (paperId % 2 === 0) classes.push('even');
+            if (selected[index]) classes.push('checked');
+            
+            let doiHtml = '<span class="no-link">-</span>';
+            if (doi) {
+                const doiUrl = doi.startsWith('http') ? doi : 'https://doi.org/' + doi;
+                doiHtml = '<a href="' + escapeHtml(doiUrl) + '" target="_blank" class="doi">' + escapeHtml(doi) + '</a>';
+            }
+            
+            let linkHtml = '<span class="no-link">Not found</span>';
+            if (link) {
+                const accessed = accessedPapers[paperId];
+                linkHtml = '<a href="' + escapeHtml(link) + '" target="_blank" class="download-link' + (accessed ? ' accessed' : '') +
+                    '" data-paper-id="' + paperId + '">' + (accessed ? 'Accessed ✓' : 'Access PDF') + '</a>';
+            }
+            
+            const citationsHtml = citations === 'Missing citations'
+                ? '<span class="no-link">Missing citations</span>'
+                : '<span class="citations">' + escapeHtml(citations) + '</span>';
+            
+            return '<tr data-index="' + index + '" class="' + classes.join(' ') + '">' +
+                '<td><input type="checkbox" class="select-checkbox" id="paper-' + paperId + '"' + (selected[index] ? ' checked' : '') + '></td>' +
+                '<td><span class="sr-no">' + paperId + '</span></td>' +
+                '<td><span class="title">' + escapeHtml(paper[FIELD.title]) + '</span></td>' +
+                '<td><span class="authors">' + escapeHtml(paper[FIELD.authors]) + '</span></td>' +
+                '<td><span class="year">' + escapeHtml(paper[FIELD.year]) + '</span></td>' +
+                '<td><span class="publication">' + escapeHtml(paper[FIELD.publication]) + '</span></td>' +
+                '<td>' + citationsHtml + '</td>' +
+                '<td>' + doiHtml + '</td>' +
+                '<td>' + linkHtml + '</td>' +
+                '<td><input type="checkbox" class="download-status-checkbox" data-paper-id="' + paperId +
+                '" title="Check if you actually downloaded this paper"' + (downloadStatuses[paperId] ? ' checked' : '') + '></td>' +
+                '</tr>';
+        }
+        
+        // Render the rows around the viewport, replacing whatever was rendered before
+        function renderWindow(force) {
+            renderScheduled = false;
+            const total = papers.length;
+            const bodyTop = tableBody.getBoundingClientRect().top;
+            const start = Math.min(total, Math.max(0, Math.floor(-bodyTop / rowHeight) - OVERSCAN_ROWS));
+            const end = Math.min(total, Math.max(start, Math.ceil((window.innerHeight - bodyTop) / rowHeight) + OVERSCAN_ROWS));
+            if (!force && start === renderedStart && end === renderedEnd) {
+                return;
+            }
+            renderedStart = start;
+            renderedEnd = end;
+            
+            const rows = [];
+            for (let index = start; index < end; index++) {
+                rows.push(rowHtml(index));
+            }
+            tableBody.innerHTML = spacerRow(start * rowHeight) + rows.join('') + spacerRow((total - end) * rowHeight);
+            
+            // Size the spacers from the first real rows, then keep the estimate fixed so the scrollbar doesn't jump
+            if (!rowHeightMeasured && end > start) {
+                const rendered = tableBody.querySelectorAll('tr[data-index]');
+                const first = rendered[0].getBoundingClientRect();
+                const last = rendered[rendered.length - 1].getBoundingClientRect();
+                const measured = (last.bottom - first.top) / rendered.length;
+                rowHeightMeasured = true;
+                if (measured > 0) {
+                    rowHeight = measured;
+                    renderWindow(true);
+                }
+            }
+        }
+        
+        function scheduleRender() {
+            if (!renderScheduled) {
+                renderScheduled = true;
+                requestAnimationFrame(() => renderWindow(false));
+            }
+        }
         
         // Update checked count
-        function updateCheckedCount() {{
-            const checkboxes = document.querySelectorAll('tbody td:first-child input[type="checkbox"]');
-            const checked = Array.from(checkboxes).filter(cb => cb.checked).length;
-            document.getElementById('checked-count').textContent = checked;
-            
-            // Add/remove checked class from rows
-            checkboxes.forEach(checkbox => {{
-                const row = checkbox.closest('tr');
-                if (checkbox.checked) {{
-                    row.classList.add('checked');
-                }} else {{
-                    row.classList.remove('checked');
-                }}
-            }});
-        }}
+        function updateCheckedCount() {
+            document.getElementById('checked-count').textContent = checkedCount;
+        }
+        
+        function setSelected(index, isChecked) {
+            const value = isChecked ? 1 : 0;
+            if (selected[index] !== value) {
+                selected[index] = value;
+                checkedCount += value ? 1 : -1;
+            }
+        }
         
         // Select all checkboxes
-        function selectAll() {{
-            const checkboxes = document.querySelectorAll('tbody td:first-child input[type="checkbox"]');
-            checkboxes.forEach(cb => cb.checked = true);
+        function selectAll() {
+            selected.fill(1);
+            checkedCount = papers.length;
             updateCheckedCount();
-        }}
+            renderWindow(true);
+            schedulePersist(storageKeys.selected);
+        }
         
         // Deselect all checkboxes
-        function deselectAll() {{
-            const checkboxes = document.querySelectorAll('tbody td:first-child input[type="checkbox"]');
-            checkboxes.forEach(cb => cb.checked = false);
+        function deselectAll() {
+            selected.fill(0);
+            checkedCount = 0;
             updateCheckedCount();
-        }}
+            renderWindow(true);
+            schedulePersist(storageKeys.selected);
+        }
+        
+        // One listener on the table body handles every checkbox, rendered now or later
+        function handleTableChange(event) {
+            const checkbox = event.target;
+            const row = checkbox.closest('tr[data-index]');
+            if (!row || checkbox.type !== 'checkbox') {
+                return;
+            }
+            const index = Number(row.getAttribute('data-index'));
+            if (checkbox.classList.contains('download-status-checkbox')) {
+                downloadStatuses[index + 1] = checkbox.checked;
+                schedulePersist(storageKeys.downloaded);
+                return;
+            }
+            setSelected(index, checkbox.checked);
+            row.classList.toggle('checked', checkbox.checked);
+            updateCheckedCount();
+            schedulePersist(storageKeys.selected);
+        }
         
         // Export checked papers to CSV
-        function exportChecked() {{
-            try {{
-                const selectionCheckboxes = document.querySelectorAll('tbody td:first-child input[type="checkbox"]');
+        function exportChecked() {
+            try {
                 const checkedPapers = [];
                 
-                selectionCheckboxes.forEach((checkbox) => {{
-                    if (checkbox.checked) {{
-                        const row = checkbox.closest('tr');
-                        const cells = row.querySelectorAll('td');
-                        const downloadStatusCheckbox = row.querySelector('.download-status-checkbox');
-                        
-                        checkedPapers.push({{
-                            srNo: cells[1].textContent.trim(),
-                            title: cells[2].textContent.trim(),
-                            authors: cells[3].textContent.trim(),
-                            year: cells[4].textContent.trim(),
-                            publication: cells[5].textContent.trim(),
-                            citations: cells[6].textContent.trim(),
-                            doi: cells[7].querySelector('a') ? cells[7].querySelector('a').textContent.trim() : cells[7].textContent.trim(),
-                            downloadLink: cells[8].querySelector('a') ? cells[8].querySelector('a').href : '',
-                            downloadStatus: downloadStatusCheckbox ? downloadStatusCheckbox.checked : false
-                        }});
-                    }}
-                }});
+                for (let index = 0; index < papers.length; index++) {
+                    if (!selected[index]) {
+                        continue;
+                    }
+                    const paper = papers[index];
+                    checkedPapers.push({
+                        srNo: String(index + 1),
+                        title: paper[FIELD.title],
+                        authors: paper[FIELD.authors],
+                        year: paper[FIELD.year],
+                        publication: paper[FIELD.publication],
+                        citations: paper[FIELD.citations],
+                        doi: paper[FIELD.doi],
+                        downloadLink: paper[FIELD.link],
+                        downloadStatus: !!downloadStatuses[index + 1]
+                    });
+                }
                 
-                if (checkedPapers.length === 0) {{
+                if (checkedPapers.length === 0) {
                     alert('No papers selected. Please select at least one paper.');
                     return;
-                }}
+                }
                 
                 // Convert to CSV
                 const headers = ['Sr. No', 'Title', 'Authors', 'Year', 'Publication', 'Citations', 'DOI', 'Download Link', 'Download Status'];
                 const csvRows = [
                     headers.join(','),
                     ...checkedPapers.map(p => [
-                        `"${{p.srNo}}"`,
-                        `"${{p.title.replace(/"/g, '""')}}"`,
-                        `"${{p.authors.replace(/"/g, '""')}}"`,
-                        `"${{p.year}}"`,
-                        `"${{p.publication.replace(/"/g, '""')}}"`,
-                        `"${{p.citations}}"`,
-                        `"${{p.doi}}"`,
-                        `"${{p.downloadLink}}"`,
-                        `"${{p.downloadStatus ? 'Yes' : 'No'}}"`
+                        `"${p.srNo}"`,
+                        `"${p.title.replace(/"/g, '""')}"`,
+                        `"${p.authors.replace(/"/g, '""')}"`,
+                        `"${p.year}"`,
+                        `"${p.publication.replace(/"/g, '""')}"`,
+                        `"${p.citations}"`,
+                        `"${p.doi}"`,
+                        `"${p.downloadLink}"`,
+                        `"${p.downloadStatus ? 'Yes' : 'No'}"`
                     ].join(','))
                 ];
                 
                 const csvContent = csvRows.join('\\n');
-                const blob = new Blob([csvContent], {{ type: 'text/csv;charset=utf-8;' }});
+                const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
                 const link = document.createElement('a');
                 const url = URL.createObjectURL(blob);
                 link.setAttribute('href', url);
@@ -682,204 +759,435 @@ class HTMLGenerator:
                 document.body.appendChild(link);
                 link.click();
                 document.body.removeChild(link);
-            }} catch (error) {{
+            } catch (error) {
                 showError('Error exporting CSV: ' + error.message);
                 console.error('Export error:', error);
-            }}
-        }}
-        
-        // Download Status Functions
-        function getDownloadStatusStorageKey() {{
+            }
+        }
+        
+        // Checklist state (selection, download status, accessed links) is kept in
+        // memory and written back in debounced batches: to IndexedDB when it's
+        // available, otherwise to localStorage. Storage keys are computed once on load.
+        const PERSIST_DELAY_MS = 500;
+        const DB_NAME = 'scholar-checklists';
+        const DB_STORE = 'state';
+        let storageKeys = null;
+        let databasePromise = null;
+        let persistTimer = null;
+        const dirtyKeys = new Set();
+        
+        function computeStorageKeys() {
+            let profileId = 'default';
             const profileText = document.querySelector('.header p');
-            if (profileText) {{
+            if (profileText) {
                 const match = profileText.textContent.match(/Semantic Scholar Profile: (.+)/);
-                if (match && match[1]) {{
-                    return 'download_status_' + match[1].trim();
-                }}
-            }}
-            return 'download_status_default';
-        }}
-        
-        function saveDownloadStatus(paperId, isChecked) {{
-            try {{
-                const storageKey = getDownloadStatusStorageKey();
-                let downloadStatuses = {{}};
-                const stored = localStorage.getItem(storageKey);
-                if (stored) {{
-                    try {{
-                        downloadStatuses = JSON.parse(stored);
-                    }} catch(e) {{
-                        console.error('Error parsing download status data:', e);
-                        showError('Error parsing download status data');
-                    }}
-                }}
-                downloadStatuses[paperId] = isChecked;
-                localStorage.setItem(storageKey, JSON.stringify(downloadStatuses));
-            }} catch(e) {{
-                console.error('Error saving download status:', e);
-                showError('Error saving download status: ' + e.message);
-            }}
-        }}
-        
-        function restoreDownloadStatus() {{
-            try {{
-                const storageKey = getDownloadStatusStorageKey();
-                const stored = localStorage.getItem(storageKey);
-                if (!stored) {{
+                if (match && match[1]) {
+                    profileId = match[1].trim();
+                }
+            }
+            return {
+                selected: 'selected_papers_' + profileId,
+                downloaded: 'download_status_' + profileId,
+                accessed: 'accessed_papers_' + profileId
+            };
+        }
+        
+        // Resolves to the database, or null when IndexedDB is unavailable (private mode, file:// in some browsers)
+        function openDatabase() {
+            if (!databasePromise) {
+                databasePromise = new Promise(resolve => {
+                    try {
+                        const request = window.indexedDB.open(DB_NAME, 1);
+                        request.onupgradeneeded = () => request.result.createObjectStore(DB_STORE);
+                        request.onsuccess = () => resolve(request.result);
+                        request.onerror = () => resolve(null);
+                        request.onblocked = () => resolve(null);
+                    } catch(e) {
+                        resolve(null);
+                    }
+                });
+            }
+            return databasePromise;
+        }
+        
+        function serializeState(key) {
+            if (key === storageKeys.selected) {
+                const selectedIds = [];
+                for (let index = 0; index < selected.length; index++) {
+                    if (selected[index]) {
+                        selectedIds.push(index + 1);
+                    }
+                }
+                return selectedIds;
+            }
+            return key === storageKeys.downloaded ? downloadStatuses : accessedPapers;
+        }
+        
+        async function readState(key) {
+            const database = await openDatabase();
+            if (database) {
+                const value = await new Promise(resolve => {
+                    const request = database.transaction(DB_STORE).objectStore(DB_STORE).get(key);
+                    request.onsuccess = () => resolve(request.result);
+                    request.onerror = () => resolve(undefined);
+                });
+                if (value !== undefined) {
+                    return value;
+                }
+            }
+            // Nothing in IndexedDB yet: use localStorage, which also picks up state saved by older pages
+            const stored = localStorage.getItem(key);
+            return stored ? JSON.parse(stored) : null;
+        }
+        
+        async function restoreState() {
+            try {
+                const [selectedIds, downloaded, accessed] = await Promise.all([
+                    readState(storageKeys.selected),
+                    readState(storageKeys.downloaded),
+                    readState(storageKeys.accessed)
+                ]);
+                (selectedIds || []).forEach(paperId => setSelected(paperId - 1, true));
+                // Anything clicked while the state was loading wins over what was saved
+                downloadStatuses = Object.assign(downloaded || {}, downloadStatuses);
+                accessedPapers = Object.assign(accessed || {}, accessedPapers);
+            } catch(e) {
+                console.error('Error restoring checklist state:', e);
+                showError('Error restoring checklist state: ' + e.message);
+            }
+        }
+        
+        // Mark a state key as changed; every change within PERSIST_DELAY_MS is saved in one write
+        function schedulePersist(key) {
+            dirtyKeys.add(key);
+            clearTimeout(persistTimer);
+            persistTimer = setTimeout(flushState, PERSIST_DELAY_MS);
+        }
+        
+        async function flushState() {
+            clearTimeout(persistTimer);
+            persistTimer = null;
+            if (dirtyKeys.size === 0) {
+                return;
+            }
+            const keys = Array.from(dirtyKeys);
+            dirtyKeys.clear();
+            try {
+                const database = await openDatabase();
+                if (database) {
+                    const transaction = database.transaction(DB_STORE, 'readwrite');
+                    const store = transaction.objectStore(DB_STORE);
+                    keys.forEach(key => store.put(serializeState(key), key));
+                    await new Promise((resolve, reject) => {
+                        transaction.oncomplete = resolve;
+                        transaction.onerror = () => reject(transaction.error);
+                        transaction.onabort = () => reject(transaction.error);
+                    });
                     return;
-                }}
-                const downloadStatuses = JSON.parse(stored);
-                const checkboxes = document.querySelectorAll('.download-status-checkbox');
-                checkboxes.forEach(checkbox => {{
-                    const paperId = checkbox.getAttribute('data-paper-id');
-                    if (downloadStatuses[paperId]) {{
-                        checkbox.checked = true;
-                    }}
-                }});
-            }} catch(e) {{
-                console.error('Error restoring download status:', e);
-                showError('Error restoring download status: ' + e.message);
-            }}
-        }}
-        
-        // Add event listeners to all checkboxes and restore download state
-        document.addEventListener('DOMContentLoaded', function() {{
-            const selectionCheckboxes = document.querySelectorAll('tbody td:first-child input[type="checkbox"]');
-            selectionCheckboxes.forEach(checkbox => {{
-                checkbox.addEventListener('change', updateCheckedCount);
-            }});
-            
-            // Add event listeners for download status checkboxes
-            const downloadStatusCheckboxes = document.querySelectorAll('.download-status-checkbox');
-            downloadStatusCheckboxes.forEach(checkbox => {{
-                checkbox.addEventListener('change', function() {{
-                    const paperId = this.getAttribute('data-paper-id');
-                    saveDownloadStatus(paperId, this.checked);
-                }});
-            }});
+                }
+                keys.forEach(key => localStorage.setItem(key, JSON.stringify(serializeState(key))));
+            } catch(e) {
+                console.error('Error saving checklist state:', e);
+                showError('Error saving checklist state: ' + e.message);
+            }
+        }
+        
+        // Don't lose the last batch when the tab is closed or backgrounded
+        window.addEventListener('pagehide', flushState);
+        document.addEventListener('visibilitychange', function() {
+            if (document.visibilityState === 'hidden') {
+                flushState();
+            }
+        });
+        
+        // Load the paper data, render the first window, then restore saved state
+        document.addEventListener('DOMContentLoaded', function() {
+            try {
+                const dataIsland = document.getElementById('paper-data');
+                papers = dataIsland ? JSON.parse(dataIsland.textContent) : [];
+            } catch(e) {
+                console.error('Error reading paper data:', e);
+                showError('Error reading paper data: ' + e.message);
+                return;
+            }
+            selected = new Uint8Array(papers.length);
+            tableBody = document.querySelector('tbody');
+            storageKeys = computeStorageKeys();
             
+            tableBody.addEventListener('change', handleTableChange);
+            window.addEventListener('scroll', scheduleRender, { passive: true });
+            window.addEventListener('resize', scheduleRender);
             updateCheckedCount();
-            restoreAccessedState();
-            restoreDownloadStatus();
-        }});
+            renderWindow(true);
+            
+            restoreState().then(() => {
+                updateCheckedCount();
+                renderWindow(true);
+            });
+        });
         
         // Access Tracking Functions
-        function getStorageKey() {{
-            // Extract author_id from the page
-            const profileText = document.querySelector('.header p');
-            if (profileText) {{
-                const match = profileText.textContent.match(/Semantic Scholar Profile: (.+)/);
-                if (match && match[1]) {{
-                    return 'accessed_papers_' + match[1].trim();
-                }}
-            }}
-            // Fallback to a default key if author_id not found
-            return 'accessed_papers_default';
-        }}
-        
-        function markAsAccessed(paperId) {{
-            try {{
-                const storageKey = getStorageKey();
-                let accessedPapers = {{}};
-                
-                // Get existing accessed papers from localStorage
-                const stored = localStorage.getItem(storageKey);
-                if (stored) {{
-                    try {{
-                        accessedPapers = JSON.parse(stored);
-                    }} catch(e) {{
-                        console.error('Error parsing stored access data:', e);
-                        showError('Error parsing access data');
-                    }}
-                }}
-                
-                // Mark this paper as accessed
-                accessedPapers[paperId] = true;
-                
-                // Save back to localStorage
-                localStorage.setItem(storageKey, JSON.stringify(accessedPapers));
-                
-                // Update the link appearance
-                const link = document.querySelector('.download-link[data-paper-id="' + paperId + '"]');
-                if (link) {{
-                    link.classList.add('accessed');
-                    link.textContent = 'Accessed ✓';
-                }}
-            }} catch(e) {{
-                console.error('Error marking paper as accessed:', e);
-                showError('Error tracking access: ' + e.message);
-                // Handle localStorage quota exceeded or other errors gracefully
-            }}
-        }}
-        
-        function restoreAccessedState() {{
-            try {{
-                const storageKey = getStorageKey();
-                const stored = localStorage.getItem(storageKey);
-                
-                if (!stored) {{
-                    return;
-                }}
-                
-                const accessedPapers = JSON.parse(stored);
-                
-                // Restore state for each accessed paper
-                for (const paperId in accessedPapers) {{
-                    if (accessedPapers[paperId]) {{
-                        const link = document.querySelector('.download-link[data-paper-id="' + paperId + '"]');
-                        if (link) {{
-                            link.classList.add('accessed');
-                            link.textContent = 'Accessed ✓';
-                        }}
-                    }}
-                }}
-            }} catch(e) {{
-                console.error('Error restoring accessed state:', e);
-                showError('Error restoring access state: ' + e.message);
-            }}
-        }}
-        
-        function clearDownloadHistory() {{
-            if (!confirm('Are you sure you want to clear all access history? This action cannot be undone.')) {{
+        function markAsAccessed(paperId) {
+            accessedPapers[paperId] = true;
+            schedulePersist(storageKeys.accessed);
+            
+            // Update the link appearance, if its row is rendered
+            const link = document.querySelector('.download-link[data-paper-id="' + paperId + '"]');
+            if (link) {
+                link.classList.add('accessed');
+                link.textContent = 'Accessed ✓';
+            }
+        }
+        
+        function clearDownloadHistory() {
+            if (!confirm('Are you sure you want to clear all access history? This action cannot be undone.')) {
                 return;
-            }}
+            }
             
-            try {{
-                const storageKey = getStorageKey();
-                localStorage.removeItem(storageKey);
-                
-                // Remove accessed class and reset text for all download links
-                const accessedLinks = document.querySelectorAll('.download-link.accessed');
-                accessedLinks.forEach(link => {{
-                    link.classList.remove('accessed');
-                    link.textContent = 'Access PDF';
-                }});
+            try {
+                // Reset the state and re-render so every download link shows 'Access PDF' again
+                accessedPapers = {};
+                localStorage.removeItem(storageKeys.accessed);
+                schedulePersist(storageKeys.accessed);
+                flushState();
+                renderWindow(true);
                 
                 // Show feedback
                 alert('Access history cleared successfully!');
-            }} catch(e) {{
+            } catch(e) {
                 console.error('Error clearing access history:', e);
                 showError('Error clearing access history: ' + e.message);
-            }}
-        }}
+            }
+        }
         
         // Add event listener for download link clicks
-        document.addEventListener('click', function(event) {{
-            try {{
+        document.addEventListener('click', function(event) {
+            try {
                 const downloadLink = event.target.closest('.download-link');
-                if (downloadLink && downloadLink.hasAttribute('data-paper-id')) {{
+                if (downloadLink && downloadLink.hasAttribute('data-paper-id')) {
                     const paperId = downloadLink.getAttribute('data-paper-id');
                     markAsAccessed(paperId);
-                }}
-            }} catch(error) {{
+                }
+            } catch(error) {
                 showError('Error tracking download: ' + error.message);
                 console.error('Download tracking error:', error);
-            }}
-        }});
-    </script>
-</body>
+            }
+        });
+"""
+
+
+def _hashed_name(stem: str, extension: str, content: str) -> str:
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    return f"{stem}.{digest}.{extension}"
+
+
+ASSET_FILES: Dict[str, Tuple[str, str]] = {
+    "css": (_hashed_name("checklist", "css", CHECKLIST_CSS), CHECKLIST_CSS),
+    "js": (_hashed_name("checklist", "js", CHECKLIST_JS), CHECKLIST_JS),
+}
+
+
+# Rows rendered as HTML for the first paint; the page script renders the rest from the data island
+INITIAL_ROWS = 50
+
+
+def _json_for_script(value) -> str:
+    """Compact JSON that is safe to embed inside a ``<script>`` element"""
+    return (json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+            .replace("<", "\\u003c")
+            .replace(">", "\\u003e")
+            .replace("&", "\\u0026")
+            .replace("\u2028", "\\u2028")
+            .replace("\u2029", "\\u2029"))
+
+
+class _ChecklistBody:
+    """Renders the table body and the ``#paper-data`` JSON island one paper at a time
+    
+    The first ``initial_rows`` papers become HTML rows; every paper becomes an
+    entry in the data island. Only those first entries are buffered, so
+    streaming stays O(one row) however many papers there are.
+    """
+    
+    def __init__(self, initial_rows: int = INITIAL_ROWS):
+        self.initial_rows = initial_rows
+        self.count = 0
+        self._pending: List[str] = []
+        self._island_open = False
+    
+    def add(self, paper: Dict) -> str:
+        self.count += 1
+        record = _json_for_script(HTMLGenerator._paper_record(paper))
+        if self.count <= self.initial_rows:
+            self._pending.append(record)
+            return HTMLGenerator._generate_table_row(self.count, paper) + "\n"
+        separator = "," if self.count > 1 else ""
+        return self._open_island() + separator + record
+    
+    def finish(self) -> str:
+        return self._open_island() + "]</script>\n"
+    
+    def _open_island(self) -> str:
+        if self._island_open:
+            return ""
+        self._island_open = True
+        records = ",".join(self._pending)
+        self._pending = []
+        return f"""                </tbody>
+            </table>
+        </div>
+        <script type="application/json" id="paper-data">[{records}"""
+
+
+class HTMLGenerator:
+    """Generates interactive HTML checklist table for papers"""
+    
+    @staticmethod
+    def asset_files() -> Dict[str, Tuple[str, str]]:
+        """Return ``{"css": (filename, content), "js": (filename, content)}`` for external mode"""
+        return dict(ASSET_FILES)
+    
+    @staticmethod
+    def generate_html(papers: List[Dict], author_id: str, asset_urls: Optional[Dict[str, str]] = None) -> str:
+        """
+        Generate HTML file with interactive checklist table
+        
+        Args:
+            papers: List of paper dictionaries
+            author_id: Semantic Scholar author identifier
+            asset_urls: Optional ``{"css": url, "js": url}`` pointing at the files from
+                ``asset_files()``; when omitted the CSS and JS are inlined
+            
+        Returns:
+            HTML string
+        """
+        return "".join(HTMLGenerator.iter_html(papers, author_id, asset_urls, total=len(papers)))
+    
+    @staticmethod
+    def iter_html(
+        papers: Iterable[Dict],
+        author_id: str,
+        asset_urls: Optional[Dict[str, str]] = None,
+        total: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Yield the checklist document in pieces: header, one chunk per row, footer
+        
+        ``papers`` is consumed lazily. When ``total`` isn't known up front the
+        header leaves the paper count blank and the footer fills it in.
+        """
+        yield HTMLGenerator._render_header(author_id, total, asset_urls)
+        body = _ChecklistBody()
+        for paper in papers:
+            yield body.add(paper)
+        yield body.finish() + HTMLGenerator._render_footer(body.count if total is None else None, asset_urls)
+    
+    @staticmethod
+    def write_html(
+        sink: TextIO,
+        papers: Iterable[Dict],
+        author_id: str,
+        asset_urls: Optional[Dict[str, str]] = None,
+        total: Optional[int] = None,
+    ) -> None:
+        """Write the checklist to a file-like object without building it in memory"""
+        for chunk in HTMLGenerator.iter_html(papers, author_id, asset_urls, total):
+            sink.write(chunk)
+    
+    @staticmethod
+    async def write_html_async(
+        write: Callable[[str], Awaitable[None]],
+        papers: Union[Iterable[Dict], AsyncIterable[Dict]],
+        author_id: str,
+        asset_urls: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """
+        Stream the checklist to an async ``write`` callable as papers arrive
+        
+        Returns the number of rows written.
+        """
+        await write(HTMLGenerator._render_header(author_id, None, asset_urls))
+        body = _ChecklistBody()
+        if hasattr(papers, "__aiter__"):
+            async for paper in papers:
+                await write(body.add(paper))
+        else:
+            for paper in papers:
+                await write(body.add(paper))
+        await write(body.finish() + HTMLGenerator._render_footer(body.count, asset_urls))
+        return body.count
+    
+    @staticmethod
+    def _render_header(author_id: str, total: Optional[int], asset_urls: Optional[Dict[str, str]]) -> str:
+        """Render everything up to and including the opening ``<tbody>``"""
+        if asset_urls:
+            styles = f'    <link rel="stylesheet" href="{HTMLGenerator._escape_html(asset_urls["css"])}">\n'
+        else:
+            styles = f"    <style>\n{CHECKLIST_CSS}    </style>\n"
+        total_html = total if total is not None else '<span id="total-papers"></span>'
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Semantic Scholar Papers - {author_id}</title>
+{styles}</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📚 Research Papers Checklist</h1>
+            <p>Semantic Scholar Profile: {author_id}</p>
+        </div>
+        
+        <div class="controls">
+            <div class="stats">
+                <strong>Total Papers:</strong> {total_html} | 
+                <strong>Checked:</strong> <span id="checked-count">0</span>
+            </div>
+            <div class="button-group">
+                <button class="btn-select-all" onclick="selectAll()">✓ Select All for Export</button>
+                <button class="btn-deselect-all" onclick="deselectAll()">✗ Deselect All</button>
+                <button class="btn-export" onclick="exportChecked()">📥 Export Checked</button>
+                <button class="btn-clear-history" onclick="clearDownloadHistory()">🗑️ Clear Download History</button>
+            </div>
+        </div>
+        
+        <div class="table-wrapper">
+            <table>
+                <thead>
+                    <tr>
+                        <th title="Select papers to include in CSV export">✓ Select</th>
+                        <th>Sr. No</th>
+                        <th>Title</th>
+                        <th>Authors</th>
+                        <th>Year</th>
+                        <th>Publication</th>
+                        <th>Citations</th>
+                        <th>DOI</th>
+                        <th>Download Link</th>
+                        <th>Download Status</th>
+                    </tr>
+                </thead>
+                <tbody>
+"""
+    
+    @staticmethod
+    def _render_footer(late_total: Optional[int], asset_urls: Optional[Dict[str, str]]) -> str:
+        """Render the footer and scripts; ``late_total`` fills in a blank paper count"""
+        if asset_urls:
+            scripts = f'    <script src="{HTMLGenerator._escape_html(asset_urls["js"])}"></script>\n'
+        else:
+            scripts = f"    <script>\n{CHECKLIST_JS}    </script>\n"
+        if late_total is not None:
+            scripts = f"    <script>document.getElementById('total-papers').textContent = '{late_total}';</script>\n" + scripts
+        return f"""        
+        <div class="footer">
+            Generated by Semantic Scholar Scraper | {HTMLGenerator._get_current_date()}
+        </div>
+    </div>
+    
+{scripts}</body>
 </html>"""
-        return html_content
     
     @staticmethod
     def _format_citations(citations: str) -> str:
@@ -894,50 +1202,61 @@ class HTMLGenerator:
             return citations
     
     @staticmethod
-    def _generate_table_rows(papers: List[Dict]) -> str:
-        """Generate HTML table rows for papers"""
-        rows = []
-        
-        for idx, paper in enumerate(papers, 1):
-            title = HTMLGenerator._escape_html(paper.get('title', ''))
-            authors = HTMLGenerator._escape_html(paper.get('authors', ''))
-            year = HTMLGenerator._escape_html(paper.get('year', ''))
-            publication = HTMLGenerator._escape_html(paper.get('publication', ''))
-            citations = paper.get('citations', 'Missing citations')
-            citations_formatted = HTMLGenerator._format_citations(citations)
-            doi = HTMLGenerator._escape_html(paper.get('doi', ''))
-            download_link = paper.get('download_link', '')
-            
-            # Format download link
-            # Note: URLs in href attributes should NOT be HTML-escaped
-            # HTML escaping is for text content, not URLs
-            if download_link:
-                # Only escape quotes in the URL to prevent breaking the HTML attribute
-                safe_url = download_link.replace('"', '&quot;').replace("'", '&#39;')
-                download_html = f'<a href="{safe_url}" target="_blank" class="download-link" data-paper-id="{idx}">Access PDF</a>'
-            else:
-                download_html = '<span class="no-link">Not found</span>'
-            
-            # Format DOI
-            if doi:
-                # Format DOI URL (handle both with and without https://)
-                doi_url = doi if doi.startswith('http') else f'https://doi.org/{doi}'
-                safe_doi_url = doi_url.replace('"', '&quot;').replace("'", '&#39;')
-                doi_html = f'<a href="{safe_doi_url}" target="_blank" class="doi">{doi}</a>'
-            else:
-                doi_html = '<span class="no-link">-</span>'
-            
-            # Format citations
-            if citations_formatted == "Missing citations":
-                citations_html = '<span class="no-link">Missing citations</span>'
-            else:
-                citations_html = f'<span class="citations">{HTMLGenerator._escape_html(citations_formatted)}</span>'
-            
-            # Format download status checkbox
-            download_status_html = f'<input type="checkbox" class="download-status-checkbox" data-paper-id="{idx}" title="Check if you actually downloaded this paper">'
-            
-            row = f"""                    <tr>
-                        <td><input type="checkbox" id="paper-{idx}"></td>
+    def _paper_record(paper: Dict) -> List[str]:
+        """The compact data-island entry for one paper, in the order the page script expects"""
+        return [
+            paper.get('title', '') or '',
+            paper.get('authors', '') or '',
+            paper.get('year', '') or '',
+            paper.get('publication', '') or '',
+            HTMLGenerator._format_citations(paper.get('citations', 'Missing citations')),
+            paper.get('doi', '') or '',
+            paper.get('download_link', '') or '',
+        ]
+    
+    @staticmethod
+    def _generate_table_row(idx: int, paper: Dict) -> str:
+        """Generate the HTML table row for one paper"""
+        title = HTMLGenerator._escape_html(paper.get('title', ''))
+        authors = HTMLGenerator._escape_html(paper.get('authors', ''))
+        year = HTMLGenerator._escape_html(paper.get('year', ''))
+        publication = HTMLGenerator._escape_html(paper.get('publication', ''))
+        citations = paper.get('citations', 'Missing citations')
+        citations_formatted = HTMLGenerator._format_citations(citations)
+        doi = HTMLGenerator._escape_html(paper.get('doi', ''))
+        download_link = paper.get('download_link', '')
+        
+        # Format download link
+        # Note: URLs in href attributes should NOT be HTML-escaped
+        # HTML escaping is for text content, not URLs
+        if download_link:
+            # Only escape quotes in the URL to prevent breaking the HTML attribute
+            safe_url = download_link.replace('"', '&quot;').replace("'", '&#39;')
+            download_html = f'<a href="{safe_url}" target="_blank" class="download-link" data-paper-id="{idx}">Access PDF</a>'
+        else:
+            download_html = '<span class="no-link">Not found</span>'
+        
+        # Format DOI
+        if doi:
+            # Format DOI URL (handle both with and without https://)
+            doi_url = doi if doi.startswith('http') else f'https://doi.org/{doi}'
+            safe_doi_url = doi_url.replace('"', '&quot;').replace("'", '&#39;')
+            doi_html = f'<a href="{safe_doi_url}" target="_blank" class="doi">{doi}</a>'
+        else:
+            doi_html = '<span class="no-link">-</span>'
+        
+        # Format citations
+        if citations_formatted == "Missing citations":
+            citations_html = '<span class="no-link">Missing citations</span>'
+        else:
+            citations_html = f'<span class="citations">{HTMLGenerator._escape_html(citations_formatted)}</span>'
+        
+        # Format download status checkbox
+        download_status_html = f'<input type="checkbox" class="download-status-checkbox" data-paper-id="{idx}" title="Check if you actually downloaded this paper">'
+        
+        row_class = ' class="even"' if idx % 2 == 0 else ''
+        return f"""                    <tr data-index="{idx - 1}"{row_class}>
+                        <td><input type="checkbox" class="select-checkbox" id="paper-{idx}"></td>
                         <td><span class="sr-no">{idx}</span></td>
                         <td><span class="title">{title}</span></td>
                         <td><span class="authors">{authors}</span></td>
@@ -948,9 +1267,6 @@ class HTMLGenerator:
                         <td>{download_html}</td>
                         <td>{download_status_html}</td>
                     </tr>"""
-            rows.append(row)
-        
-        return '\n'.join(rows)
     
     @staticmethod
     def _escape_html(text: str) -> str:
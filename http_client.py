@@ -0,0 +1,99 @@
+"""
+Pooled async HTTP transport for PDF validation and open-access lookups.
+"""
+import ssl
+from typing import Dict, Optional
+
+import httpx
+
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401  pylint: disable=unused-import
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (compatible; ScholarScraper/1.0)'
+
+
+def _is_ssl_error(exc: Exception) -> bool:
+    """Return True when a connection failed because of certificate verification."""
+    cause = exc
+    while cause is not None:
+        if isinstance(cause, ssl.SSLError):
+            return True
+        cause = cause.__cause__ or cause.__context__
+    return "CERTIFICATE_VERIFY_FAILED" in str(exc)
+
+
+class AsyncHTTPClient:
+    """Keep-alive HTTP client used for every outbound non-API request of a scraper.
+
+    httpx keeps a separate connection pool per origin, so repeated requests to
+    arxiv.org, doi.org or api.unpaywall.org reuse warm TLS connections instead
+    of paying a handshake per URL.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        self.timeout = timeout
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._headers = {'User-Agent': user_agent}
+        self._clients: Dict[bool, httpx.AsyncClient] = {}
+
+    def _client(self, verify: bool) -> httpx.AsyncClient:
+        client = self._clients.get(verify)
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                verify=verify,
+                timeout=httpx.Timeout(self.timeout),
+                limits=self._limits,
+                headers=self._headers,
+            )
+            self._clients[verify] = client
+        return client
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        follow_redirects: bool = True,
+    ) -> httpx.Response:
+        """Send a request, retrying without certificate checks if verification fails."""
+        kwargs = {
+            "headers": headers,
+            "follow_redirects": follow_redirects,
+            "timeout": httpx.Timeout(timeout) if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+        }
+        try:
+            return await self._client(verify=True).request(method, url, **kwargs)
+        except httpx.ConnectError as exc:
+            if not _is_ssl_error(exc):
+                raise
+        # Some hosts have self-signed certs; retry on a separate unverified pool
+        return await self._client(verify=False).request(method, url, **kwargs)
+
+    async def head(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("HEAD", url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
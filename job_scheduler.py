@@ -0,0 +1,128 @@
+"""
+Bounded job queue and worker pool for scrape jobs.
+"""
+import asyncio
+import math
+import os
+import time
+import traceback
+from collections import deque
+from typing import Awaitable, Callable, Deque, List, Optional, Set, Tuple
+
+
+class QueueFullError(Exception):
+    """Raised by ``JobScheduler.submit`` when no more jobs can be queued."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Job queue is full, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class JobScheduler:
+    """Run at most ``workers`` jobs at once and queue up to ``queue_size`` more.
+
+    Jobs are started in submission order. Anything beyond the queue is
+    rejected with ``QueueFullError`` so a burst of requests degrades into
+    429s instead of every scrape (and its Chromium) running at once.
+    ``on_queue_change`` is called whenever queue positions shift.
+    """
+
+    DEFAULT_JOB_SECONDS = 60.0
+
+    def __init__(
+        self,
+        workers: int = 2,
+        queue_size: int = 20,
+        on_queue_change: Optional[Callable[[], None]] = None,
+    ):
+        self.workers = max(1, workers)
+        self.queue_size = max(0, queue_size)
+        self.on_queue_change = on_queue_change
+        self._pending: Deque[Tuple[str, Callable[[], Awaitable[None]]]] = deque()
+        self._running: Set[str] = set()
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._avg_job_seconds = self.DEFAULT_JOB_SECONDS
+        self.stats = {"submitted": 0, "rejected": 0, "completed": 0}
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "JobScheduler":
+        """Build a scheduler sized by ``SCRAPE_WORKERS`` and ``SCRAPE_QUEUE_SIZE``."""
+        return cls(
+            workers=int(os.getenv("SCRAPE_WORKERS", "2")),
+            queue_size=int(os.getenv("SCRAPE_QUEUE_SIZE", "20")),
+            **kwargs,
+        )
+
+    @property
+    def queued_ids(self) -> List[str]:
+        return [job_id for job_id, _ in self._pending]
+
+    @property
+    def running_ids(self) -> Set[str]:
+        return set(self._running)
+
+    def position(self, job_id: str) -> Optional[int]:
+        """Return the 1-based queue position of ``job_id``, or None if it isn't waiting."""
+        for index, (queued_id, _) in enumerate(self._pending, start=1):
+            if queued_id == job_id:
+                return index
+        return None
+
+    def retry_after(self) -> int:
+        """Estimate how many seconds until a queue slot frees up."""
+        return max(1, math.ceil(self._avg_job_seconds / self.workers))
+
+    def start(self) -> None:
+        """Spawn the worker tasks on the running event loop."""
+        if self._tasks:
+            return
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Cancel the workers; queued jobs are dropped."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._pending.clear()
+
+    def submit(self, job_id: str, job: Callable[[], Awaitable[None]]) -> int:
+        """Queue ``job`` (a coroutine factory) and return its queue position."""
+        if len(self._pending) >= self.queue_size:
+            self.stats["rejected"] += 1
+            raise QueueFullError(self.retry_after())
+        self._pending.append((job_id, job))
+        self.stats["submitted"] += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return len(self._pending)
+
+    def _notify(self) -> None:
+        if self.on_queue_change is not None:
+            try:
+                self.on_queue_change()
+            except Exception:  # pylint: disable=broad-except
+                traceback.print_exc()
+
+    async def _worker(self) -> None:
+        while True:
+            while not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+            job_id, job = self._pending.popleft()
+            self._running.add(job_id)
+            self._notify()
+            started = time.monotonic()
+            try:
+                await job()
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # pylint: disable=broad-except
+                traceback.print_exc()
+            finally:
+                self._running.discard(job_id)
+                self.stats["completed"] += 1
+                # Smoothed job duration drives the Retry-After estimate
+                self._avg_job_seconds = 0.8 * self._avg_job_seconds + 0.2 * (time.monotonic() - started)
@@ -0,0 +1,336 @@
+"""
+Bounded job stores for the web server: in-memory LRU or durable SQLite.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ACTIVE_STATUSES = ("queued", "running")
+FINISHED_STATUSES = ("completed", "failed", "interrupted")
+
+INTERRUPTED_MESSAGE = "Interrupted by a server restart. Please submit the scrape again."
+
+
+class MemoryJobStore:
+    """Dict-like job registry that forgets finished jobs after ``retention`` seconds.
+
+    Jobs are plain dicts that the server mutates in place and then passes to
+    ``save``. Queued and running jobs are never evicted; once more than
+    ``max_jobs`` are held, the least recently used finished jobs go first.
+    """
+
+    def __init__(self, max_jobs: int = 1000, retention: float = 24 * 60 * 60):
+        self.max_jobs = max(1, max_jobs)
+        self.retention = retention
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.get(job_id) is not None
+
+    def __getitem__(self, job_id: str) -> Dict[str, Any]:
+        job = self.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        return job
+
+    def __setitem__(self, job_id: str, job: Dict[str, Any]) -> None:
+        job.setdefault("created_at", time.time())
+        self._jobs[job_id] = job
+        self.save(job_id)
+
+    def __delitem__(self, job_id: str) -> None:
+        self._jobs.pop(job_id, None)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._jobs))
+
+    def values(self) -> List[Dict[str, Any]]:
+        """Snapshot of the jobs held in memory, without touching LRU order."""
+        return list(self._jobs.values())
+
+    def get(self, job_id: str, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return default
+        if self._expired(job, time.time()):
+            del self._jobs[job_id]
+            return default
+        self._jobs.move_to_end(job_id)
+        return job
+
+    def save(self, job_id: str) -> None:
+        """Record that ``job_id`` changed; stamps timestamps and enforces the size bound."""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        now = time.time()
+        job["updated_at"] = now
+        if job.get("status") in FINISHED_STATUSES:
+            job.setdefault("finished_at", now)
+        self._jobs.move_to_end(job_id)
+        self._enforce_limit()
+
+    def evict_expired(self) -> int:
+        """Drop finished jobs older than the retention window and return how many went."""
+        now = time.time()
+        expired = [job_id for job_id, job in self._jobs.items() if self._expired(job, now)]
+        for job_id in expired:
+            del self._jobs[job_id]
+        return len(expired)
+
+    def mark_interrupted(self) -> int:
+        """Flag jobs left active by a previous process. Memory doesn't survive restarts."""
+        return 0
+
+    def close(self) -> None:
+        pass
+
+    def _expired(self, job: Dict[str, Any], now: float) -> bool:
+        finished_at = job.get("finished_at")
+        return finished_at is not None and now - finished_at > self.retention
+
+    def _enforce_limit(self) -> None:
+        if len(self._jobs) <= self.max_jobs:
+            return
+        finished = [job_id for job_id, job in self._jobs.items() if job.get("status") in FINISHED_STATUSES]
+        for job_id in finished[: len(self._jobs) - self.max_jobs]:
+            del self._jobs[job_id]
+
+
+class SQLiteJobStore(MemoryJobStore):
+    """Job store that survives restarts and redeploys.
+
+    Recently used jobs stay in memory so progress updates mutate the same
+    dict; every change is written through to SQLite. Progress-only updates
+    are throttled to one write per ``min_write_interval`` seconds, while
+    status changes are always queued immediately. Commits happen on a
+    background writer thread, so callers on the event loop never wait for
+    disk; rows still waiting for it are served from memory.
+    """
+
+    DEFAULT_PATH = Path(__file__).parent / ".cache" / "jobs.sqlite3"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_jobs: int = 1000,
+        retention: float = 24 * 60 * 60,
+        min_write_interval: float = 1.0,
+    ):
+        super().__init__(max_jobs=max_jobs, retention=retention)
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.min_write_interval = min_write_interval
+        self._written: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Rows not yet committed by the writer thread, keyed by job; None means delete
+        self._pending: Dict[str, Optional[Tuple]] = {}
+        self._inflight: Dict[str, Optional[Tuple]] = {}
+        self._wakeup = threading.Condition()
+        self._closing = False
+        self._writer: Optional[threading.Thread] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=5,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " job_id TEXT PRIMARY KEY,"
+                " status TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " updated_at REAL NOT NULL,"
+                " finished_at REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_finished ON jobs (finished_at)")
+            self._conn = conn
+        return self._conn
+
+    def get(self, job_id: str, default: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        job = super().get(job_id)
+        if job is not None:
+            return job
+        with self._wakeup:
+            queued = self._pending.get(job_id, self._inflight.get(job_id, ()))
+        if queued is None:
+            return default
+        try:
+            if queued:
+                payload = queued[2]
+            else:
+                with self._lock:
+                    row = self._connect().execute(
+                        "SELECT payload FROM jobs WHERE job_id = ?", (job_id,)
+                    ).fetchone()
+                if not row:
+                    return default
+                payload = row[0]
+        except sqlite3.Error as exc:
+            print(f"⚠️ Job store read failed: {exc}")
+            return default
+        try:
+            job = json.loads(payload)
+        except ValueError:
+            return default
+        if self._expired(job, time.time()):
+            return default
+        self._jobs[job_id] = job
+        self._written[job_id] = (job.get("status"), job.get("updated_at", 0.0))
+        self._enforce_limit()
+        return job
+
+    def __delitem__(self, job_id: str) -> None:
+        super().__delitem__(job_id)
+        self._written.pop(job_id, None)
+        self._enqueue(job_id, None)
+
+    def save(self, job_id: str) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+        super().save(job_id)
+        status = job.get("status")
+        last_status, last_write = self._written.get(job_id, (None, 0.0))
+        if status == last_status and job["updated_at"] - last_write < self.min_write_interval:
+            return
+        self._write(job_id, job)
+
+    def _write(self, job_id: str, job: Dict[str, Any]) -> None:
+        # Serialised now, since the server keeps mutating the dict
+        row = (
+            job_id,
+            job.get("status", ""),
+            json.dumps(job, separators=(",", ":")),
+            job["updated_at"],
+            job.get("finished_at"),
+        )
+        self._written[job_id] = (job.get("status"), job["updated_at"])
+        self._enqueue(job_id, row)
+
+    def _enqueue(self, job_id: str, row: Optional[Tuple]) -> None:
+        """Hand a row (or a delete) to the writer thread; later changes replace earlier ones."""
+        with self._wakeup:
+            self._pending[job_id] = row
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._run_writer, name="job-store-writer", daemon=True)
+                self._writer.start()
+            self._wakeup.notify()
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._wakeup:
+                while not self._pending and not self._closing:
+                    self._wakeup.wait()
+                if not self._pending:
+                    return
+                self._inflight, self._pending = self._pending, {}
+                batch = list(self._inflight.items())
+            self._commit(batch)
+            with self._wakeup:
+                self._inflight = {}
+
+    def _commit(self, batch: List[Tuple[str, Optional[Tuple]]]) -> None:
+        """Write a batch of rows and deletes in one transaction."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN")
+                try:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO jobs (job_id, status, payload, updated_at, finished_at)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        [row for _, row in batch if row is not None],
+                    )
+                    conn.executemany(
+                        "DELETE FROM jobs WHERE job_id = ?",
+                        [(job_id,) for job_id, row in batch if row is None],
+                    )
+                    conn.execute("COMMIT")
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as exc:
+            print(f"⚠️ Job store write failed: {exc}")
+
+    def evict_expired(self) -> int:
+        super().evict_expired()
+        try:
+            with self._lock:
+                cursor = self._connect().execute(
+                    "DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?",
+                    (time.time() - self.retention,),
+                )
+                removed = cursor.rowcount
+        except sqlite3.Error as exc:
+            print(f"⚠️ Job store purge failed: {exc}")
+            return 0
+        for job_id in [job_id for job_id in self._written if job_id not in self._jobs]:
+            del self._written[job_id]
+        return removed
+
+    def mark_interrupted(self) -> int:
+        """Mark jobs that were queued or running when the last process stopped as interrupted."""
+        placeholders = ",".join("?" for _ in ACTIVE_STATUSES)
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    f"SELECT job_id, payload FROM jobs WHERE status IN ({placeholders})",
+                    ACTIVE_STATUSES,
+                ).fetchall()
+        except sqlite3.Error as exc:
+            print(f"⚠️ Job store read failed: {exc}")
+            return 0
+        now = time.time()
+        for job_id, payload in rows:
+            try:
+                job = json.loads(payload)
+            except ValueError:
+                job = {}
+            job.update(
+                status="interrupted",
+                message=INTERRUPTED_MESSAGE,
+                queue_position=None,
+                updated_at=now,
+                finished_at=now,
+            )
+            self._write(job_id, job)
+        return len(rows)
+
+    def close(self) -> None:
+        """Wait for queued writes to be committed, then close the database."""
+        with self._wakeup:
+            writer, self._writer = self._writer, None
+            self._closing = True
+            self._wakeup.notify()
+        if writer is not None:
+            writer.join()
+        self._closing = False
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def job_store_from_env() -> MemoryJobStore:
+    """Build the store selected by ``JOB_STORE`` (``memory`` or ``sqlite``)."""
+    max_jobs = int(os.getenv("JOB_STORE_MAX_JOBS", "1000"))
+    retention = float(os.getenv("JOB_RETENTION_SECONDS", str(24 * 60 * 60)))
+    if os.getenv("JOB_STORE", "memory").lower() == "sqlite":
+        path = os.getenv("JOB_STORE_PATH")
+        return SQLiteJobStore(Path(path) if path else None, max_jobs=max_jobs, retention=retention)
+    return MemoryJobStore(max_jobs=max_jobs, retention=retention)
@@ -45,6 +45,31 @@ Example:
         help='Maximum number of papers to scrape (default: 50)'
     )
     
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=SemanticScholarScraper.DEFAULT_CONCURRENCY,
+        help=f'Number of papers to enrich in parallel (default: {SemanticScholarScraper.DEFAULT_CONCURRENCY})'
+    )
+    
+    parser.add_argument(
+        '--race-strategies',
+        action='store_true',
+        help='Run the arXiv/Unpaywall/openAccessPdf lookups for each paper concurrently'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Only re-check PDFs for papers that are new or changed since the last stored run'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached results and always scrape fresh data'
+    )
+    
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -65,8 +90,26 @@ Example:
         help='Optional path to save a JSON debug report with candidate and source information'
     )
     
+    parser.add_argument(
+        '--base-url',
+        action='append',
+        default=[],
+        metavar='SERVICE=URL',
+        help='Point an upstream service (api, unpaywall, doi, arxiv, paper_page) at another base URL, '
+             'e.g. a local stand-in; may be repeated'
+    )
+    
     args = parser.parse_args()
     
+    base_urls = {}
+    for override in args.base_url:
+        service, _, url = override.partition('=')
+        if service not in SemanticScholarScraper.BASE_URLS or not url:
+            print(f"Error: Invalid --base-url '{override}'. Use SERVICE=URL with SERVICE one of "
+                  f"{', '.join(SemanticScholarScraper.BASE_URLS)}.")
+            sys.exit(1)
+        base_urls[service] = url.rstrip('/')
+    
     if not args.author_input or len(args.author_input.strip()) == 0:
         print("Error: Invalid author input. Provide an author ID, name, or Semantic Scholar URL.")
         sys.exit(1)
@@ -90,6 +133,7 @@ Example:
     print(f"Author Input: {args.author_input}")
     print(f"Resolved Author ID/Name: {author_identifier}")
     print(f"Max Papers: {args.max_papers}")
+    print(f"Concurrency: {args.concurrency}")
     print(f"API Key Provided: {'Yes' if args.api_key else 'No'}")
     print(f"Output File: {output_file}")
     print("=" * 60)
@@ -102,13 +146,28 @@ Example:
         api_key=args.api_key,
         max_papers=args.max_papers,
         verbose=args.verbose,
-        collect_debug=collect_debug
+        collect_debug=collect_debug,
+        concurrency=args.concurrency,
+        use_cache=not args.no_cache,
+        race_strategies=args.race_strategies,
+        incremental=args.incremental,
+        base_urls=base_urls
     )
     
     # Scrape profile
     print("Starting scraping process...")
     try:
-        papers = await scraper.scrape_profile(args.author_input)
+        records = []
+        async for record in scraper.iter_profile(args.author_input):
+            records.append(record)
+            paper = record["paper"]
+            title = paper.get("title", "") if paper else "(skipped)"
+            print(
+                f"  [{len(records)}/{scraper.selected_count}] #{record['index'] + 1} "
+                f"{title[:60]} ({record['elapsed']:.2f}s, {record['source']})"
+            )
+        records.sort(key=lambda record: record["index"])
+        papers = [record["paper"] for record in records if record["paper"] is not None]
         
         if not papers:
             print("\nError: No papers found. Please check:")
@@ -127,13 +186,11 @@ Example:
             validated = PaperExtractor.validate_paper_data(paper)
             validated_papers.append(validated)
         
-        # Generate HTML
+        # Generate HTML, streamed row by row straight into the output file
         print("Generating HTML file...")
-        html_content = HTMLGenerator.generate_html(validated_papers, args.user_id)
-        
-        # Save to file
         output_path = Path(output_file)
-        output_path.write_text(html_content, encoding='utf-8')
+        with output_path.open('w', encoding='utf-8') as output:
+            HTMLGenerator.write_html(output, validated_papers, author_identifier, total=len(validated_papers))
         
         print(f"\n✓ Success! HTML file saved as: {output_file}")
         print(f"  Location: {output_path.absolute()}")
@@ -162,6 +219,10 @@ Example:
             debug_report_path.write_text(json.dumps(report_payload, indent=2), encoding='utf-8')
             print(f"\nDebug report saved to: {debug_report_path.absolute()}")
         
+        if scraper.cache_status == "stale":
+            print("\nRefreshing stale cached results in the background before exiting...")
+        await SemanticScholarScraper.wait_for_background_refreshes()
+        
     except KeyboardInterrupt:
         print("\n\nScraping interrupted by user.")
         sys.exit(1)
@@ -0,0 +1,152 @@
+"""
+Process-wide async rate limiting for Semantic Scholar API calls.
+"""
+import asyncio
+import os
+import random
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+
+def _unwrap_retry_error(exc: Exception) -> Exception:
+    """Return the error behind a tenacity ``RetryError``, or ``exc`` itself.
+
+    With ``retry=False`` semanticscholar still runs one tenacity attempt, so
+    its 429s arrive wrapped in ``RetryError``.
+    """
+    last_attempt = getattr(exc, "last_attempt", None)
+    if last_attempt is not None and last_attempt.failed:
+        return last_attempt.exception()
+    return exc
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    """Extract a Retry-After delay from an exception, if the response carried one."""
+    exc = _unwrap_retry_error(exc)
+    value = getattr(exc, "retry_after", None)
+    response = getattr(exc, "response", None)
+    if value is None and response is not None:
+        value = getattr(response, "headers", {}).get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(str(value)).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_rate_limit_error(exc: Exception) -> bool:
+    """Return True for the ways a 429 surfaces from semanticscholar/httpx."""
+    exc = _unwrap_retry_error(exc)
+    if getattr(exc, "status", None) == 429 or getattr(exc, "status_code", None) == 429:
+        return True
+    response = getattr(exc, "response", None)
+    if response is not None and getattr(response, "status_code", None) == 429:
+        return True
+    # semanticscholar raises ConnectionRefusedError('HTTP status 429 Too Many Requests.')
+    return isinstance(exc, ConnectionRefusedError) and "429" in str(exc)
+
+
+class AsyncRateLimiter:
+    """Token bucket that queues callers fairly instead of blocking the event loop.
+
+    Waiters are served in arrival order (``asyncio.Lock`` is FIFO), so one busy
+    job cannot starve another. A 429 puts the whole bucket into a cooldown,
+    honouring ``Retry-After`` when present and otherwise backing off
+    exponentially with jitter.
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: int = 3,
+        max_retries: int = 3,
+        backoff_base: float = 10.0,
+        backoff_cap: float = 60.0,
+    ):
+        self.rate = max(rate, 0.001)
+        self.capacity = max(1, burst)
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self.stats: Dict[str, float] = {"calls": 0, "rate_limited": 0, "wait_seconds": 0.0}
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    async def acquire(self) -> None:
+        """Wait for a token without blocking other coroutines."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+                self.stats["wait_seconds"] += wait
+                await asyncio.sleep(wait)
+
+    def penalize(self, delay: float) -> None:
+        """Pause every caller for ``delay`` seconds and drain the bucket."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        self._tokens = 0.0
+
+    def _backoff(self, attempt: int) -> float:
+        ceiling = min(self.backoff_cap, self.backoff_base * (2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
+
+    async def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking API call in a thread once a token is available, retrying on 429."""
+        for attempt in range(self.max_retries + 1):
+            await self.acquire()
+            self.stats["calls"] += 1
+            try:
+                return await asyncio.to_thread(func, *args, **kwargs)
+            except Exception as exc:
+                if not is_rate_limit_error(exc) or attempt >= self.max_retries:
+                    raise
+                delay = _retry_after_seconds(exc)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                self.stats["rate_limited"] += 1
+                print(f"⚠️ Semantic Scholar rate limit reached. Retrying in {delay:.1f}s…")
+                self.penalize(delay)
+
+
+_shared_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bool, AsyncRateLimiter]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def shared_rate_limiter(authenticated: bool = False) -> AsyncRateLimiter:
+    """Return the limiter shared by every scraper on the running event loop.
+
+    Authenticated and anonymous traffic have separate quotas upstream, so they
+    get separate buckets. Rates can be tuned with ``S2_RATE_LIMIT_RPS`` and
+    ``S2_RATE_LIMIT_BURST``.
+    """
+    loop = asyncio.get_running_loop()
+    limiters = _shared_limiters.setdefault(loop, {})
+    limiter = limiters.get(authenticated)
+    if limiter is None:
+        limiter = AsyncRateLimiter(
+            rate=float(os.getenv("S2_RATE_LIMIT_RPS", "1.0")),
+            burst=int(os.getenv("S2_RATE_LIMIT_BURST", "3")),
+        )
+        limiters[authenticated] = limiter
+    return limiter
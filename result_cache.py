@@ -0,0 +1,188 @@
+"""
+Author-level scrape result cache backed by SQLite.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+class CachedResult:
+    """A cached scrape for one author, trimmed to the requested paper limit."""
+
+    def __init__(self, author_id: str, max_papers: int, payload: Dict[str, Any], created_at: float):
+        self.author_id = author_id
+        self.max_papers = max_papers
+        self.payload = payload
+        self.created_at = created_at
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+    @property
+    def papers(self):
+        return self.payload.get("papers", [])
+
+
+class AuthorResultCache:
+    """Indexed store of finished scrapes keyed by author ID and paper limit.
+
+    Each entry is written with a single ``INSERT OR REPLACE``, so concurrent
+    jobs never rewrite each other's entries and a crash mid-write cannot
+    corrupt the rest of the cache. An entry saved for a larger paper limit
+    also answers requests for smaller limits.
+    """
+
+    DEFAULT_PATH = Path(__file__).parent / ".cache" / "author_results.sqlite3"
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.stats: Dict[str, int] = {"hits": 0, "stale_hits": 0, "misses": 0, "writes": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=5,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS author_results ("
+                " author_id TEXT NOT NULL,"
+                " max_papers INTEGER NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " PRIMARY KEY (author_id, max_papers))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_author_results_created"
+                " ON author_results (author_id, created_at)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, author_id: str, max_papers: int, max_age: Optional[float] = None) -> Optional[CachedResult]:
+        """Return the newest entry covering ``max_papers`` papers, optionally bounded by age."""
+        query = (
+            "SELECT max_papers, payload, created_at FROM author_results"
+            " WHERE author_id = ? AND max_papers >= ?"
+        )
+        params = [author_id, max_papers]
+        if max_age is not None:
+            query += " AND created_at >= ?"
+            params.append(time.time() - max_age)
+        query += " ORDER BY created_at DESC LIMIT 1"
+        try:
+            with self._lock:
+                row = self._connect().execute(query, params).fetchone()
+        except sqlite3.Error as exc:
+            print(f"⚠️ Result cache read failed: {exc}")
+            return None
+        if not row:
+            return None
+        stored_max, payload_raw, created_at = row
+        try:
+            payload = json.loads(payload_raw)
+        except ValueError:
+            return None
+        payload["papers"] = payload.get("papers", [])[:max_papers]
+        if "paper_ids" in payload:
+            payload["paper_ids"] = payload["paper_ids"][:len(payload["papers"])]
+        if "debug_records" in payload:
+            payload["debug_records"] = payload["debug_records"][:max_papers]
+        return CachedResult(author_id, stored_max, payload, created_at)
+
+    def latest(self, author_id: str) -> Optional[CachedResult]:
+        """Return the newest entry for ``author_id`` regardless of age or paper limit."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT max_papers, payload, created_at FROM author_results"
+                    " WHERE author_id = ? ORDER BY created_at DESC LIMIT 1",
+                    (author_id,),
+                ).fetchone()
+        except sqlite3.Error as exc:
+            print(f"⚠️ Result cache read failed: {exc}")
+            return None
+        if not row:
+            return None
+        stored_max, payload_raw, created_at = row
+        try:
+            return CachedResult(author_id, stored_max, json.loads(payload_raw), created_at)
+        except ValueError:
+            return None
+
+    def lookup(
+        self,
+        author_id: str,
+        max_papers: int,
+        fresh_ttl: float,
+        stale_ttl: float,
+    ) -> Tuple[str, Optional[CachedResult]]:
+        """Classify the best entry as fresh, stale (servable while refreshing) or a miss."""
+        entry = self.get(author_id, max_papers, max_age=stale_ttl)
+        if entry is None:
+            self.stats["misses"] += 1
+            return MISS, None
+        if entry.age <= fresh_ttl:
+            self.stats["hits"] += 1
+            return FRESH, entry
+        self.stats["stale_hits"] += 1
+        return STALE, entry
+
+    def put(self, author_id: str, max_papers: int, payload: Dict[str, Any]) -> None:
+        """Atomically store (or replace) the entry for ``author_id``/``max_papers``."""
+        encoded = json.dumps(payload, separators=(",", ":"))
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO author_results (author_id, max_papers, payload, created_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (author_id, max_papers, encoded, time.time()),
+                )
+                self.stats["writes"] += 1
+        except sqlite3.Error as exc:
+            print(f"⚠️ Result cache write failed: {exc}")
+
+    def purge_older_than(self, max_age: float) -> int:
+        """Delete entries older than ``max_age`` seconds."""
+        try:
+            with self._lock:
+                cursor = self._connect().execute(
+                    "DELETE FROM author_results WHERE created_at < ?", (time.time() - max_age,)
+                )
+                return cursor.rowcount
+        except sqlite3.Error as exc:
+            print(f"⚠️ Result cache purge failed: {exc}")
+            return 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache: Optional[AuthorResultCache] = None
+
+
+def default_result_cache() -> AuthorResultCache:
+    """Return the process-wide cache, stored at ``RESULT_CACHE_PATH`` if set."""
+    global _default_cache
+    if _default_cache is None:
+        path = os.getenv("RESULT_CACHE_PATH")
+        _default_cache = AuthorResultCache(Path(path) if path else None)
+    return _default_cache
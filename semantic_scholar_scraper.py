@@ -2,39 +2,58 @@
 Semantic Scholar Profile Scraper using the official API.
 """
 import asyncio
+import hashlib
 import json
+import os
 import re
 import time
 from datetime import datetime
-from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from itertools import islice
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote, unquote, urlparse
 
-import requests
-import urllib3
+import httpx
 from bs4 import BeautifulSoup
 from semanticscholar import SemanticScholar
 from semanticscholar.SemanticScholarException import SemanticScholarException
 
-# Suppress SSL warnings when we intentionally disable verification
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from browser_pool import BrowserPool
+from http_client import AsyncHTTPClient
+from rate_limiter import AsyncRateLimiter, shared_rate_limiter
+from result_cache import MISS, STALE, AuthorResultCache, default_result_cache
+from validation_cache import INVALID, TRANSIENT, VALID, ValidationCache, default_validation_cache
 
-# Optional Playwright import for advanced scraping
-try:
-    from playwright.async_api import async_playwright, Browser, Page
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
-    Browser = None
-    Page = None
+
+# Stale-cache refreshes in flight, keyed by (author_id, max_papers)
+_background_refreshes: Dict[Tuple[str, int], "asyncio.Task"] = {}
 
 
 class SemanticScholarScraper:
     """Scrapes Semantic Scholar author profiles for research papers via API."""
 
     CACHE_TTL_SECONDS = 12 * 60 * 60  # 12 hours
-    CACHE_PATH = Path(__file__).parent / ".cache" / "author_cache.json"
-    RATE_LIMIT_BACKOFF = (10, 30, 60)  # seconds
+    CACHE_STALE_TTL_SECONDS = 7 * 24 * 60 * 60  # stale entries are served while refreshing
+    DEFAULT_CONCURRENCY = 4
+    PAPER_BATCH_SIZE = 500  # maximum IDs accepted by POST /paper/batch
+    PAPER_DETAIL_FIELDS = ["paperId", "openAccessPdf", "externalIds"]
+    LISTING_PAGE_SIZE = 500  # papers per author listing request (the API allows up to 1000)
+    MAX_LISTING_PAPERS = 500  # listing depth searched for top-cited papers beyond max_papers
+    # Upstream services; any of them can be pointed elsewhere, e.g. at the local stand-in
+    # in benchmarks/fake_upstream.py, via ``base_urls`` or the environment variables below
+    BASE_URLS = {
+        "api": "https://api.semanticscholar.org",
+        "unpaywall": "https://api.unpaywall.org",
+        "doi": "https://doi.org",
+        "arxiv": "https://arxiv.org",
+        "paper_page": "https://www.semanticscholar.org",
+    }
+    BASE_URL_ENV_VARS = {
+        "api": "S2_API_URL",
+        "unpaywall": "UNPAYWALL_URL",
+        "doi": "DOI_RESOLVER_URL",
+        "arxiv": "ARXIV_URL",
+        "paper_page": "S2_PAPER_PAGE_URL",
+    }
 
     def __init__(
         self,
@@ -45,53 +64,88 @@ class SemanticScholarScraper:
         progress_handler: Optional[Callable[[str, int, int, float], None]] = None,
         search_buffer: int = 100,
         min_top_results: int = 50,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        browser_pool: Optional[BrowserPool] = None,
+        http_client: Optional[AsyncHTTPClient] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        validation_cache: Optional[ValidationCache] = None,
+        use_cache: bool = True,
+        result_cache: Optional[AuthorResultCache] = None,
+        race_strategies: bool = False,
+        incremental: bool = False,
+        base_urls: Optional[Dict[str, str]] = None,
     ):
         self.api_key = api_key
         self.max_papers = max_papers
         self.verbose = verbose
         self.collect_debug = collect_debug
         self.progress_handler = progress_handler
-        self.sch = SemanticScholar(api_key=api_key) if api_key else SemanticScholar()
+        self.base_urls = {**self.BASE_URLS, **self.base_urls_from_env(), **(base_urls or {})}
+        # 429s are retried by the shared rate limiter; the client's own retry sleeps 30s per attempt
+        self.sch = SemanticScholar(api_key=api_key, api_url=self.base_urls["api"], retry=False)
+        self._rate_limiter = rate_limiter
         self.search_buffer = max(10, search_buffer)
         self.min_top_results = max(10, min_top_results)
+        self.concurrency = max(1, concurrency)
+        # Run the cheap PDF discovery tiers concurrently instead of one after another
+        self.race_strategies = race_strategies
+        # Only re-run the PDF waterfall for papers that are new or whose identifiers changed
+        self.incremental = incremental
         self.stats = {
             "doi_found": 0,
             "papers_found": 0,
             "download_links_found": 0,
             "api_calls": 0,
+            "validation_cache_hits": 0,
+            "papers_reused": 0,
             "sorted_by_citations": True,
         }
         self.debug_records: List[Dict] = []
-        self._browser: Optional[Browser] = None
-        self._playwright_context = None
-        self._validation_cache: Dict[str, bool] = {}  # Cache for PDF link validation
+        # A caller-supplied pool (e.g. the server's) is shared and never closed here.
+        self._browser_pool: Optional[BrowserPool] = browser_pool
+        self._owns_browser_pool = browser_pool is None
+        # All outbound non-API requests (PDF validation, Unpaywall, doi.org) share this client
+        self.http = http_client or AsyncHTTPClient()
+        self._owns_http_client = http_client is None
+        self._validation_cache: Dict[str, bool] = {}  # Per-run cache of definitive validation results
+        # Persistent cache shared with other jobs and processes
+        self.validation_cache = validation_cache or default_validation_cache()
+        self.use_cache = use_cache
+        self.result_cache = result_cache or default_result_cache()
+        self._read_cache = use_cache
+        self.cache_status = MISS if use_cache else "disabled"
+        self.cache_age: Optional[float] = None
+        # Paper details resolved by the batch stage, keyed by paperId
+        self._paper_details: Dict[str, object] = {}
+        self._details_failed_ids: set = set()
 
-    async def _get_browser(self) -> Optional[Browser]:
-        """Lazy initialization of Playwright browser."""
-        if not PLAYWRIGHT_AVAILABLE:
-            return None
-        if self._browser is None:
-            playwright = await async_playwright().start()
-            self._playwright_context = playwright
-            # Launch with stealth settings to avoid detection
-            self._browser = await playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                ]
-            )
-        return self._browser
+    def _get_browser_pool(self) -> BrowserPool:
+        """Return the browser pool, creating a private one on first use."""
+        if self._browser_pool is None:
+            self._browser_pool = BrowserPool()
+        return self._browser_pool
 
     async def _close_browser(self):
-        """Close browser and cleanup Playwright."""
-        if self._browser:
-            await self._browser.close()
-            self._browser = None
-        if self._playwright_context:
-            await self._playwright_context.stop()
-            self._playwright_context = None
+        """Close the browser pool if this scraper created it."""
+        if self._owns_browser_pool and self._browser_pool is not None:
+            await self._browser_pool.close()
+            self._browser_pool = None
+
+    async def aclose(self) -> None:
+        """Release resources owned by this scraper instance."""
+        await self._close_browser()
+        if self._owns_http_client:
+            await self.http.aclose()
+
+    @classmethod
+    def base_urls_from_env(cls) -> Dict[str, str]:
+        """Upstream base URLs overridden through ``BASE_URL_ENV_VARS``."""
+        overrides = {}
+        for service, env_var in cls.BASE_URL_ENV_VARS.items():
+            value = os.getenv(env_var, "").strip()
+            if value:
+                overrides[service] = value.rstrip("/")
+        return overrides
 
     @staticmethod
     def extract_author_id_from_url(author_input: str) -> Optional[str]:
@@ -161,17 +215,68 @@ class SemanticScholarScraper:
 
     async def scrape_profile(self, author_input: str) -> List[Dict]:
         """Scrape papers for an author (sorted by citation count descending)."""
+        records = [record async for record in self.iter_profile(author_input)]
+        records.sort(key=lambda record: record["index"])
+        return [record["paper"] for record in records if record["paper"] is not None]
+
+    async def iter_profile(self, author_input: str) -> AsyncIterator[Dict]:
+        """Yield one record per selected paper as soon as its enrichment finishes.
+
+        Records arrive in completion order, not citation order. Each one has
+        ``index`` (citation rank, 0-based), ``paper_id``, ``paper`` (the paper
+        dict, or None if it was skipped), ``error``, ``elapsed`` (seconds spent
+        enriching) and ``source`` (``"scraped"``, ``"reused"`` or ``"cache"``).
+        ``self.selected_count`` holds the number of records to expect once the
+        first one has been yielded. Debug records, stats and the result cache
+        are finalised after the last record.
+        """
+        try:
+            async for record in self._iter_profile(author_input):
+                yield record
+        finally:
+            await self.aclose()
+
+    @staticmethod
+    def _make_record(position: int, paper, paper_dict, error, elapsed: float, source: str) -> Dict:
+        valid = error is None and isinstance(paper_dict, dict) and bool(paper_dict.get("title"))
+        return {
+            "index": position,
+            "paper_id": getattr(paper, "paperId", "") or "",
+            "paper": paper_dict if valid else None,
+            "error": str(error) if error is not None else None,
+            "elapsed": round(elapsed, 3),
+            "source": source,
+        }
+
+    async def _iter_profile(self, author_input: str) -> AsyncIterator[Dict]:
         papers: List[Dict] = []
+        self.selected_count = 0
         if self.collect_debug:
             self.debug_records = []
 
         print(f"\n📊 Starting Semantic Scholar scrape (target: {self.max_papers})\n")
 
-        try:
-            author, author_id = await self._resolve_author(author_input)
-        except Exception as exc:
-            print(f"\n❌ Error resolving author: {exc}")
-            return papers
+        # Numeric IDs can be answered from the cache without any API call
+        candidate = self.extract_author_id_from_url(author_input) or ""
+        cached = None
+        if self._read_cache and candidate.isdigit():
+            cached = await self._serve_from_cache(candidate)
+
+        if cached is None:
+            try:
+                author, author_id = await self._resolve_author(author_input)
+            except Exception as exc:
+                print(f"\n❌ Error resolving author: {exc}")
+                return
+
+            if self._read_cache and not candidate.isdigit():
+                cached = await self._serve_from_cache(author_id)
+
+        if cached is not None:
+            self.selected_count = len(cached)
+            for position, paper_dict in enumerate(cached):
+                yield self._make_record(position, None, paper_dict, None, 0.0, "cache")
+            return
 
         self._print_progress(0, 100, "📄 Fetching papers")
         all_papers = await self._fetch_author_papers(author_id)
@@ -181,7 +286,7 @@ class SemanticScholarScraper:
 
         if not all_papers:
             print("\n⚠️  No papers found for this author.")
-            return papers
+            return
 
         self._print_progress(20, 100, "📊 Sorting papers")
         all_papers.sort(
@@ -189,46 +294,38 @@ class SemanticScholarScraper:
             reverse=True,
         )
         selected = all_papers[: self.max_papers]
+        self.selected_count = len(selected)
         print(f"[DEBUG] ✅ Selected {len(selected)} papers after sorting (max_papers={self.max_papers})")
         self._log(f"Selected top {len(selected)} papers by citations", "SUCCESS")
 
+        # Incremental mode reuses unchanged papers from the last stored result
+        reused: Dict[int, Dict] = {}
+        if self.incremental:
+            reused = await self._reuse_unchanged_papers(author_id, selected)
+        outcomes: Dict[int, Tuple[Optional[Dict], Optional[Exception]]] = {}
+        for position, paper_dict in reused.items():
+            outcomes[position] = (paper_dict, None)
+            yield self._make_record(position, selected[position], paper_dict, None, 0.0, "reused")
+
+        to_enrich = [(position, paper) for position, paper in enumerate(selected) if position not in reused]
+        await self._prefetch_paper_details([paper for _, paper in to_enrich])
+
         self._print_progress(30, 100, "📝 Processing papers")
+        async for position, paper_dict, error, elapsed in self._iter_enriched(to_enrich):
+            outcomes[position] = (paper_dict, error)
+            yield self._make_record(position, selected[position], paper_dict, error, elapsed, "scraped")
+
+        # Assemble in citation order regardless of completion order,
+        # so the paper list and debug records stay deterministic.
         processed_count = 0
         skipped_count = 0
+        paper_ids: List[str] = []
+        fingerprints: Dict[str, str] = {}
         for idx, paper in enumerate(selected, start=1):
-            try:
-                paper_title = getattr(paper, "title", "Unknown") or "Unknown"
-                print(f"\n[DEBUG] 🔄 Processing paper {idx}/{len(selected)}: {paper_title[:60]}...")
-                paper_dict = await self._extract_paper_metadata(paper)
-                if paper_dict is None:
-                    print(f"[DEBUG] ⚠️  Paper {idx} returned None, skipping")
-                    skipped_count += 1
-                    continue
-                if not isinstance(paper_dict, dict) or not paper_dict.get('title'):
-                    print(f"[DEBUG] ⚠️  Paper {idx} returned invalid dict (no title), skipping")
-                    print(f"[DEBUG]   Dict contents: {paper_dict}")
-                    skipped_count += 1
-                    continue
-                papers.append(paper_dict)
-                processed_count += 1
-                print(f"[DEBUG] ✅ Paper {idx} processed successfully (processed: {processed_count}, skipped: {skipped_count})")
-                print(f"[DEBUG]   Title: {paper_dict.get('title', 'N/A')[:50]}...")
-                if self.collect_debug:
-                    self.debug_records.append(
-                        {
-                            "title": paper_dict.get("title", ""),
-                            "paper_id": getattr(paper, "paperId", ""),
-                            "citations": paper_dict.get("citations", "0"),
-                            "doi": paper_dict.get("doi", ""),
-                            "download_link": paper_dict.get("download_link", ""),
-                            "errors": [],
-                        }
-                    )
-            except Exception as exc:  # pylint: disable=broad-except
-                print(f"[DEBUG] ❌ Exception processing paper {idx}: {exc}")
-                import traceback
-                print(f"[DEBUG] Traceback: {traceback.format_exc()}")
-                self._log(f"Error processing paper {idx}: {exc}", "WARN")
+            paper_dict, error = outcomes[idx - 1]
+            if error is not None:
+                print(f"[DEBUG] ❌ Exception processing paper {idx}: {error}")
+                self._log(f"Error processing paper {idx}: {error}", "WARN")
                 skipped_count += 1
                 if self.collect_debug:
                     self.debug_records.append(
@@ -238,11 +335,37 @@ class SemanticScholarScraper:
                             "citations": getattr(paper, "citationCount", "") or "",
                             "doi": "",
                             "download_link": "",
-                            "errors": [str(exc)],
+                            "errors": [str(error)],
                         }
                     )
-            finally:
-                self._print_progress(30 + int((idx / len(selected)) * 60), 100, "📝 Processing papers")
+                continue
+            if paper_dict is None:
+                print(f"[DEBUG] ⚠️  Paper {idx} returned None, skipping")
+                skipped_count += 1
+                continue
+            if not isinstance(paper_dict, dict) or not paper_dict.get('title'):
+                print(f"[DEBUG] ⚠️  Paper {idx} returned invalid dict (no title), skipping")
+                print(f"[DEBUG]   Dict contents: {paper_dict}")
+                skipped_count += 1
+                continue
+            papers.append(paper_dict)
+            processed_count += 1
+            paper_id = getattr(paper, "paperId", "") or ""
+            paper_ids.append(paper_id)
+            if paper_id:
+                fingerprints[paper_id] = self._paper_fingerprint(paper)
+            if self.collect_debug:
+                self.debug_records.append(
+                    {
+                        "title": paper_dict.get("title", ""),
+                        "paper_id": paper_id,
+                        "citations": paper_dict.get("citations", "0"),
+                        "doi": paper_dict.get("doi", ""),
+                        "download_link": paper_dict.get("download_link", ""),
+                        "errors": [],
+                        "reused": (idx - 1) in reused,
+                    }
+                )
 
         self.stats["papers_found"] = len(papers)
         print(f"\n[DEBUG] 📈 Final Summary:")
@@ -252,8 +375,152 @@ class SemanticScholarScraper:
         print(f"[DEBUG]   - Papers skipped: {skipped_count}")
         print(f"[DEBUG]   - Final papers count: {len(papers)}")
         print(f"\n✓ Successfully processed {len(papers)} papers (sorted by citations).\n")
+        if (self.use_cache or self.incremental) and papers:
+            # paper_ids/fingerprints let the next incremental run skip unchanged papers
+            payload = {"papers": papers, "paper_ids": paper_ids, "fingerprints": fingerprints}
+            if self.collect_debug:
+                payload["debug_records"] = self.debug_records
+            await asyncio.to_thread(self.result_cache.put, author_id, self.max_papers, payload)
         self._print_progress(100, 100, "Completed")
-        return papers
+
+    async def _api_call(self, func: Callable, *args, **kwargs):
+        """Run a blocking ``self.sch`` call through the process-wide rate limiter."""
+        limiter = self._rate_limiter or shared_rate_limiter(authenticated=bool(self.api_key))
+        result = await limiter.call(func, *args, **kwargs)
+        self.stats["api_calls"] += 1
+        return result
+
+    @classmethod
+    def _paper_fingerprint(cls, paper) -> str:
+        """Hash the identifiers that decide PDF discovery (citation counts are patched, not compared)."""
+        external_ids = getattr(paper, "externalIds", None) or {}
+        if not isinstance(external_ids, dict):
+            external_ids = {}
+        material = json.dumps(
+            {
+                "paperId": getattr(paper, "paperId", "") or "",
+                "openAccessPdf": cls._open_access_url(paper),
+                "externalIds": {key: str(value) for key, value in external_ids.items() if value},
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha1(material.encode("utf-8")).hexdigest()
+
+    async def _reuse_unchanged_papers(self, author_id: str, selected: List) -> Dict[int, Dict]:
+        """Map positions in ``selected`` to previous results whose identifiers are unchanged."""
+        previous = await asyncio.to_thread(self.result_cache.latest, author_id)
+        if previous is None:
+            print("[DEBUG] 🔁 Incremental: no previous result stored, enriching every paper")
+            return {}
+        fingerprints = previous.payload.get("fingerprints", {})
+        by_id = dict(zip(previous.payload.get("paper_ids", []), previous.papers))
+
+        reused: Dict[int, Dict] = {}
+        for position, paper in enumerate(selected):
+            paper_id = getattr(paper, "paperId", "") or ""
+            if paper_id not in by_id or fingerprints.get(paper_id) != self._paper_fingerprint(paper):
+                continue
+            paper_dict = dict(by_id[paper_id])
+            paper_dict["citations"] = str(getattr(paper, "citationCount", "") or "0")
+            reused[position] = paper_dict
+        self.stats["papers_reused"] = len(reused)
+        print(f"[DEBUG] 🔁 Incremental: reusing {len(reused)} unchanged papers, enriching {len(selected) - len(reused)}")
+        return reused
+
+    @staticmethod
+    def _open_access_url(paper) -> str:
+        """Return the openAccessPdf URL of an API paper object, or an empty string."""
+        open_access_pdf = getattr(paper, "openAccessPdf", None)
+        if isinstance(open_access_pdf, dict):
+            return (open_access_pdf.get("url", "") or "").strip()
+        if hasattr(open_access_pdf, "url"):
+            return (getattr(open_access_pdf, "url", "") or "").strip()
+        if isinstance(open_access_pdf, str):
+            return open_access_pdf.strip()
+        return ""
+
+    async def _prefetch_paper_details(self, selected: List) -> None:
+        """Resolve extra fields for every paper without an openAccessPdf URL via the batch endpoint."""
+        self._paper_details = {}
+        self._details_failed_ids = set()
+        needed = [
+            paper_id
+            for paper_id in (getattr(paper, "paperId", "") for paper in selected if not self._open_access_url(paper))
+            if paper_id
+        ]
+        if not needed:
+            return
+
+        print(f"[DEBUG] 📦 Fetching details for {len(needed)} papers in batches of {self.PAPER_BATCH_SIZE}")
+        for start in range(0, len(needed), self.PAPER_BATCH_SIZE):
+            chunk = needed[start:start + self.PAPER_BATCH_SIZE]
+            try:
+                details = await self._api_call(
+                    self.sch.get_papers,
+                    chunk,
+                    fields=self.PAPER_DETAIL_FIELDS,
+                )
+            except Exception as exc:
+                # Papers in a failed chunk fall back to per-paper lookups in the waterfall
+                self._log(f"Batch paper details failed for {len(chunk)} papers: {exc}", "WARN")
+                self._details_failed_ids.update(chunk)
+                continue
+            for detail in details or []:
+                detail_id = getattr(detail, "paperId", "") or ""
+                if detail_id:
+                    self._paper_details[detail_id] = detail
+
+    async def _get_paper_details(self, paper_id: str):
+        """Return batch-fetched details for a paper, looking it up alone only if its batch failed."""
+        if paper_id in self._paper_details:
+            return self._paper_details[paper_id]
+        if paper_id not in self._details_failed_ids:
+            return None
+        return await self._api_call(
+            self.sch.get_paper,
+            paper_id,
+            fields=self.PAPER_DETAIL_FIELDS,
+        )
+
+    async def _iter_enriched(
+        self, selected: List[Tuple[int, object]]
+    ) -> AsyncIterator[Tuple[int, Optional[Dict], Optional[Exception], float]]:
+        """Run the per-paper PDF waterfall with at most ``self.concurrency`` papers in flight.
+
+        Yields ``(position, paper_dict, error, elapsed)`` as each paper finishes.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        total = len(selected)
+        completed = 0
+
+        async def enrich(position: int, paper):
+            nonlocal completed
+            async with semaphore:
+                paper_title = getattr(paper, "title", "Unknown") or "Unknown"
+                print(f"\n[DEBUG] 🔄 Processing paper {position + 1}/{self.selected_count}: {paper_title[:60]}...")
+                started = time.perf_counter()
+                try:
+                    return position, await self._extract_paper_metadata(paper), None, time.perf_counter() - started
+                except Exception as exc:  # pylint: disable=broad-except
+                    import traceback
+                    print(f"[DEBUG] Traceback: {traceback.format_exc()}")
+                    return position, None, exc, time.perf_counter() - started
+                finally:
+                    # Only the event loop thread touches counters and stats, and never
+                    # across an await, so these updates cannot interleave between tasks.
+                    completed += 1
+                    self._print_progress(30 + int((completed / total) * 60), 100, "📝 Processing papers")
+
+        tasks = [asyncio.create_task(enrich(position, paper)) for position, paper in selected]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # The consumer may stop early; don't leave enrichment running behind it
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _resolve_author(self, author_input: str):
         """Resolve input to an author object and numeric ID."""
@@ -261,17 +528,15 @@ class SemanticScholarScraper:
         candidate = self.extract_author_id_from_url(author_input)
         try:
             if candidate and candidate.isdigit():
-                author = await asyncio.to_thread(self.sch.get_author, candidate)
-                self.stats["api_calls"] += 1
+                author = await self._api_call(self.sch.get_author, candidate)
                 self._log(f"Author found by ID: {author.name}", "SUCCESS")
                 return author, candidate
 
             search_query = candidate if candidate else author_input
             self._log(f"Searching for author by name: {search_query}", "INFO")
-            search_results = await asyncio.to_thread(
+            search_results = await self._api_call(
                 lambda: self.sch.search_author(search_query, limit=5)
             )
-            self.stats["api_calls"] += 1
             if not search_results:
                 raise ValueError("Author not found.")
             author = search_results[0]
@@ -285,8 +550,8 @@ class SemanticScholarScraper:
         # Fetch a large pool to ensure we get top-cited papers
         # get_author_papers doesn't support sorting, so we fetch many and sort ourselves
         target_count = max(self.max_papers, self.search_buffer, self.min_top_results)
-        # Fetch up to 500 papers to ensure we capture top-cited ones
-        fetch_limit = min(500, max(100, target_count * 10))
+        # Fetch up to 500 papers to ensure we capture top-cited ones, and never fewer than requested
+        fetch_limit = max(target_count, min(self.MAX_LISTING_PAPERS, max(100, target_count * 10)))
         fields = [
             "paperId",
             "title",
@@ -300,14 +565,7 @@ class SemanticScholarScraper:
             "openAccessPdf",
         ]
 
-        def collect() -> List:
-            # Use get_author_papers - it doesn't support sorting but returns all papers
-            # We'll sort by citations after fetching
-            results = self.sch.get_author_papers(
-                author_id,
-                fields=fields,
-                limit=fetch_limit,
-            )
+        def collect(results) -> List:
             papers: List = []
             
             # Debug: inspect the results object
@@ -360,73 +618,110 @@ class SemanticScholarScraper:
                 print(f"[DEBUG] First paper title: {getattr(papers[0], 'title', 'N/A')[:60] if papers else 'N/A'}")
             return papers
 
-        attempts = len(self.RATE_LIMIT_BACKOFF) + 1
-        for attempt in range(attempts):
-            try:
-                papers = await asyncio.to_thread(collect)
-                self.stats["api_calls"] += 1
-                
-                print(f"[DEBUG] 🔍 API returned {len(papers)} papers (fetch_limit was {fetch_limit}, target_count is {target_count})")
-                
-                # Sort by citation count descending to get top-cited papers
-                papers.sort(
-                    key=lambda paper: getattr(paper, "citationCount", 0) or 0,
-                    reverse=True,
+        try:
+            # Use get_author_papers - it doesn't support sorting but returns all papers
+            # We'll sort by citations after fetching
+            results = await self._api_call(
+                lambda: self.sch.get_author_papers(
+                    author_id,
+                    fields=fields,
+                    limit=min(fetch_limit, self.LISTING_PAGE_SIZE),
                 )
-                
-                # Return the top papers up to target_count
-                result = papers[:target_count]
-                print(f"[DEBUG] 📦 Returning {len(result)} papers (limited to target_count={target_count})")
-                return result
-            except SemanticScholarException as exc:
-                status = getattr(exc, "status", None)
-                if status == 429 and attempt < len(self.RATE_LIMIT_BACKOFF):
-                    wait = self.RATE_LIMIT_BACKOFF[attempt]
-                    self._log(f"Rate limit reached. Retrying in {wait}s…", "WARN")
-                    time.sleep(wait)
-                    continue
-                raise
+            )
+        except SemanticScholarException:
+            raise
+        except Exception as exc:
+            self._log(f"Error fetching papers: {exc}", "ERROR")
+            return []
+
+        papers = collect(results)
+        # Further pages come from the client's public iterator, which replays the
+        # first page and then fetches one more page each time it runs past the end
+        # of the last. Pulling a page at a time keeps every request rate limited
+        # and counted like any other call; a short page means the listing is done.
+        page_size = min(fetch_limit, self.LISTING_PAGE_SIZE)
+        listing = iter(results)
+        next(islice(listing, len(papers), len(papers)), None)
+        page = papers
+        while len(page) == page_size and len(papers) < fetch_limit:
+            try:
+                page = await self._api_call(lambda: list(islice(listing, page_size)))
             except Exception as exc:
-                self._log(f"Error fetching papers: {exc}", "ERROR")
+                self._log(f"Error fetching more papers, keeping {len(papers)}: {exc}", "WARN")
                 break
+            if not page:
+                # The iterator saw there was no next page without asking the API
+                self.stats["api_calls"] -= 1
+            papers.extend(page)
+        papers = papers[:fetch_limit]
 
-        return []
-
-    def _load_cached_results(self, author_id: str, allow_stale: bool = False) -> Optional[List[Dict]]:
-        try:
-            cache_raw = self.CACHE_PATH.read_text()
-            cache = json.loads(cache_raw)
-        except FileNotFoundError:
-            return None
-        except Exception as exc:
-            self._log(f"Failed to read cache: {exc}", "WARN")
-            return None
+        print(f"[DEBUG] 🔍 API returned {len(papers)} papers (fetch_limit was {fetch_limit}, target_count is {target_count})")
+        
+        # Sort by citation count descending to get top-cited papers
+        papers.sort(
+            key=lambda paper: getattr(paper, "citationCount", 0) or 0,
+            reverse=True,
+        )
+        
+        # Return the top papers up to target_count
+        result = papers[:target_count]
+        print(f"[DEBUG] 📦 Returning {len(result)} papers (limited to target_count={target_count})")
+        return result
 
-        entry = cache.get(author_id)
-        if not entry:
+    async def _serve_from_cache(self, author_id: str) -> Optional[List[Dict]]:
+        """Return cached papers for a fresh or stale hit, refreshing stale ones in the background."""
+        status, entry = await asyncio.to_thread(
+            self.result_cache.lookup,
+            author_id,
+            self.max_papers,
+            self.CACHE_TTL_SECONDS,
+            self.CACHE_STALE_TTL_SECONDS,
+        )
+        self.cache_status = status
+        if entry is None:
             return None
 
-        timestamp = entry.get("timestamp", 0)
-        age = time.time() - timestamp
-        if age > self.CACHE_TTL_SECONDS and not allow_stale:
-            return None
+        self.cache_age = entry.age
+        papers = entry.papers
+        self._log(f"Serving {status} cached results for {author_id} ({int(entry.age)}s old)", "SUCCESS")
+        if status == STALE:
+            self._schedule_refresh(author_id)
+        if self.collect_debug:
+            self.debug_records = entry.payload.get("debug_records", [])
+        self.stats["papers_found"] = len(papers)
+        self._print_progress(100, 100, "Completed")
+        return papers
 
-        return entry.get("papers", [])
+    def _schedule_refresh(self, author_id: str) -> None:
+        """Re-scrape an author in the background and overwrite the stale cache entry."""
+        key = (author_id, self.max_papers)
+        if key in _background_refreshes:
+            return
+        refresher = SemanticScholarScraper(
+            api_key=self.api_key,
+            max_papers=self.max_papers,
+            collect_debug=self.collect_debug,
+            search_buffer=self.search_buffer,
+            min_top_results=self.min_top_results,
+            concurrency=self.concurrency,
+            race_strategies=self.race_strategies,
+            incremental=True,
+            browser_pool=None if self._owns_browser_pool else self._browser_pool,
+            rate_limiter=self._rate_limiter,
+            validation_cache=self.validation_cache,
+            result_cache=self.result_cache,
+        )
+        refresher._read_cache = False
+        task = asyncio.create_task(refresher.scrape_profile(author_id))
+        _background_refreshes[key] = task
+        task.add_done_callback(lambda _: _background_refreshes.pop(key, None))
 
-    def _save_cached_results(self, author_id: str, papers: List[Dict]) -> None:
-        try:
-            cache = json.loads(self.CACHE_PATH.read_text())
-        except FileNotFoundError:
-            cache = {}
-        except Exception:
-            cache = {}
-
-        self.CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        cache[author_id] = {
-            "timestamp": time.time(),
-            "papers": papers,
-        }
-        self.CACHE_PATH.write_text(json.dumps(cache, indent=2))
+    @staticmethod
+    async def wait_for_background_refreshes() -> None:
+        """Wait for pending stale-cache refreshes (used by the CLI before exiting)."""
+        pending = list(_background_refreshes.values())
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
     def _create_semantic_scholar_url(self, paper_id: str, title: str = "") -> str:
         """
@@ -459,10 +754,10 @@ class SemanticScholarScraper:
                 slug = slug[:60].rstrip('-')
             # URL-encode the slug (handles special characters like colons as %3A)
             slug = quote(slug, safe='-')
-            return f"https://www.semanticscholar.org/paper/{slug}/{paper_id}"
+            return f"{self.base_urls['paper_page']}/paper/{slug}/{paper_id}"
         else:
             # Fallback to ID-only format if no title
-            return f"https://www.semanticscholar.org/paper/{paper_id}"
+            return f"{self.base_urls['paper_page']}/paper/{paper_id}"
 
     async def _scroll_and_reveal_content(self, page, paper_id: str) -> None:
         """Scroll to trigger lazy loading of PDF buttons."""
@@ -567,36 +862,22 @@ class SemanticScholarScraper:
         if not pdf_url or not pdf_url.startswith('http'):
             return False
         
-        # Check cache first
+        # Check the run-local cache first, then the persistent one
         if pdf_url in self._validation_cache:
             return self._validation_cache[pdf_url]
+        cached = await asyncio.to_thread(self.validation_cache.get, pdf_url)
+        if cached is not None:
+            self.stats["validation_cache_hits"] += 1
+            if cached != TRANSIENT:
+                self._validation_cache[pdf_url] = cached == VALID
+            return cached == VALID
         
+        status = None
         try:
             # Use HEAD request to check if link is accessible (faster than GET)
-            # First try with SSL verification
-            try:
-                response = await asyncio.to_thread(
-                    requests.head,
-                    pdf_url,
-                    allow_redirects=True,
-                    timeout=5,
-                    verify=True,
-                    headers={
-                        'User-Agent': 'Mozilla/5.0 (compatible; ScholarScraper/1.0)'
-                    }
-                )
-            except requests.exceptions.SSLError:
-                # If SSL verification fails, try without verification (some sites have self-signed certs)
-                response = await asyncio.to_thread(
-                    requests.head,
-                    pdf_url,
-                    allow_redirects=True,
-                    timeout=5,
-                    verify=False,
-                    headers={
-                        'User-Agent': 'Mozilla/5.0 (compatible; ScholarScraper/1.0)'
-                    }
-                )
+            # The client retries without SSL verification for self-signed certs
+            response = await self.http.head(pdf_url, timeout=5)
+            status = response.status_code
             
             # Check status code (200-399 is valid)
             is_valid_status = 200 <= response.status_code < 400
@@ -608,27 +889,34 @@ class SemanticScholarScraper:
             # Consider valid if status is good AND (Content-Type indicates PDF OR URL ends with .pdf)
             is_valid = is_valid_status and (is_pdf_content or pdf_url.lower().endswith('.pdf'))
             
-            # Cache the result
-            self._validation_cache[pdf_url] = is_valid
+            # Server errors and throttling say nothing about the link itself
+            if is_valid:
+                outcome = VALID
+            elif response.status_code >= 500 or response.status_code in (408, 429):
+                outcome = TRANSIENT
+            else:
+                outcome = INVALID
             
             if self.verbose:
                 self._log(f"PDF link validation: {pdf_url[:50]}... -> {response.status_code} (Content-Type: {content_type[:30]}) ({'valid' if is_valid else 'invalid'})", "DEBUG")
-            return is_valid
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             if self.verbose:
                 self._log(f"PDF link validation timeout: {pdf_url[:50]}...", "DEBUG")
-            self._validation_cache[pdf_url] = False
-            return False
-        except requests.exceptions.RequestException as exc:
+            outcome = TRANSIENT
+        except httpx.HTTPError as exc:
             if self.verbose:
                 self._log(f"PDF link validation error: {pdf_url[:50]}... -> {exc}", "DEBUG")
-            self._validation_cache[pdf_url] = False
-            return False
+            outcome = TRANSIENT
         except Exception as exc:
             if self.verbose:
                 self._log(f"PDF link validation unexpected error: {pdf_url[:50]}... -> {exc}", "DEBUG")
-            self._validation_cache[pdf_url] = False
-            return False
+            outcome = TRANSIENT
+        
+        # Cache the result; transient failures expire quickly and are not kept for this run
+        if outcome != TRANSIENT:
+            self._validation_cache[pdf_url] = outcome == VALID
+        await asyncio.to_thread(self.validation_cache.put, pdf_url, outcome, status)
+        return outcome == VALID
 
     async def _extract_pdf_from_paper_page(self, paper_id: str, title: str = "") -> str:
         """Scrape Semantic Scholar paper page using Playwright to find alternate PDF sources."""
@@ -637,10 +925,11 @@ class SemanticScholarScraper:
         # Diagnostic logging
         print(f"[PDF Extraction] 🔍 Attempting PDF extraction for paper: {paper_id}")
         print(f"[PDF Extraction] 📄 Paper URL: {paper_url}")
-        print(f"[PDF Extraction] 🤖 Playwright available: {PLAYWRIGHT_AVAILABLE}")
+        browser_ready = self._get_browser_pool().available
+        print(f"[PDF Extraction] 🤖 Playwright available: {browser_ready}")
         
         # Try Playwright first if available
-        if PLAYWRIGHT_AVAILABLE:
+        if browser_ready:
             print(f"[PDF Extraction] 🚀 Starting Playwright browser for {paper_id}")
             try:
                 # Add overall timeout to prevent hanging (30 seconds max)
@@ -660,37 +949,10 @@ class SemanticScholarScraper:
         return ""
     
     async def _scrape_with_playwright(self, paper_id: str, paper_url: str) -> str:
-        """Internal method to handle Playwright scraping with proper cleanup and timeouts."""
-        browser = None
+        """Internal method to handle Playwright scraping with a pooled page and timeouts."""
         try:
-            # Use context manager approach (recommended by Playwright)
-            async with async_playwright() as playwright:
-                browser = await asyncio.wait_for(
-                    playwright.chromium.launch(
-                        headless=True,
-                        args=[
-                            '--disable-blink-features=AutomationControlled',
-                            '--disable-dev-shm-usage',
-                            '--no-sandbox',
-                        ],
-                        timeout=10000,  # 10 second timeout for browser launch
-                    ),
-                    timeout=12.0
-                )
-                
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                )
-                page = await context.new_page()
-                
-                # Remove webdriver detection
-                await page.add_init_script("""
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined
-                    });
-                """)
-                
+            # Borrow an isolated page from the shared pool instead of launching Chromium per paper
+            async with self._get_browser_pool().page() as page:
                 # Navigate with timeout
                 try:
                     response = await asyncio.wait_for(
@@ -771,15 +1033,7 @@ class SemanticScholarScraper:
                 self._log(f"Error scraping paper page {paper_id}: {exc}", "DEBUG")
                 self._log(f"Error details: {error_details}", "DEBUG")
             return ""
-        finally:
-            # Ensure browser is closed
-            try:
-                if browser:
-                    await browser.close()
-                    print(f"[PDF Extraction] ✅ Browser closed for {paper_id}")
-            except Exception as close_exc:
-                print(f"[PDF Extraction] ⚠️  Error closing browser: {close_exc}")
-    
+
     async def _extract_all_pdf_links_simple(self, page, paper_id: str) -> List[str]:
         """Extract PDF links using simplified strategies (faster, less likely to hang)."""
         found_links = []
@@ -956,7 +1210,7 @@ class SemanticScholarScraper:
                         # Convert to PDF URL if it's an abstract page
                         if '/abs/' in href:
                             arxiv_id = href.split('/abs/')[-1].split('/')[0]
-                            pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+                            pdf_url = f"{self.base_urls['arxiv']}/pdf/{arxiv_id}.pdf"
                             found_links.append(pdf_url)
                         elif '/pdf/' in href:
                             found_links.append(href)
@@ -987,7 +1241,7 @@ class SemanticScholarScraper:
                 if arxiv_id:
                     # Clean arXiv ID (remove version number if present)
                     arxiv_id = arxiv_id.split('v')[0]
-                    pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+                    pdf_url = f"{self.base_urls['arxiv']}/pdf/{arxiv_id}.pdf"
                     # Validate the arXiv PDF link
                     if await self._validate_pdf_link(pdf_url):
                         if self.verbose:
@@ -1013,16 +1267,12 @@ class SemanticScholarScraper:
                     
                     # Try Unpaywall API (free, legitimate, open-access only)
                     # Email is required by Unpaywall for their records (not verified)
-                    unpaywall_url = f"https://api.unpaywall.org/v2/{doi}?email=scraper@scholar-scraper.local"
+                    unpaywall_url = f"{self.base_urls['unpaywall']}/v2/{doi}?email=scraper@scholar-scraper.local"
                     try:
-                        response = await asyncio.to_thread(
-                            requests.get,
+                        response = await self.http.get(
                             unpaywall_url,
                             timeout=5,
-                            headers={
-                                'User-Agent': 'Mozilla/5.0 (compatible; ScholarScraper/1.0)',
-                                'Accept': 'application/json'
-                            }
+                            headers={'Accept': 'application/json'}
                         )
                         if response.status_code == 200:
                             print(f"[Unpaywall] ✅ API response OK for DOI {doi}")
@@ -1048,10 +1298,10 @@ class SemanticScholarScraper:
                                 if not is_oa:
                                     print(f"[Unpaywall] ⚠️  Paper with DOI {doi} is not open-access")
                                     self._log(f"Paper with DOI {doi} is not open-access", "DEBUG")
-                    except requests.exceptions.Timeout:
+                    except httpx.TimeoutException:
                         if self.verbose:
                             self._log(f"Unpaywall API timeout for DOI {doi}", "DEBUG")
-                    except requests.exceptions.RequestException as exc:
+                    except httpx.HTTPError as exc:
                         if self.verbose:
                             self._log(f"Unpaywall API error for {doi}: {exc}", "DEBUG")
                     except Exception as exc:
@@ -1061,16 +1311,10 @@ class SemanticScholarScraper:
                     # Fallback: Try DOI.org redirect (may lead to publisher PDF)
                     # Note: Most DOIs redirect to publisher pages, not direct PDFs
                     # But we can check if the redirect leads to a PDF
-                    doi_url = f"https://doi.org/{doi}"
+                    doi_url = f"{self.base_urls['doi']}/{doi}"
                     try:
-                        response = await asyncio.to_thread(
-                            requests.head,
-                            doi_url,
-                            allow_redirects=True,
-                            timeout=3,
-                            headers={'User-Agent': 'Mozilla/5.0 (compatible; ScholarScraper/1.0)'}
-                        )
-                        final_url = response.url
+                        response = await self.http.head(doi_url, timeout=3)
+                        final_url = str(response.url)
                         content_type = response.headers.get('Content-Type', '').lower()
                         # Check if redirect leads to PDF
                         if 'application/pdf' in content_type or final_url.lower().endswith('.pdf'):
@@ -1088,6 +1332,164 @@ class SemanticScholarScraper:
                 self._log(f"Error extracting DOI PDF: {exc}", "DEBUG")
             return None
 
+    async def _run_pdf_strategies(self, strategies: List[Callable]) -> str:
+        """Try PDF discovery tiers one after another and return the first hit."""
+        for strategy in strategies:
+            link = await strategy()
+            if link:
+                return link
+        return ""
+
+    async def _race_pdf_strategies(self, strategies: List[Callable]) -> str:
+        """Run PDF discovery tiers concurrently and return the highest-priority hit.
+
+        A lower tier only wins once every tier above it has come back empty.
+        As soon as any tier finds a link, every tier ranked below it is
+        cancelled, whether or not the tiers above have finished.
+        """
+        tasks = [asyncio.create_task(strategy()) for strategy in strategies]
+        best: Optional[int] = None
+        links = [""] * len(tasks)
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index = tasks.index(task)
+                    if task.cancelled() or (best is not None and index > best):
+                        continue
+                    try:
+                        link = task.result()
+                    except Exception as exc:  # pylint: disable=broad-except
+                        print(f"[PDF Extraction] ⚠️  Strategy failed: {exc}")
+                        continue
+                    if link:
+                        best, links[index] = index, link
+                        for lower in tasks[index + 1:]:
+                            lower.cancel()
+                        pending.difference_update(tasks[index + 1:])
+                if best is not None and all(task.done() for task in tasks[:best]):
+                    return links[best]
+            return links[best] if best is not None else ""
+        finally:
+            unfinished = [task for task in tasks if not task.done()]
+            for task in unfinished:
+                task.cancel()
+            if unfinished:
+                await asyncio.gather(*unfinished, return_exceptions=True)
+
+    async def _pdf_from_open_access(self, paper) -> str:
+        """Tier 1: the openAccessPdf URL from the author listing, if it validates."""
+        download_link = ""
+        try:
+            open_access_pdf = getattr(paper, "openAccessPdf", None)
+
+            print(f"[Paper Processing] 📥 Checking openAccessPdf from API...")
+            # Debug: log what we're getting
+            if open_access_pdf:
+                print(f"[Paper Processing] ✅ openAccessPdf present: {type(open_access_pdf)}")
+                if self.verbose:
+                    self._log(f"openAccessPdf type: {type(open_access_pdf)}, value: {open_access_pdf}", "DEBUG")
+            else:
+                print(f"[Paper Processing] ❌ No openAccessPdf in API response")
+
+            if open_access_pdf:
+                # Handle both dict and object cases
+                if isinstance(open_access_pdf, dict):
+                    download_link = open_access_pdf.get("url", "") or ""
+                elif hasattr(open_access_pdf, "url"):
+                    download_link = getattr(open_access_pdf, "url", "") or ""
+                elif isinstance(open_access_pdf, str):
+                    # Sometimes it might be a direct URL string
+                    download_link = open_access_pdf
+
+                # Only count if we have a non-empty URL
+                if download_link and download_link.strip():
+                    print(f"[Paper Processing] 🔗 openAccessPdf URL: {download_link[:70]}...")
+                    # Validate the link before counting it
+                    try:
+                        is_valid = await self._validate_pdf_link(download_link)
+                        print(f"[Paper Processing] ✓ Validation result: {'VALID' if is_valid else 'INVALID'}")
+                        if is_valid:
+                            print(f"[Paper Processing] ✅ Using openAccessPdf URL")
+                        else:
+                            # Link is dead/invalid, reset to empty
+                            print(f"[Paper Processing] ❌ openAccessPdf URL failed validation, trying alternatives...")
+                            if self.verbose:
+                                self._log(f"openAccessPdf URL failed validation: {download_link[:60]}...", "DEBUG")
+                            download_link = ""
+                    except Exception as val_exc:
+                        print(f"[Paper Processing] ⚠️  Validation error: {val_exc}, trying alternatives...")
+                        download_link = ""
+                else:
+                    # Reset to empty string if URL is empty/missing
+                    download_link = ""
+                    print(f"[Paper Processing] ⚠️  openAccessPdf present but URL is empty, trying alternatives...")
+                    if self.verbose:
+                        self._log(f"openAccessPdf present but URL is empty. Status: {open_access_pdf.get('status', 'N/A') if isinstance(open_access_pdf, dict) else 'N/A'}", "DEBUG")
+        except Exception as pdf_exc:
+            print(f"[Paper Processing] ⚠️  Error in initial PDF extraction: {pdf_exc}, continuing with alternatives...")
+            if self.verbose:
+                self._log(f"Error in initial PDF extraction: {pdf_exc}", "DEBUG")
+            download_link = ""
+        return download_link
+
+    async def _pdf_from_paper_details(self, full_paper) -> str:
+        """Tier 2: the openAccessPdf URL from batch-fetched paper details."""
+        download_link = ""
+        if full_paper is not None:
+            try:
+                # Check if full paper has openAccessPdf
+                full_oa_pdf = getattr(full_paper, "openAccessPdf", None)
+                if full_oa_pdf:
+                    if isinstance(full_oa_pdf, dict):
+                        full_url = full_oa_pdf.get("url", "") or ""
+                    elif hasattr(full_oa_pdf, "url"):
+                        full_url = getattr(full_oa_pdf, "url", "") or ""
+                    else:
+                        full_url = ""
+
+                    if full_url and full_url.strip():
+                        # Validate the link before using it
+                        try:
+                            if await self._validate_pdf_link(full_url):
+                                download_link = full_url
+                                if self.verbose:
+                                    self._log(f"Found valid PDF link from full paper details: {full_url[:60]}...", "SUCCESS")
+                        except Exception:
+                            pass
+            except Exception as exc:
+                # Silently fail - alternate source fetch is optional
+                if self.verbose:
+                    self._log(f"Could not fetch full paper details for alternate sources: {exc}", "DEBUG")
+        return download_link
+
+    async def _pdf_from_arxiv(self, ids_source, paper_id: str) -> str:
+        """Tier 3: arXiv PDF conversion (fast, no API calls)."""
+        try:
+            print(f"[PDF Extraction] 🔬 Trying arXiv extraction for {paper_id}")
+            arxiv_pdf = await self._extract_arxiv_pdf(ids_source)
+            if arxiv_pdf:
+                print(f"[PDF Extraction] ✅ Found arXiv PDF: {arxiv_pdf[:60]}...")
+                return arxiv_pdf
+            print(f"[PDF Extraction] ❌ No arXiv PDF found for {paper_id}")
+        except Exception as arxiv_exc:
+            print(f"[PDF Extraction] ⚠️  Error in arXiv extraction: {arxiv_exc}")
+        return ""
+
+    async def _pdf_from_doi(self, ids_source, paper_id: str) -> str:
+        """Tier 4: Unpaywall, then the doi.org redirect."""
+        try:
+            print(f"[PDF Extraction] 🔍 Trying Unpaywall/DOI extraction for {paper_id}")
+            doi_pdf = await self._extract_doi_pdf(ids_source)
+            if doi_pdf:
+                print(f"[PDF Extraction] ✅ Found PDF via DOI: {doi_pdf[:60]}...")
+                return doi_pdf
+            print(f"[PDF Extraction] ❌ No PDF found via DOI for {paper_id}")
+        except Exception as doi_exc:
+            print(f"[PDF Extraction] ⚠️  Error in DOI extraction: {doi_exc}")
+        return ""
+
     async def _extract_paper_metadata(self, paper) -> Optional[Dict]:
         """Convert an API paper object into the structure used by the HTML generator."""
         try:
@@ -1153,122 +1555,33 @@ class SemanticScholarScraper:
             download_link = ""
             paper_id = getattr(paper, "paperId", "")
             
-            try:
-                open_access_pdf = getattr(paper, "openAccessPdf", None)
-                
-                print(f"[Paper Processing] 📥 Checking openAccessPdf from API...")
-                # Debug: log what we're getting
-                if open_access_pdf:
-                    print(f"[Paper Processing] ✅ openAccessPdf present: {type(open_access_pdf)}")
-                    if self.verbose:
-                        self._log(f"openAccessPdf type: {type(open_access_pdf)}, value: {open_access_pdf}", "DEBUG")
-                else:
-                    print(f"[Paper Processing] ❌ No openAccessPdf in API response")
-                
-                if open_access_pdf:
-                    # Handle both dict and object cases
-                    if isinstance(open_access_pdf, dict):
-                        download_link = open_access_pdf.get("url", "") or ""
-                    elif hasattr(open_access_pdf, "url"):
-                        download_link = getattr(open_access_pdf, "url", "") or ""
-                    elif isinstance(open_access_pdf, str):
-                        # Sometimes it might be a direct URL string
-                        download_link = open_access_pdf
-                    
-                    # Only count if we have a non-empty URL
-                    if download_link and download_link.strip():
-                        print(f"[Paper Processing] 🔗 openAccessPdf URL: {download_link[:70]}...")
-                        # Validate the link before counting it
-                        try:
-                            is_valid = await self._validate_pdf_link(download_link)
-                            print(f"[Paper Processing] ✓ Validation result: {'VALID' if is_valid else 'INVALID'}")
-                            if is_valid:
-                                print(f"[Paper Processing] ✅ Using openAccessPdf URL")
-                                self.stats["download_links_found"] += 1
-                            else:
-                                # Link is dead/invalid, reset to empty
-                                print(f"[Paper Processing] ❌ openAccessPdf URL failed validation, trying alternatives...")
-                                if self.verbose:
-                                    self._log(f"openAccessPdf URL failed validation: {download_link[:60]}...", "DEBUG")
-                                download_link = ""
-                        except Exception as val_exc:
-                            print(f"[Paper Processing] ⚠️  Validation error: {val_exc}, trying alternatives...")
-                            download_link = ""
-                    else:
-                        # Reset to empty string if URL is empty/missing
-                        download_link = ""
-                        print(f"[Paper Processing] ⚠️  openAccessPdf present but URL is empty, trying alternatives...")
-                        if self.verbose:
-                            self._log(f"openAccessPdf present but URL is empty. Status: {open_access_pdf.get('status', 'N/A') if isinstance(open_access_pdf, dict) else 'N/A'}", "DEBUG")
-            except Exception as pdf_exc:
-                print(f"[Paper Processing] ⚠️  Error in initial PDF extraction: {pdf_exc}, continuing with alternatives...")
-                if self.verbose:
-                    self._log(f"Error in initial PDF extraction: {pdf_exc}", "DEBUG")
-                download_link = ""
-            
-            # If no PDF link found, try fetching full paper details for alternate sources
-            if not download_link and paper_id:
+            # Paper details resolved by the batch stage
+            full_paper = None
+            if paper_id:
                 try:
-                    # Fetch full paper details which may include alternate PDF sources
-                    full_paper = await asyncio.to_thread(
-                        self.sch.get_paper,
-                        paper_id,
-                        fields=["openAccessPdf", "externalIds"]
-                    )
-                    self.stats["api_calls"] += 1
-                    
-                    # Check if full paper has openAccessPdf
-                    full_oa_pdf = getattr(full_paper, "openAccessPdf", None)
-                    if full_oa_pdf:
-                        if isinstance(full_oa_pdf, dict):
-                            full_url = full_oa_pdf.get("url", "") or ""
-                        elif hasattr(full_oa_pdf, "url"):
-                            full_url = getattr(full_oa_pdf, "url", "") or ""
-                        else:
-                            full_url = ""
-                        
-                        if full_url and full_url.strip():
-                            # Validate the link before using it
-                            try:
-                                if await self._validate_pdf_link(full_url):
-                                    download_link = full_url
-                                    self.stats["download_links_found"] += 1
-                                    if self.verbose:
-                                        self._log(f"Found valid PDF link from full paper details: {full_url[:60]}...", "SUCCESS")
-                            except Exception:
-                                pass
+                    full_paper = await self._get_paper_details(paper_id)
                 except Exception as exc:
                     # Silently fail - alternate source fetch is optional
                     if self.verbose:
                         self._log(f"Could not fetch full paper details for alternate sources: {exc}", "DEBUG")
+            # Details may carry identifiers the author listing omitted
+            ids_source = paper
+            if full_paper is not None and not getattr(paper, "externalIds", None):
+                ids_source = full_paper
             
-            # Phase 3: Try arXiv PDF conversion (fast, no API calls)
-            if not download_link:
-                try:
-                    print(f"[PDF Extraction] 🔬 Trying arXiv extraction for {paper_id}")
-                    arxiv_pdf = await self._extract_arxiv_pdf(paper)
-                    if arxiv_pdf:
-                        print(f"[PDF Extraction] ✅ Found arXiv PDF: {arxiv_pdf[:60]}...")
-                        download_link = arxiv_pdf
-                        self.stats["download_links_found"] += 1
-                    else:
-                        print(f"[PDF Extraction] ❌ No arXiv PDF found for {paper_id}")
-                except Exception as arxiv_exc:
-                    print(f"[PDF Extraction] ⚠️  Error in arXiv extraction: {arxiv_exc}")
-            
-            # Phase 4: Try DOI-based PDF (skip if arXiv found)
-            if not download_link:
-                try:
-                    print(f"[PDF Extraction] 🔍 Trying Unpaywall/DOI extraction for {paper_id}")
-                    doi_pdf = await self._extract_doi_pdf(paper)
-                    if doi_pdf:
-                        print(f"[PDF Extraction] ✅ Found PDF via DOI: {doi_pdf[:60]}...")
-                        download_link = doi_pdf
-                        self.stats["download_links_found"] += 1
-                    else:
-                        print(f"[PDF Extraction] ❌ No PDF found via DOI for {paper_id}")
-                except Exception as doi_exc:
-                    print(f"[PDF Extraction] ⚠️  Error in DOI extraction: {doi_exc}")
+            # Cheap tiers: openAccessPdf, paper details, arXiv, then Unpaywall/doi.org
+            strategies = [
+                lambda: self._pdf_from_open_access(paper),
+                lambda: self._pdf_from_paper_details(full_paper),
+                lambda: self._pdf_from_arxiv(ids_source, paper_id),
+                lambda: self._pdf_from_doi(ids_source, paper_id),
+            ]
+            if self.race_strategies:
+                download_link = await self._race_pdf_strategies(strategies)
+            else:
+                download_link = await self._run_pdf_strategies(strategies)
+            if download_link:
+                self.stats["download_links_found"] += 1
             
             # Fallback: If still no PDF link, scrape Semantic Scholar page for alternate sources
             if not download_link and paper_id:
@@ -1418,5 +1731,10 @@ class SemanticScholarScraper:
             "max_papers": self.max_papers,
             "api_key_used": bool(self.api_key),
             "sorted_by_citations": True,
+            "cache": {
+                "status": self.cache_status,
+                "age_seconds": round(self.cache_age, 1) if self.cache_age is not None else None,
+                **self.result_cache.stats,
+            },
         }
 
@@ -1,85 +1,158 @@
 import asyncio
 import json
 import os
-import subprocess
+import queue
 import sys
+import time
 import traceback
 import urllib.parse
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, HttpUrl
 
-from extractor import PaperExtractor
+from artifacts import ArtifactRetention, ArtifactWriter, PrecompressedStaticFiles, write_artifact
+from browser_pool import BrowserPool, probe_chromium
 from html_generator import HTMLGenerator
+from job_scheduler import JobScheduler, QueueFullError
+from job_store import FINISHED_STATUSES, job_store_from_env
+from result_cache import default_result_cache
 from semantic_scholar_scraper import SemanticScholarScraper
+from validation_cache import default_validation_cache
+from worker import DONE_EVENT, create_worker_pool, execute_scrape, run_in_worker
 
 BASE_DIR = Path(__file__).parent
 WEB_DIR = BASE_DIR / "web"
 ARTIFACT_DIR = BASE_DIR / "artifacts"
 HTML_DIR = ARTIFACT_DIR / "html"
 DEBUG_DIR = ARTIFACT_DIR / "debug"
+ASSET_DIR = ARTIFACT_DIR / "assets"
 
-for folder in (HTML_DIR, DEBUG_DIR):
+for folder in (HTML_DIR, DEBUG_DIR, ASSET_DIR):
     folder.mkdir(parents=True, exist_ok=True)
 
+
+def _publish_checklist_assets() -> Optional[Dict[str, str]]:
+    """Write the shared checklist CSS/JS once under content-hashed names.
+
+    Returns the URLs generated checklists should link to, or None when
+    ``HTML_ASSET_MODE=inline`` asks for self-contained files.
+    """
+    if os.getenv("HTML_ASSET_MODE", "external").lower() == "inline":
+        return None
+    urls = {}
+    for kind, (filename, content) in HTMLGenerator.asset_files().items():
+        path = ASSET_DIR / filename
+        if not path.exists():
+            write_artifact(path, content)
+        urls[kind] = f"/artifacts/assets/{filename}"
+    return urls
+
+
+checklist_asset_urls = _publish_checklist_assets()
+
+# Bounds artifact disk use by age, total size and newest-per-author; see ARTIFACT_*
+artifact_retention = ArtifactRetention.from_env([HTML_DIR, DEBUG_DIR])
+# Finished jobs keep their artifacts at least this long, whatever the budget says
+ARTIFACT_PROTECT_SECONDS = float(os.getenv("ARTIFACT_PROTECT_SECONDS", "3600"))
+
 app = FastAPI(title="Scholar Scraper UI")
 
+# One pool of long-lived Chromium instances shared by every scrape job,
+# disabled until the startup readiness check has passed
+browser_pool = BrowserPool.from_env()
+browser_pool.available = False
+
 app.mount("/static", StaticFiles(directory=WEB_DIR), name="static")
-app.mount("/artifacts", StaticFiles(directory=ARTIFACT_DIR), name="artifacts")
+app.mount("/artifacts", PrecompressedStaticFiles(directory=ARTIFACT_DIR), name="artifacts")
 
 
-async def _ensure_playwright_browsers():
-    """Ensure Playwright browsers are installed, install if missing."""
-    try:
-        # First, try to get the executable path to check if browsers actually exist
-        browser_exists = False
+@app.on_event("startup")
+async def startup_event():
+    """Start the job workers and check Playwright in the background."""
+    interrupted = jobs.mark_interrupted()
+    if interrupted:
+        print(f"[Startup] ⚠️  Marked {interrupted} job(s) from the previous run as interrupted")
+    # Installing Chromium can take minutes on a cold start; serve requests meanwhile
+    # and keep the browser tier off until the check passes.
+    app.state.playwright_check = asyncio.create_task(_prepare_browser_pool())
+    scheduler.start()
+    app.state.job_eviction = asyncio.create_task(_evict_jobs_periodically())
+    app.state.artifact_gc = asyncio.create_task(artifact_retention.run_periodically(_protected_artifacts))
+    app.state.cache_purge = asyncio.create_task(_purge_caches_periodically())
+    if worker_pool is not None:
+        app.state.worker_relay = asyncio.create_task(_relay_worker_events())
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the job workers and close the shared browser pool."""
+    app.state.job_eviction.cancel()
+    app.state.artifact_gc.cancel()
+    app.state.cache_purge.cancel()
+    app.state.playwright_check.cancel()
+    await scheduler.stop()
+    if worker_pool is not None:
+        app.state.worker_relay.cancel()
+        worker_pool.shutdown(wait=False, cancel_futures=True)
+    await browser_pool.close()
+    jobs.close()
+
+
+def _protected_artifacts() -> Set[str]:
+    """Artifact names that queued, running or recently finished jobs still point at."""
+    cutoff = time.time() - ARTIFACT_PROTECT_SECONDS
+    protected: Set[str] = set()
+    for job in jobs.values():
+        finished_at = job.get("finished_at")
+        if finished_at is None or finished_at >= cutoff:
+            protected.update(job.get("artifacts", []))
+    return protected
+
+
+async def _prepare_browser_pool() -> None:
+    """Run the readiness check, then keep a warm browser if BROWSER_WARM_START is set."""
+    if await browser_pool.ensure_ready() and browser_pool.warm_start:
+        await browser_pool.keep_warm()
+
+
+async def _evict_jobs_periodically() -> None:
+    """Keep the job store bounded on long-running instances."""
+    while True:
+        await asyncio.sleep(JOB_EVICTION_INTERVAL_SECONDS)
         try:
-            from playwright.sync_api import sync_playwright
-            with sync_playwright() as p:
-                browser_path = p.chromium.executable_path
-                if browser_path and Path(browser_path).exists():
-                    print(f"[Startup] ✅ Playwright browsers already installed at: {browser_path}")
-                    browser_exists = True
-                else:
-                    print(f"[Startup] ⚠️  Browser executable not found at: {browser_path}")
-        except Exception as check_exc:
-            print(f"[Startup] ⚠️  Could not check browser path: {check_exc}")
-        
-        if not browser_exists:
-            # Browsers don't exist, install them
-            print("[Startup] Installing Playwright browsers...")
-            install_result = subprocess.run(
-                ["playwright", "install", "chromium"],
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
-            )
-            if install_result.returncode == 0:
-                print("[Startup] ✅ Playwright browsers installed successfully")
-                if install_result.stdout:
-                    print(f"[Startup] Installation output: {install_result.stdout[:500]}")
-            else:
-                print(f"[Startup] ⚠️  Browser installation failed (exit code: {install_result.returncode})")
-                if install_result.stderr:
-                    print(f"[Startup] Error: {install_result.stderr[:500]}")
-                if install_result.stdout:
-                    print(f"[Startup] Output: {install_result.stdout[:500]}")
-    except Exception as exc:
-        print(f"[Startup] ⚠️  Could not check/install browsers: {exc}")
-        import traceback
-        print(f"[Startup] Traceback: {traceback.format_exc()}")
+            removed = jobs.evict_expired()
+        except Exception:  # pylint: disable=broad-except
+            traceback.print_exc()
+            continue
+        if removed:
+            print(f"🧹 Evicted {removed} finished job(s) past retention")
+
+
+def _purge_caches() -> Dict[str, int]:
+    """Delete expired cache rows so the SQLite files don't grow without bound."""
+    return {
+        "validation": default_validation_cache().purge_expired(),
+        # Past the stale window an entry can no longer be served, even while refreshing
+        "results": default_result_cache().purge_older_than(SemanticScholarScraper.CACHE_STALE_TTL_SECONDS),
+    }
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Ensure Playwright browsers are installed on startup."""
-    await _ensure_playwright_browsers()
+async def _purge_caches_periodically() -> None:
+    """Purge once at startup and then every ``CACHE_PURGE_INTERVAL_SECONDS``."""
+    while True:
+        try:
+            removed = await asyncio.to_thread(_purge_caches)
+            if any(removed.values()):
+                print(f"🧹 Purged expired cache rows: {removed}")
+        except Exception:  # pylint: disable=broad-except
+            traceback.print_exc()
+        await asyncio.sleep(CACHE_PURGE_INTERVAL_SECONDS)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -90,9 +163,130 @@ async def index() -> str:
 class ScrapeRequest(BaseModel):
     profile_url: HttpUrl
     max_papers: int = Field(50, ge=1, le=1000)
+    concurrency: int = Field(SemanticScholarScraper.DEFAULT_CONCURRENCY, ge=1, le=16)
+    use_cache: bool = True
+    race_strategies: bool = False
+    incremental: bool = False
+
+
+# Memory (default) or SQLite, see JOB_STORE; finished jobs expire after JOB_RETENTION_SECONDS
+jobs = job_store_from_env()
+JOB_EVICTION_INTERVAL_SECONDS = 300.0
+CACHE_PURGE_INTERVAL_SECONDS = float(os.getenv("CACHE_PURGE_INTERVAL_SECONDS", str(6 * 60 * 60)))
+
+# Open /api/events streams per job; each gets its own queue of (event, data) pairs
+job_subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+# Queued or running job per author and scrape options, and the jobs riding along on it
+inflight_jobs: Dict[Tuple[str, bool, bool, bool], str] = {}
+job_followers: Dict[str, List[str]] = {}
+
+# Progress fields a follower mirrors from the job it is attached to
+FOLLOWER_FIELDS = ("status", "stage", "percentage", "message", "queue_position")
+
+
+def _coalesce_key(author_id: str, use_cache: bool, race_strategies: bool, incremental: bool) -> Tuple[str, bool, bool, bool]:
+    """Jobs only share a scrape when every option that changes its result matches."""
+    return (author_id, use_cache, race_strategies, incremental)
+
+
+TERMINAL_STATUSES = FINISHED_STATUSES
+EVENT_QUEUE_SIZE = 100
+EVENT_KEEPALIVE_SECONDS = 15.0
+
+
+def _publish(job_id: str, event: str, data: Dict[str, Any]) -> None:
+    """Push an event to every stream watching ``job_id`` without blocking the scraper."""
+    for queue in job_subscribers.get(job_id, []):
+        if queue.full():
+            # A slow client only misses intermediate progress; later events carry the full state
+            queue.get_nowait()
+        queue.put_nowait((event, data))
+
+
+def _progress_snapshot(job: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        key: job.get(key)
+        for key in (
+            "status",
+            "stage",
+            "percentage",
+            "message",
+            "queue_position",
+            "papers_completed",
+            "papers_total",
+        )
+    }
+
+
+def _update_job(job_id: str, event: str = "progress", data: Dict[str, Any] = None, **fields: Any) -> None:
+    """Update a job's state and notify its event streams.
+
+    ``data`` overrides the payload sent with ``event``; by default subscribers
+    get the job's progress snapshot.
+    """
+    job = jobs[job_id]
+    job.update(fields)
+    jobs.save(job_id)
+    _publish(job_id, event, data if data is not None else _progress_snapshot(job))
+    for follower_id in job_followers.get(job_id, []):
+        _forward_to_follower(follower_id, event, data, fields)
+
+
+def _forward_to_follower(follower_id: str, event: str, data: Dict[str, Any], fields: Dict[str, Any]) -> None:
+    """Mirror a leader's update onto a coalesced job, trimmed to the follower's paper limit."""
+    follower = jobs.get(follower_id)
+    if follower is None:
+        return
+    if event == "paper":
+        if data["index"] >= follower["max_papers"]:
+            return
+        completed = follower["papers_completed"] + 1
+        total = min(data["papers_total"], follower["max_papers"])
+        _update_job(
+            follower_id,
+            event="paper",
+            data={**data, "papers_completed": completed, "papers_total": total},
+            papers_completed=completed,
+            papers_total=total,
+        )
+        return
+    mirrored = {key: value for key, value in fields.items() if key in FOLLOWER_FIELDS}
+    if event == "failed":
+        _update_job(follower_id, event="failed", data=data, error=fields.get("error"), **mirrored)
+    elif mirrored:
+        _update_job(follower_id, **mirrored)
+
+
+def _format_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
 
+def _terminal_event(job: Dict[str, Any]):
+    if job["status"] == "completed":
+        return "result", {"result": job.get("result")}
+    return "failed", {"error": job.get("error"), "message": job.get("message")}
 
-jobs: Dict[str, Dict[str, Any]] = {}
+
+def _refresh_queue_positions() -> None:
+    """Tell every waiting job where it now stands in the queue."""
+    for position, job_id in enumerate(scheduler.queued_ids, start=1):
+        if job_id in jobs and jobs[job_id].get("queue_position") != position:
+            _update_job(job_id, queue_position=position, message=f"Queued (position {position})")
+
+
+# Caps how many scrapes (and Chromium pages) run at once on a small instance
+scheduler = JobScheduler.from_env(on_queue_change=_refresh_queue_positions)
+
+# SCRAPE_WORKER_MODE=process runs scrapes in spawned worker processes, keeping
+# HTML rendering and artifact writes for large authors off the API event loop
+worker_pool = None
+worker_events = None
+# Set once a worker job's last relayed event has been applied
+worker_jobs_drained: Dict[str, asyncio.Event] = {}
+WORKER_DRAIN_TIMEOUT_SECONDS = 10.0
+if os.getenv("SCRAPE_WORKER_MODE", "inline").lower() == "process":
+    worker_pool, worker_events = create_worker_pool(scheduler.workers)
 
 
 def extract_author_id(profile_url: str) -> str:
@@ -114,23 +308,60 @@ async def start_scrape(request: ScrapeRequest) -> Dict[str, str]:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
     job_id = uuid.uuid4().hex
-    jobs[job_id] = {
+    job = {
         "status": "queued",
         "message": "Request accepted",
         "stage": "",
         "percentage": 0,
+        "queue_position": None,
+        "papers_completed": 0,
+        "papers_total": 0,
+        "author_id": author_id,
+        "max_papers": request.max_papers,
+        "coalesced_with": None,
         "result": None,
         "error": None,
     }
 
-    asyncio.create_task(
-        run_scrape_job(
+    # Ride along on an in-flight scrape of the same author and options if it covers enough papers
+    coalesce_key = _coalesce_key(author_id, request.use_cache, request.race_strategies, request.incremental)
+    leader_id = inflight_jobs.get(coalesce_key)
+    if leader_id is not None and jobs[leader_id]["max_papers"] >= request.max_papers:
+        leader = jobs[leader_id]
+        job.update({key: leader[key] for key in FOLLOWER_FIELDS})
+        job["coalesced_with"] = leader_id
+        jobs[job_id] = job
+        job_followers.setdefault(leader_id, []).append(job_id)
+        return {"job_id": job_id}
+
+    def job_factory():
+        return run_scrape_job(
             job_id=job_id,
             author_id=author_id,
             profile_url=str(request.profile_url),
             max_papers=request.max_papers,
+            concurrency=request.concurrency,
+            use_cache=request.use_cache,
+            race_strategies=request.race_strategies,
+            incremental=request.incremental,
         )
-    )
+
+    jobs[job_id] = job
+    try:
+        position = scheduler.submit(job_id, job_factory)
+    except QueueFullError as exc:
+        del jobs[job_id]
+        raise HTTPException(
+            status_code=429,
+            detail="Too many scrapes in progress. Please try again shortly.",
+            headers={"Retry-After": str(exc.retry_after)},
+        ) from exc
+    inflight_jobs[coalesce_key] = job_id
+    # A free worker may already have picked the job up
+    if job["status"] == "queued":
+        job["queue_position"] = position
+        job["message"] = f"Queued (position {position})"
+        jobs.save(job_id)
 
     return {"job_id": job_id}
 
@@ -143,6 +374,47 @@ async def scrape_status(job_id: str) -> Dict[str, Any]:
     return job
 
 
+@app.get("/api/events/{job_id}")
+async def scrape_events(job_id: str) -> StreamingResponse:
+    """Stream a job's progress as Server-Sent Events until it completes or fails."""
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_SIZE)
+    job_subscribers.setdefault(job_id, []).append(queue)
+
+    async def stream() -> AsyncIterator[str]:
+        try:
+            # Start from the current state so late subscribers don't wait for the next update
+            yield _format_event("progress", _progress_snapshot(job))
+            if job["status"] in TERMINAL_STATUSES:
+                yield _format_event(*_terminal_event(job))
+                return
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(queue.get(), EVENT_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield ": keepalive\n\n"
+                    continue
+                yield _format_event(event, data)
+                if event in ("result", "failed"):
+                    return
+        finally:
+            subscribers = job_subscribers.get(job_id, [])
+            if queue in subscribers:
+                subscribers.remove(queue)
+            if not subscribers:
+                job_subscribers.pop(job_id, None)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/api/diagnose/playwright")
 async def diagnose_playwright() -> Dict[str, Any]:
     """Diagnostic endpoint to test Playwright installation and browser availability."""
@@ -158,7 +430,7 @@ async def diagnose_playwright() -> Dict[str, Any]:
     
     # 1. Check Playwright Python package
     try:
-        from playwright.async_api import async_playwright
+        import playwright.async_api  # noqa: F401  pylint: disable=unused-import
         diagnostics["playwright_package"]["imported"] = True
         diagnostics["playwright_package"]["version"] = "unknown"  # Playwright doesn't expose version easily
     except ImportError as exc:
@@ -168,53 +440,49 @@ async def diagnose_playwright() -> Dict[str, Any]:
     
     # 2. Check browser installation via CLI
     try:
-        result = subprocess.run(
-            ["playwright", "install", "--dry-run", "chromium"],
-            capture_output=True,
-            text=True,
-            timeout=10,
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "playwright", "install", "--dry-run", "chromium",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-        diagnostics["browser_installation"]["dry_run_exit_code"] = result.returncode
-        diagnostics["browser_installation"]["dry_run_stdout"] = result.stdout
-        diagnostics["browser_installation"]["dry_run_stderr"] = result.stderr
-        diagnostics["browser_installation"]["browsers_installed"] = result.returncode == 0
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=10)
+            diagnostics["browser_installation"]["dry_run_exit_code"] = process.returncode
+            diagnostics["browser_installation"]["dry_run_stdout"] = stdout.decode(errors="replace")
+            diagnostics["browser_installation"]["dry_run_stderr"] = stderr.decode(errors="replace")
+            diagnostics["browser_installation"]["browsers_installed"] = process.returncode == 0
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            diagnostics["browser_installation"]["timeout"] = True
     except FileNotFoundError:
         diagnostics["browser_installation"]["playwright_cli_not_found"] = True
-    except subprocess.TimeoutExpired:
-        diagnostics["browser_installation"]["timeout"] = True
     except Exception as exc:
         diagnostics["browser_installation"]["error"] = str(exc)
     
     # 3. Check browser executable paths
-    try:
-        from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            browser_path = p.chromium.executable_path
-            diagnostics["browser_installation"]["executable_path"] = browser_path
-            diagnostics["browser_installation"]["executable_exists"] = Path(browser_path).exists() if browser_path else False
-    except Exception as exc:
-        diagnostics["browser_installation"]["executable_check_error"] = str(exc)
+    browser_path = await probe_chromium()
+    diagnostics["browser_installation"]["executable_path"] = browser_path
+    diagnostics["browser_installation"]["executable_exists"] = Path(browser_path).exists() if browser_path else False
     
-    # 4. Try to actually launch a browser
+    # 4. Open a page on the shared pool, reusing the warm browser when there is one
+    diagnostics["browser_launch_test"]["pool_available"] = browser_pool.available
+    launches_before = browser_pool.stats["launches"]
     try:
-        async with async_playwright() as playwright:
-            browser = await playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                ],
-                timeout=10000,
-            )
-            diagnostics["browser_launch_test"]["success"] = True
-            diagnostics["browser_launch_test"]["browser_version"] = browser.version
-            await browser.close()
+        async def open_test_page() -> str:
+            async with browser_pool.page() as page:
+                return page.context.browser.version
+
+        version = await asyncio.wait_for(open_test_page(), timeout=30)
+        diagnostics["browser_launch_test"]["success"] = True
+        diagnostics["browser_launch_test"]["browser_version"] = version
+        diagnostics["browser_launch_test"]["reused_browser"] = browser_pool.stats["launches"] == launches_before
     except Exception as exc:
         diagnostics["browser_launch_test"]["success"] = False
         diagnostics["browser_launch_test"]["error_type"] = type(exc).__name__
         diagnostics["browser_launch_test"]["error_message"] = str(exc)
         diagnostics["browser_launch_test"]["traceback"] = traceback.format_exc()
+    diagnostics["browser_launch_test"]["pool_stats"] = dict(browser_pool.stats)
     
     # 5. Check environment variables
     diagnostics["environment"]["PLAYWRIGHT_BROWSERS_PATH"] = os.getenv("PLAYWRIGHT_BROWSERS_PATH", "not set")
@@ -246,61 +514,166 @@ async def diagnose_playwright() -> Dict[str, Any]:
     return diagnostics
 
 
-async def run_scrape_job(job_id: str, author_id: str, profile_url: str, max_papers: int) -> None:
-    job = jobs[job_id]
-
-    def progress_handler(stage: str, current: int, total: int, percentage: float) -> None:
-        job["stage"] = stage
-        percent_value = round(min(100.0, max(0.0, percentage)))
-        job["percentage"] = percent_value
-        job["message"] = f"{stage}… {percent_value}% complete"
-
-    job["status"] = "running"
-    job["message"] = "Fetching data…"
-    job["percentage"] = 5
-
+async def run_scrape_job(
+    job_id: str,
+    author_id: str,
+    profile_url: str,
+    max_papers: int,
+    concurrency: int = SemanticScholarScraper.DEFAULT_CONCURRENCY,
+    use_cache: bool = True,
+    race_strategies: bool = False,
+    incremental: bool = False,
+) -> None:
+    coalesce_key = _coalesce_key(author_id, use_cache, race_strategies, incremental)
     timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
     html_path = HTML_DIR / f"semantic_scholar_{author_id}_{timestamp}.html"
     debug_path = DEBUG_DIR / f"debug_{author_id}_{timestamp}.json"
-
-    scraper = SemanticScholarScraper(
-        api_key=os.getenv("SEMANTIC_SCHOLAR_API_KEY"),
-        max_papers=max_papers,
-        verbose=False,
-        collect_debug=True,
-        progress_handler=progress_handler,
+    _update_job(
+        job_id,
+        status="running",
+        queue_position=None,
+        message="Fetching data…",
+        percentage=5,
+        artifacts=[html_path.name, debug_path.name],
     )
+    params = {
+        "author_id": author_id,
+        "max_papers": max_papers,
+        "concurrency": concurrency,
+        "use_cache": use_cache,
+        "race_strategies": race_strategies,
+        "incremental": incremental,
+        "html_path": str(html_path),
+        "asset_urls": checklist_asset_urls,
+        "debug_path": str(debug_path),
+        # Worker processes keep their own browser pool, gated by this process's readiness check
+        "browser_available": browser_pool.available,
+    }
 
     try:
-        papers = await scraper.scrape_profile(author_id)
-        if not papers:
-            job["status"] = "failed"
-            job["message"] = "No papers found for this author."
-            job["percentage"] = 100
+        if worker_pool is not None:
+            loop = asyncio.get_running_loop()
+            drained = worker_jobs_drained[job_id] = asyncio.Event()
+            try:
+                ranked = await loop.run_in_executor(worker_pool, run_in_worker, job_id, params)
+                # Progress travels separately over the queue; apply all of it before the result
+                try:
+                    await asyncio.wait_for(drained.wait(), WORKER_DRAIN_TIMEOUT_SECONDS)
+                except asyncio.TimeoutError:
+                    print(f"⚠️ Progress for job {job_id} is still in flight; later events will be dropped")
+            finally:
+                worker_jobs_drained.pop(job_id, None)
+        else:
+            ranked = await execute_scrape(job_id, params, _emit_job_event, browser_pool=browser_pool)
+        if not ranked:
+            _update_job(
+                job_id,
+                event="failed",
+                data={"error": None, "message": "No papers found for this author."},
+                status="failed",
+                message="No papers found for this author.",
+                percentage=100,
+            )
             return
 
-        validated_papers = [PaperExtractor.validate_paper_data(paper) for paper in papers]
-        html_content = HTMLGenerator.generate_html(validated_papers, author_id)
-        html_path.write_text(html_content, encoding="utf-8")
-
-        debug_report = scraper.build_debug_report(user_id=author_id)
-        debug_path.write_text(json.dumps(debug_report, indent=2), encoding="utf-8")
-
-        job["status"] = "completed"
-        job["message"] = f"Scrape complete. Collected {len(validated_papers)} papers."
-        job["percentage"] = 100
-        job["stage"] = "Completed"
-        job["result"] = {
+        result = {
             "author_id": author_id,
             "profile_url": profile_url,
-            "total_papers": len(validated_papers),
+            "total_papers": len(ranked),
             "html_url": f"/artifacts/html/{html_path.name}",
             "debug_url": f"/artifacts/debug/{debug_path.name}",
         }
+        # Detach followers before the first await so no new job can join a finished scrape
+        followers = job_followers.pop(job_id, [])
+        if inflight_jobs.get(coalesce_key) == job_id:
+            del inflight_jobs[coalesce_key]
+        _update_job(
+            job_id,
+            event="result",
+            data={"result": result},
+            status="completed",
+            message=f"Scrape complete. Collected {len(ranked)} papers.",
+            percentage=100,
+            stage="Completed",
+            result=result,
+        )
+        await _complete_followers(followers, ranked, result, timestamp)
     except Exception as exc:  # pylint: disable=broad-except
         traceback.print_exc()
-        job["status"] = "failed"
-        job["error"] = str(exc)
-        job["message"] = "Scrape failed. Check server logs for details."
-        job["percentage"] = 100
+        message = "Scrape failed. Check server logs for details."
+        _update_job(
+            job_id,
+            event="failed",
+            data={"error": str(exc), "message": message},
+            status="failed",
+            error=str(exc),
+            message=message,
+            percentage=100,
+        )
+    finally:
+        if inflight_jobs.get(coalesce_key) == job_id:
+            del inflight_jobs[coalesce_key]
+        job_followers.pop(job_id, None)
+
+
+def _emit_job_event(job_id: str, event: str, data: Optional[Dict[str, Any]], fields: Dict[str, Any]) -> None:
+    job = jobs.get(job_id)
+    # A straggler must not overwrite a finished job or follow its terminal SSE event
+    if job is not None and job["status"] not in TERMINAL_STATUSES:
+        _update_job(job_id, event=event, data=data, **fields)
 
+
+async def _relay_worker_events() -> None:
+    """Apply progress sent by worker processes to the job store and event streams."""
+    while True:
+        try:
+            # Short timeout so the waiting thread notices shutdown
+            job_id, event, data, fields = await asyncio.to_thread(worker_events.get, True, 1.0)
+        except queue.Empty:
+            continue
+        if event == DONE_EVENT:
+            drained = worker_jobs_drained.get(job_id)
+            if drained is not None:
+                drained.set()
+            continue
+        try:
+            _emit_job_event(job_id, event, data, fields)
+        except Exception:  # pylint: disable=broad-except
+            traceback.print_exc()
+
+
+def _write_checklist(path: Path, papers: List[Dict[str, Any]], author_id: str) -> None:
+    with ArtifactWriter(path) as writer:
+        HTMLGenerator.write_html(writer, papers, author_id, checklist_asset_urls, total=len(papers))
+
+
+async def _complete_followers(
+    followers: List[str],
+    ranked: List[Tuple[int, Dict[str, Any]]],
+    leader_result: Dict[str, Any],
+    timestamp: str,
+) -> None:
+    """Hand each coalesced job the leader's papers, cut down to its own ``max_papers``."""
+    for follower_id in followers:
+        follower = jobs.get(follower_id)
+        if follower is None:
+            continue
+        max_papers = follower["max_papers"]
+        papers = [paper for index, paper in ranked if index < max_papers]
+        result = dict(leader_result, total_papers=len(papers))
+        if len(papers) != len(ranked):
+            html_path = HTML_DIR / f"semantic_scholar_{leader_result['author_id']}_{timestamp}_top{max_papers}.html"
+            if not html_path.exists():
+                await asyncio.to_thread(_write_checklist, html_path, papers, leader_result["author_id"])
+            result["html_url"] = f"/artifacts/html/{html_path.name}"
+        follower["artifacts"] = [result["html_url"].rsplit("/", 1)[-1], result["debug_url"].rsplit("/", 1)[-1]]
+        _update_job(
+            follower_id,
+            event="result",
+            data={"result": result},
+            status="completed",
+            message=f"Scrape complete. Collected {len(papers)} papers.",
+            percentage=100,
+            stage="Completed",
+            result=result,
+        )
@@ -0,0 +1,109 @@
+import gzip
+
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from artifacts import (
+    IMMUTABLE_CACHE_CONTROL,
+    ArtifactWriter,
+    PrecompressedStaticFiles,
+    accepted_encodings,
+    write_artifact,
+)
+
+
+def test_write_artifact_creates_stable_gzip_sibling(tmp_path):
+    path = tmp_path / "checklist.html"
+    write_artifact(path, "<p>café</p>")
+    first = (tmp_path / "checklist.html.gz").read_bytes()
+    write_artifact(path, "<p>café</p>")
+
+    assert path.read_text(encoding="utf-8") == "<p>café</p>"
+    assert gzip.decompress(first).decode("utf-8") == "<p>café</p>"
+    assert (tmp_path / "checklist.html.gz").read_bytes() == first
+
+
+def test_artifact_writer_publishes_on_commit_and_cleans_up_on_abort(tmp_path):
+    path = tmp_path / "checklist.html"
+    writer = ArtifactWriter(path)
+    for row in range(3):
+        writer.write(f"<tr>{row}</tr>")
+    assert not path.exists()
+    writer.commit()
+
+    assert path.read_text(encoding="utf-8") == "<tr>0</tr><tr>1</tr><tr>2</tr>"
+    assert gzip.decompress((tmp_path / "checklist.html.gz").read_bytes()) == path.read_bytes()
+
+    aborted = ArtifactWriter(tmp_path / "partial.html")
+    aborted.write("<tr>")
+    aborted.abort()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["checklist.html", "checklist.html.gz"]
+
+
+def test_accepted_encodings_respects_quality_values():
+    def scope(header):
+        return {"headers": [(b"accept-encoding", header.encode())]}
+
+    assert accepted_encodings(scope("gzip, deflate, br")) == ["br", "gzip"]
+    assert accepted_encodings(scope("br;q=0, gzip;q=0.5")) == ["gzip"]
+    assert accepted_encodings(scope("identity")) == []
+
+
+def test_precompressed_static_files_serves_gzip_with_cache_headers(tmp_path):
+    write_artifact(tmp_path / "checklist.html", "<h1>Papers</h1>" * 100)
+    app = Starlette(routes=[Mount("/artifacts", PrecompressedStaticFiles(directory=tmp_path))])
+    client = TestClient(app)
+
+    response = client.get("/artifacts/checklist.html", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < 1500
+    assert response.text == "<h1>Papers</h1>" * 100
+
+    revalidated = client.get(
+        "/artifacts/checklist.html",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+    plain = client.get("/artifacts/checklist.html", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.headers["etag"] != response.headers["etag"]
+
+
+def test_retention_applies_age_budget_and_keeps_latest_per_author(tmp_path):
+    import os
+    import time
+
+    from artifacts import ArtifactRetention
+
+    now = time.time()
+
+    def make(name, age, size=1000):
+        write_artifact(tmp_path / name, "x" * size)
+        for path in tmp_path.glob(name + "*"):
+            os.utime(path, (now - age, now - age))
+
+    make("semantic_scholar_1_20240101000000.html", age=30 * 86400)  # old, but author 1's latest
+    make("semantic_scholar_2_20240101000000.html", age=30 * 86400)  # old, superseded
+    make("semantic_scholar_2_20240301000000.html", age=3600)
+    make("semantic_scholar_3_20240101000000.html", age=3600)
+    make("semantic_scholar_3_20240201000000.html", age=1800)
+    make("semantic_scholar_3_20240301000000.html", age=60)
+    make("semantic_scholar_3_20240301000000_top5.html", age=60)
+
+    retention = ArtifactRetention([tmp_path], max_age=7 * 86400, max_bytes=4500)
+    result = retention.collect(protected={"semantic_scholar_3_20240101000000.html"})
+
+    remaining = sorted(path.name for path in tmp_path.iterdir() if path.suffix == ".html")
+    assert remaining == [
+        "semantic_scholar_1_20240101000000.html",
+        "semantic_scholar_2_20240301000000.html",
+        "semantic_scholar_3_20240101000000.html",
+        "semantic_scholar_3_20240301000000.html",
+    ]
+    assert not (tmp_path / "semantic_scholar_2_20240101000000.html.gz").exists()
+    assert result["removed"] == 3
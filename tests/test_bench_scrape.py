@@ -0,0 +1,15 @@
+from benchmarks.bench_scrape import author_id_for, run_benchmarks
+from benchmarks.fake_upstream import FaultProfile
+
+
+def test_benchmark_smoke_run_scrapes_a_small_author():
+    options = {"concurrency": 2, "race_strategies": False, "api_rps": 100.0}
+    [result] = run_benchmarks([5], FaultProfile(), options)
+
+    assert author_id_for(5) == "9000005"
+    assert result["author_papers"] == 5 and result["papers"] == 5
+    assert result["papers_per_second"] > 0 and result["p95_ms"] >= result["p50_ms"] >= 0
+    # Author lookup, one listing page and one batch of details
+    assert result["api_calls"] == 3
+    assert result["upstream_requests"]["s2"] == 3
+    assert result["peak_rss_mb"] > 0
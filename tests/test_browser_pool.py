@@ -0,0 +1,218 @@
+import asyncio
+
+import browser_pool
+from browser_pool import BrowserPool
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+
+    async def new_page(self):
+        return FakePage()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePage:
+    async def add_init_script(self, script):
+        self.script = script
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **kwargs):
+        return FakeContext()
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.launched = []
+        self.chromium = self
+
+    async def launch(self, **kwargs):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+    async def stop(self):
+        pass
+
+
+def test_pool_reuses_browser_and_recycles_after_page_budget(monkeypatch):
+    fake = FakePlaywright()
+
+    class Starter:
+        async def start(self):
+            return fake
+
+    monkeypatch.setattr(browser_pool, "PLAYWRIGHT_AVAILABLE", True)
+    monkeypatch.setattr(browser_pool, "async_playwright", lambda: Starter())
+
+    async def run():
+        pool = BrowserPool(size=1, max_pages_per_browser=2)
+        for _ in range(3):
+            async with pool.page():
+                pass
+        await pool.close()
+        return pool
+
+    pool = asyncio.run(run())
+
+    assert len(fake.launched) == 2
+    assert fake.launched[0].closed and fake.launched[1].closed
+    assert pool.stats == {"launches": 2, "recycled": 1, "pages": 3, "health_failures": 0}
+
+
+def test_readiness_check_launches_once_then_uses_cache(tmp_path, monkeypatch):
+    fake = FakePlaywright()
+    fake.executable_path = str(tmp_path / "chrome")
+    (tmp_path / "chrome").write_text("")
+
+    class Starter:
+        async def start(self):
+            return fake
+
+    monkeypatch.setattr(browser_pool, "PLAYWRIGHT_AVAILABLE", True)
+    monkeypatch.setattr(browser_pool, "async_playwright", lambda: Starter())
+    cache_path = tmp_path / "playwright_ready.json"
+
+    async def run():
+        pool = BrowserPool()
+        first = await pool.ensure_ready(cache_path=cache_path, install=False)
+        second = await pool.ensure_ready(cache_path=cache_path, install=False)
+        return pool, first, second
+
+    pool, first, second = asyncio.run(run())
+
+    assert first and second and pool.available
+    assert len(fake.launched) == 1
+    assert cache_path.exists()
+
+    # Browser gone after an image change: the cache no longer vouches for it
+    (tmp_path / "chrome").unlink()
+    pool = BrowserPool()
+    assert asyncio.run(pool.ensure_ready(cache_path=cache_path, install=False)) is False
+    assert pool.available is False
+
+
+def test_warm_start_launches_once_and_health_check_replaces_dead_browser(monkeypatch):
+    fake = FakePlaywright()
+
+    class Starter:
+        async def start(self):
+            return fake
+
+    class HangingContext:
+        async def new_context(self, **kwargs):
+            raise RuntimeError("Target closed")
+
+    monkeypatch.setattr(browser_pool, "PLAYWRIGHT_AVAILABLE", True)
+    monkeypatch.setattr(browser_pool, "async_playwright", lambda: Starter())
+
+    async def run():
+        pool = BrowserPool(warm_start=True)
+        assert await pool.warm()
+        assert await pool.warm()
+        async with pool.page():
+            pass
+        assert len(fake.launched) == 1
+
+        # The browser stops answering while still reporting itself connected
+        fake.launched[0].new_context = HangingContext().new_context
+        assert await pool.health_check() == 1
+        assert await pool.warm()
+        await pool.close()
+        return pool
+
+    pool = asyncio.run(run())
+
+    assert len(fake.launched) == 2
+    assert pool.stats["health_failures"] == 1
+
+
+def test_health_check_does_not_block_checkouts_while_probing(monkeypatch):
+    fake = FakePlaywright()
+    probing = None
+
+    class Starter:
+        async def start(self):
+            return fake
+
+    monkeypatch.setattr(browser_pool, "PLAYWRIGHT_AVAILABLE", True)
+    monkeypatch.setattr(browser_pool, "async_playwright", lambda: Starter())
+
+    async def hanging_context(**kwargs):
+        if kwargs:
+            return FakeContext()
+        # Only the health probe hangs (pages pass context options)
+        probing.set()
+        await asyncio.sleep(10)
+
+    async def run():
+        nonlocal probing
+        probing = asyncio.Event()
+        pool = BrowserPool()
+        assert await pool.warm()
+        fake.launched[0].new_context = hanging_context
+        check = asyncio.create_task(pool.health_check())
+        await probing.wait()
+        # The probe is stuck waiting for its timeout, but pages are still handed out
+        async with pool.page():
+            pass
+        assert not check.done()
+        check.cancel()
+        await asyncio.gather(check, return_exceptions=True)
+        await pool.close()
+
+    asyncio.run(asyncio.wait_for(run(), 3))
+
+    assert len(fake.launched) == 1
+
+
+def test_rss_limit_only_recycles_the_browser_over_budget(monkeypatch):
+    fake = FakePlaywright()
+    launch = fake.launch
+    megabyte = 1024 * 1024
+    rss = {}  # Chromium root pid -> resident bytes
+
+    async def launch_with_process(**kwargs):
+        rss[100 + len(rss)] = 100 * megabyte
+        return await launch(**kwargs)
+
+    class Starter:
+        async def start(self):
+            return fake
+
+    fake.launch = launch_with_process
+    monkeypatch.setattr(browser_pool, "PLAYWRIGHT_AVAILABLE", True)
+    monkeypatch.setattr(browser_pool, "async_playwright", lambda: Starter())
+    monkeypatch.setattr(browser_pool, "_descendant_pids", lambda pid=None: set() if pid else set(rss))
+    monkeypatch.setattr(browser_pool, "_parent_pid", lambda pid: 1)
+    monkeypatch.setattr(browser_pool, "_rss_bytes", lambda pid: rss[pid])
+
+    async def run():
+        pool = BrowserPool(size=2, max_rss_mb=300)
+        async with pool.page():
+            async with pool.page():
+                # The second browser grows past the budget; the first stays small
+                rss[101] = 500 * megabyte
+        roots = [entry.root_pids for entry in pool._browsers]
+        closed = [browser.closed for browser in fake.launched]
+        await pool.close()
+        return pool, roots, closed
+
+    pool, roots, closed = asyncio.run(run())
+
+    assert roots == [{100}]
+    assert closed == [False, True]
+    assert pool.stats["recycled"] == 1
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from benchmarks.fake_upstream import Corpus, FakeUpstream, FaultProfile, FaultRule
+from browser_pool import BrowserPool
+from rate_limiter import AsyncRateLimiter
+from result_cache import AuthorResultCache
+from semantic_scholar_scraper import SemanticScholarScraper
+from validation_cache import ValidationCache
+
+
+def _scraper(tmp_path, upstream, max_papers):
+    browser_pool = BrowserPool()
+    browser_pool.available = False
+    return SemanticScholarScraper(
+        max_papers=max_papers,
+        browser_pool=browser_pool,
+        rate_limiter=AsyncRateLimiter(rate=100, burst=10, backoff_base=0.01, backoff_cap=0.05),
+        validation_cache=ValidationCache(tmp_path / "validation.sqlite3"),
+        result_cache=AuthorResultCache(tmp_path / "results.sqlite3"),
+        use_cache=False,
+        base_urls=upstream.base_urls(),
+    )
+
+
+def test_scrape_by_name_runs_entirely_against_the_fake_upstream(tmp_path):
+    with FakeUpstream(Corpus({"9000030": 30}), FaultProfile()) as upstream:
+        scraper = _scraper(tmp_path, upstream, max_papers=20)
+        papers = asyncio.run(scraper.scrape_profile("Author 9000030"))
+
+        assert len(papers) == 20
+        citations = [int(paper["citations"].replace(",", "")) for paper in papers]
+        assert citations == sorted(citations, reverse=True)
+        # Author search, paper listing and one batch of details
+        assert scraper.stats["api_calls"] == 3
+        assert upstream.requests["s2"] == 3
+        assert upstream.requests["pdf"] + upstream.requests["arxiv"] + upstream.requests["doi"] > 0
+
+
+def test_scripted_rate_limits_are_retried(tmp_path):
+    faults = FaultProfile(rules=[FaultRule(match=r"/author/9000010$", status=429, times=2, retry_after=0.01)])
+    with FakeUpstream(Corpus({"9000010": 10}), faults) as upstream:
+        scraper = _scraper(tmp_path, upstream, max_papers=10)
+        papers = asyncio.run(scraper.scrape_profile("9000010"))
+
+        assert len(papers) == 10
+        assert upstream.requests["injected_429"] == 2
+        assert scraper._rate_limiter.stats["rate_limited"] == 2
+        assert faults.to_dict()["rules"][0]["fired"] == 2
+
+
+def test_base_urls_come_from_environment_and_arguments_win(monkeypatch):
+    monkeypatch.setenv("S2_API_URL", "http://localhost:9/s2")
+    monkeypatch.setenv("S2_PAPER_PAGE_URL", "http://localhost:9")
+    scraper = SemanticScholarScraper(use_cache=False, base_urls={"unpaywall": "http://localhost:7/unpaywall"})
+
+    assert scraper.base_urls["api"] == "http://localhost:9/s2"
+    assert scraper.base_urls["unpaywall"] == "http://localhost:7/unpaywall"
+    assert scraper.base_urls["doi"] == SemanticScholarScraper.BASE_URLS["doi"]
+    assert scraper._create_semantic_scholar_url("abc", "A Title").startswith("http://localhost:9/paper/")
+
+
+@pytest.mark.parametrize("page_size, listing_pages", [(10, 3), (8, 4)])
+def test_author_listing_is_fetched_and_counted_page_by_page(tmp_path, page_size, listing_pages):
+    with FakeUpstream(Corpus({"9000030": 30}), FaultProfile()) as upstream:
+        scraper = _scraper(tmp_path, upstream, max_papers=20)
+        scraper.LISTING_PAGE_SIZE = page_size
+        papers = asyncio.run(scraper.scrape_profile("9000030"))
+
+        assert len(papers) == 20
+        # Author lookup, the listing pages and one batch of details
+        assert scraper.stats["api_calls"] == listing_pages + 2
+        assert upstream.requests["s2"] == listing_pages + 2
@@ -1,4 +1,8 @@
-from html_generator import HTMLGenerator
+import asyncio
+import io
+import json
+
+from html_generator import INITIAL_ROWS, HTMLGenerator
 
 
 def test_generate_html_escapes_content_and_includes_stats():
@@ -40,3 +44,58 @@ def test_generate_html_handles_missing_fields():
     assert "user42" in html
 
 
+def test_generate_html_links_hashed_assets_instead_of_inlining():
+    papers = [{"title": "Linked", "authors": "", "year": "", "publication": "", "doi": "", "download_link": ""}]
+    assets = HTMLGenerator.asset_files()
+    urls = {kind: f"/artifacts/assets/{filename}" for kind, (filename, _) in assets.items()}
+
+    inline = HTMLGenerator.generate_html(papers, "user42")
+    linked = HTMLGenerator.generate_html(papers, "user42", asset_urls=urls)
+
+    assert assets["css"][1] in inline and assets["js"][1] in inline
+    assert f'<link rel="stylesheet" href="{urls["css"]}">' in linked
+    assert f'<script src="{urls["js"]}"></script>' in linked
+    assert "<style>" not in linked
+    assert "Linked" in linked and len(linked) < len(inline) // 4
+    assert assets["css"][0].startswith("checklist.") and assets["css"][0].endswith(".css")
+
+
+def test_streaming_writers_match_generate_html_and_fill_late_total():
+    papers = [
+        {"title": f"Paper {n}", "authors": "", "year": "", "publication": "", "doi": "", "download_link": ""}
+        for n in range(3)
+    ]
+    sink = io.StringIO()
+    HTMLGenerator.write_html(sink, papers, "user42", total=len(papers))
+    assert sink.getvalue() == HTMLGenerator.generate_html(papers, "user42")
+
+    async def arrive():
+        for paper in papers:
+            yield paper
+
+    chunks = []
+
+    async def write(chunk):
+        chunks.append(chunk)
+
+    assert asyncio.run(HTMLGenerator.write_html_async(write, arrive(), "user42")) == 3
+    streamed = "".join(chunks)
+    assert '<span id="total-papers"></span>' in streamed
+    assert "Paper 2" in streamed and "textContent = '3'" in streamed
+
+
+def test_large_checklists_embed_papers_as_data_island_and_render_first_window():
+    papers = [
+        {"title": f"<Paper {n}>", "authors": "", "year": "", "publication": "", "doi": "", "download_link": ""}
+        for n in range(INITIAL_ROWS + 25)
+    ]
+
+    html = HTMLGenerator.generate_html(papers, "user42")
+
+    table, rest = html.split('<script type="application/json" id="paper-data">', 1)
+    island = rest.split("</script>", 1)[0]
+    assert table.count("<tr data-index=") == INITIAL_ROWS
+    records = json.loads(island)
+    assert len(records) == len(papers)
+    assert records[-1][0] == f"<Paper {len(papers) - 1}>"
+    assert "<Paper" not in island
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+
+from job_scheduler import JobScheduler, QueueFullError
+
+
+def test_scheduler_limits_workers_and_reports_queue_positions():
+    events = []
+
+    async def run():
+        release = asyncio.Event()
+        scheduler = JobScheduler(workers=1, queue_size=2)
+        scheduler.on_queue_change = lambda: events.append(scheduler.queued_ids)
+        scheduler.start()
+
+        async def job(name):
+            events.append(f"start {name}")
+            await release.wait()
+
+        assert scheduler.submit("a", lambda: job("a")) == 1
+        await asyncio.sleep(0)
+        assert scheduler.running_ids == {"a"}
+        assert scheduler.submit("b", lambda: job("b")) == 1
+        assert scheduler.submit("c", lambda: job("c")) == 2
+        assert scheduler.position("c") == 2
+
+        with pytest.raises(QueueFullError) as excinfo:
+            scheduler.submit("d", lambda: job("d"))
+        assert excinfo.value.retry_after >= 1
+
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+        await scheduler.stop()
+        return scheduler
+
+    scheduler = asyncio.run(run())
+
+    assert events[:2] == [[], "start a"]
+    assert ["c"] in events
+    assert "start b" in events and "start c" in events
+    assert scheduler.stats == {"submitted": 3, "rejected": 1, "completed": 3}
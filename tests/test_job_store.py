@@ -0,0 +1,58 @@
+import time
+
+from job_store import MemoryJobStore, SQLiteJobStore
+
+
+def test_memory_store_evicts_finished_jobs_by_retention_and_size():
+    store = MemoryJobStore(max_jobs=2, retention=60)
+    store["running"] = {"status": "running"}
+    store["old"] = {"status": "completed"}
+    store["old"]["finished_at"] = time.time() - 120
+
+    assert store.evict_expired() == 1
+    assert "old" not in store
+
+    store["done-1"] = {"status": "failed"}
+    store["done-2"] = {"status": "completed"}
+
+    # Over the limit: the least recently used finished job goes, never the running one
+    assert "running" in store
+    assert "done-1" not in store
+    assert store["done-2"]["finished_at"] >= store["done-2"]["created_at"]
+
+
+def test_sqlite_store_survives_restart_and_marks_active_jobs_interrupted(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    store = SQLiteJobStore(path, min_write_interval=60)
+    store["queued"] = {"status": "queued", "percentage": 0}
+    store["done"] = {"status": "completed", "result": {"total_papers": 3}}
+    store["queued"]["percentage"] = 40
+    store.save("queued")  # throttled: same status within the write interval
+    store.close()
+
+    restarted = SQLiteJobStore(path)
+    assert restarted.mark_interrupted() == 1
+    assert restarted["queued"]["status"] == "interrupted"
+    assert restarted["queued"]["percentage"] == 0
+    assert restarted["done"]["result"] == {"total_papers": 3}
+
+    del restarted["done"]
+    assert restarted.get("done") is None
+    restarted.close()
+
+
+def test_sqlite_store_commits_on_a_writer_thread(tmp_path):
+    path = tmp_path / "jobs.sqlite3"
+    store = SQLiteJobStore(path)
+    # While the database is busy, saves return at once and readers see the queued rows
+    with store._lock:
+        store["running"] = {"status": "running", "percentage": 10}
+        store["running"].update(status="completed", percentage=100)
+        store.save("running")
+        store._jobs.clear()
+        assert store.get("running")["percentage"] == 100
+    store.close()
+
+    restarted = SQLiteJobStore(path)
+    assert restarted["running"]["status"] == "completed"
+    restarted.close()
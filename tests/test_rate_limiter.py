@@ -0,0 +1,95 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from rate_limiter import AsyncRateLimiter, is_rate_limit_error
+
+
+def test_call_retries_rate_limited_requests_without_blocking_the_loop():
+    limiter = AsyncRateLimiter(rate=1000, burst=1, max_retries=2, backoff_base=0.05, backoff_cap=0.05)
+    attempts = []
+    ticks = 0
+
+    def flaky_api_call():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise ConnectionRefusedError("HTTP status 429 Too Many Requests.")
+        return "ok"
+
+    async def ticker():
+        nonlocal ticks
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async def run():
+        result, _ = await asyncio.gather(limiter.call(flaky_api_call), ticker())
+        return result
+
+    assert asyncio.run(run()) == "ok"
+    assert len(attempts) == 3
+    assert ticks == 10
+    assert limiter.stats["rate_limited"] == 2
+
+
+def test_call_honours_retry_after_and_reraises_other_errors():
+    class Throttled(Exception):
+        status = 429
+        retry_after = "0.05"
+
+    limiter = AsyncRateLimiter(rate=1000, burst=5, max_retries=1, backoff_base=30)
+    calls = []
+
+    def api_call():
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            raise Throttled()
+        raise ValueError("not found")
+
+    async def run():
+        try:
+            await limiter.call(api_call)
+        except ValueError as exc:
+            return exc
+
+    assert isinstance(asyncio.run(run()), ValueError)
+    assert 0.04 <= calls[1] - calls[0] < 1
+    assert is_rate_limit_error(Throttled())
+    assert not is_rate_limit_error(ConnectionRefusedError("refused"))
+
+
+def test_call_retries_429s_raised_through_the_semanticscholar_client():
+    from semanticscholar import SemanticScholar
+
+    responses = [(429, {"error": "Too Many Requests"})] * 2 + [(200, {"authorId": "1", "name": "Ada"})]
+    served = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, payload = responses[min(len(served), len(responses) - 1)]
+            served.append(self.path)
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = SemanticScholar(api_url=f"http://127.0.0.1:{server.server_port}", retry=False)
+        limiter = AsyncRateLimiter(rate=1000, burst=5, max_retries=3, backoff_base=0.01, backoff_cap=0.02)
+        author = asyncio.run(limiter.call(client.get_author, "1"))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert author.name == "Ada"
+    assert len(served) == 3
+    assert limiter.stats["rate_limited"] == 2
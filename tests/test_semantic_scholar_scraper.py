@@ -0,0 +1,316 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+
+from result_cache import AuthorResultCache
+from semantic_scholar_scraper import SemanticScholarScraper
+from validation_cache import INVALID, TRANSIENT, VALID, ValidationCache
+
+
+def _make_papers(count):
+    return [
+        SimpleNamespace(paperId=f"p{i}", title=f"Paper {i}", citationCount=count - i)
+        for i in range(count)
+    ]
+
+
+def test_scrape_profile_enriches_concurrently_in_citation_order():
+    papers = _make_papers(6)
+    scraper = SemanticScholarScraper(max_papers=6, collect_debug=True, concurrency=3, use_cache=False)
+    in_flight = 0
+    peak = 0
+
+    async def fake_resolve(author_input):
+        return SimpleNamespace(name="Test"), "123"
+
+    async def fake_fetch(author_id):
+        return list(reversed(papers))
+
+    async def fake_extract(paper):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later papers finish first to prove results are reordered.
+        await asyncio.sleep(0.01 * (10 - int(paper.paperId[1:])))
+        in_flight -= 1
+        if paper.paperId == "p2":
+            raise RuntimeError("boom")
+        return {"title": paper.title, "citations": str(paper.citationCount)}
+
+    scraper._resolve_author = fake_resolve
+    scraper._fetch_author_papers = fake_fetch
+    scraper._extract_paper_metadata = fake_extract
+
+    result = asyncio.run(scraper.scrape_profile("123"))
+
+    assert [p["title"] for p in result] == ["Paper 0", "Paper 1", "Paper 3", "Paper 4", "Paper 5"]
+    assert peak == 3
+    assert [r["paper_id"] for r in scraper.debug_records] == ["p0", "p1", "p2", "p3", "p4", "p5"]
+    assert scraper.debug_records[2]["errors"] == ["boom"]
+
+
+def test_iter_profile_yields_records_as_they_complete():
+    papers = _make_papers(3)
+    scraper = SemanticScholarScraper(max_papers=3, concurrency=3, use_cache=False)
+
+    async def fake_resolve(author_input):
+        return SimpleNamespace(name="Test"), "123"
+
+    async def fake_fetch(author_id):
+        return papers
+
+    async def fake_extract(paper):
+        await asyncio.sleep(0.01 * (3 - int(paper.paperId[1:])))
+        if paper.paperId == "p1":
+            raise RuntimeError("boom")
+        return {"title": paper.title}
+
+    scraper._resolve_author = fake_resolve
+    scraper._fetch_author_papers = fake_fetch
+    scraper._extract_paper_metadata = fake_extract
+
+    async def run():
+        return [record async for record in scraper.iter_profile("123")]
+
+    records = asyncio.run(run())
+
+    assert [r["index"] for r in records] == [2, 1, 0]
+    assert scraper.selected_count == 3
+    assert records[1]["paper"] is None and records[1]["error"] == "boom"
+    assert records[2]["paper"] == {"title": "Paper 0"}
+    assert all(r["source"] == "scraped" and r["elapsed"] > 0 for r in records)
+
+
+class FakeHTTPClient:
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    async def head(self, url, **kwargs):
+        self.calls.append(url)
+        status, content_type = self.responses[url]
+        return httpx.Response(status, headers={"Content-Type": content_type}, request=httpx.Request("HEAD", url))
+
+    async def aclose(self):
+        pass
+
+
+def test_validate_pdf_link_uses_shared_http_client_and_caches(tmp_path):
+    http = FakeHTTPClient({
+        "https://arxiv.org/pdf/1234.5678.pdf": (200, "application/pdf"),
+        "https://example.org/missing": (404, "text/html"),
+    })
+    scraper = SemanticScholarScraper(
+        http_client=http,
+        validation_cache=ValidationCache(tmp_path / "validation.sqlite3"),
+    )
+
+    async def run():
+        first = await scraper._validate_pdf_link("https://arxiv.org/pdf/1234.5678.pdf")
+        again = await scraper._validate_pdf_link("https://arxiv.org/pdf/1234.5678.pdf")
+        missing = await scraper._validate_pdf_link("https://example.org/missing")
+        return first, again, missing
+
+    assert asyncio.run(run()) == (True, True, False)
+    assert http.calls == ["https://arxiv.org/pdf/1234.5678.pdf", "https://example.org/missing"]
+
+
+def test_prefetch_paper_details_batches_papers_without_open_access_url():
+    papers = _make_papers(5)
+    papers[0].openAccessPdf = {"url": "https://example.org/p0.pdf"}
+    scraper = SemanticScholarScraper()
+    scraper.PAPER_BATCH_SIZE = 2
+    batches = []
+
+    class FakeSch:
+        def get_papers(self, paper_ids, fields=None):
+            batches.append(list(paper_ids))
+            if "p3" in paper_ids:
+                raise RuntimeError("batch failed")
+            return [SimpleNamespace(paperId=pid, openAccessPdf=None) for pid in paper_ids]
+
+        def get_paper(self, paper_id, fields=None):
+            return SimpleNamespace(paperId=paper_id, openAccessPdf=None)
+
+    scraper.sch = FakeSch()
+
+    async def run():
+        await scraper._prefetch_paper_details(papers)
+        return [await scraper._get_paper_details(pid) for pid in ("p0", "p1", "p3")]
+
+    details = asyncio.run(run())
+
+    assert batches == [["p1", "p2"], ["p3", "p4"]]
+    assert details[0] is None
+    assert details[1].paperId == "p1"
+    assert details[2].paperId == "p3"
+    assert scraper.stats["api_calls"] == 2
+
+
+def test_validation_cache_persists_across_scrapers_and_expires_transient_failures(tmp_path):
+    cache_path = tmp_path / "validation.sqlite3"
+    http = FakeHTTPClient({
+        "https://arxiv.org/pdf/1.pdf": (200, "application/pdf"),
+        "https://example.org/flaky.pdf": (503, "text/html"),
+    })
+
+    async def validate(scraper, url):
+        return await scraper._validate_pdf_link(url)
+
+    first = SemanticScholarScraper(http_client=http, validation_cache=ValidationCache(cache_path))
+    assert asyncio.run(validate(first, "https://arxiv.org/pdf/1.pdf")) is True
+    assert asyncio.run(validate(first, "https://example.org/flaky.pdf")) is False
+
+    cache = ValidationCache(cache_path, transient_ttl=0)
+    assert cache.get("https://arxiv.org/pdf/1.pdf") == VALID
+    assert cache.get("https://example.org/flaky.pdf") is None
+
+    second = SemanticScholarScraper(http_client=http, validation_cache=cache)
+    assert asyncio.run(validate(second, "https://arxiv.org/pdf/1.pdf")) is True
+    assert http.calls == ["https://arxiv.org/pdf/1.pdf", "https://example.org/flaky.pdf"]
+
+    cache.put("https://example.org/gone.pdf", INVALID, 404)
+    cache.put("https://example.org/timeout.pdf", TRANSIENT)
+    assert cache.get("https://example.org/gone.pdf") == INVALID
+    assert cache.purge_expired() == 2
+
+
+def test_scrape_profile_serves_fresh_and_stale_cache_hits(tmp_path, monkeypatch):
+    cache = AuthorResultCache(tmp_path / "results.sqlite3")
+    cache.put("123", 10, {"papers": [{"title": f"Cached {i}"} for i in range(10)]})
+
+    async def fail_resolve(self, author_input):
+        raise AssertionError("fresh hits must not touch the API")
+
+    monkeypatch.setattr(SemanticScholarScraper, "_resolve_author", fail_resolve)
+    scraper = SemanticScholarScraper(max_papers=3, result_cache=cache)
+    papers = asyncio.run(scraper.scrape_profile("123"))
+
+    assert [p["title"] for p in papers] == ["Cached 0", "Cached 1", "Cached 2"]
+    assert scraper.build_debug_report("123")["cache"]["status"] == "fresh"
+
+    async def fake_resolve(self, author_input):
+        return SimpleNamespace(name="Test"), "123"
+
+    async def fake_fetch(self, author_id):
+        return [SimpleNamespace(paperId="new", title="Refreshed", citationCount=1)]
+
+    async def fake_extract(self, paper):
+        return {"title": paper.title}
+
+    monkeypatch.setattr(SemanticScholarScraper, "_resolve_author", fake_resolve)
+    monkeypatch.setattr(SemanticScholarScraper, "_fetch_author_papers", fake_fetch)
+    monkeypatch.setattr(SemanticScholarScraper, "_extract_paper_metadata", fake_extract)
+    monkeypatch.setattr(SemanticScholarScraper, "CACHE_TTL_SECONDS", -1)
+
+    async def run_stale():
+        stale = SemanticScholarScraper(max_papers=3, result_cache=cache)
+        papers = await stale.scrape_profile("123")
+        await SemanticScholarScraper.wait_for_background_refreshes()
+        return stale, papers
+
+    stale, papers = asyncio.run(run_stale())
+
+    assert [p["title"] for p in papers] == ["Cached 0", "Cached 1", "Cached 2"]
+    assert stale.cache_status == "stale"
+    assert [p["title"] for p in cache.get("123", 3).papers] == ["Refreshed"]
+
+
+def test_race_pdf_strategies_prefers_priority_and_cancels_lower_tiers():
+    scraper = SemanticScholarScraper(race_strategies=True, use_cache=False)
+    cancelled = []
+
+    def strategy(delay, link):
+        async def run():
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(link)
+                raise
+            return link
+        return run
+
+    async def run():
+        # Tier 3 finishes first but must wait for tiers 1 and 2 to come back empty.
+        return await scraper._race_pdf_strategies([
+            strategy(0.05, ""),
+            strategy(0.02, "https://example.org/details.pdf"),
+            strategy(0.0, "https://arxiv.org/pdf/1.pdf"),
+            strategy(1.0, "https://doi.org/slow.pdf"),
+        ])
+
+    assert asyncio.run(run()) == "https://example.org/details.pdf"
+    assert cancelled == ["https://doi.org/slow.pdf"]
+
+
+def test_race_pdf_strategies_cancels_lower_tiers_as_soon_as_one_wins():
+    scraper = SemanticScholarScraper(race_strategies=True, use_cache=False)
+    events = []
+
+    def strategy(delay, link):
+        async def run():
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                events.append(("cancelled", link))
+                raise
+            events.append(("finished", link))
+            return link
+        return run
+
+    async def run():
+        # Tier 2 wins at once; tier 3 must not keep running while tier 1 is checked.
+        return await scraper._race_pdf_strategies([
+            strategy(0.1, ""),
+            strategy(0.0, "https://example.org/details.pdf"),
+            strategy(1.0, "https://doi.org/slow.pdf"),
+        ])
+
+    assert asyncio.run(run()) == "https://example.org/details.pdf"
+    assert events == [
+        ("finished", "https://example.org/details.pdf"),
+        ("cancelled", "https://doi.org/slow.pdf"),
+        ("finished", ""),
+    ]
+
+
+def test_incremental_scrape_only_enriches_new_or_changed_papers(tmp_path, monkeypatch):
+    cache = AuthorResultCache(tmp_path / "results.sqlite3")
+    listing = [
+        SimpleNamespace(paperId="a", title="A", citationCount=30, externalIds={"DOI": "10.1/a"}, openAccessPdf=None),
+        SimpleNamespace(paperId="b", title="B", citationCount=20, externalIds={"DOI": "10.1/b"}, openAccessPdf=None),
+    ]
+    enriched = []
+
+    async def fake_resolve(self, author_input):
+        return SimpleNamespace(name="Test"), "123"
+
+    async def fake_fetch(self, author_id):
+        return list(listing)
+
+    async def fake_extract(self, paper):
+        enriched.append(paper.paperId)
+        return {"title": paper.title, "citations": str(paper.citationCount), "download_link": f"run-{len(enriched)}"}
+
+    async def no_details(self, selected):
+        return None
+
+    monkeypatch.setattr(SemanticScholarScraper, "_resolve_author", fake_resolve)
+    monkeypatch.setattr(SemanticScholarScraper, "_fetch_author_papers", fake_fetch)
+    monkeypatch.setattr(SemanticScholarScraper, "_extract_paper_metadata", fake_extract)
+    monkeypatch.setattr(SemanticScholarScraper, "_prefetch_paper_details", no_details)
+
+    def scrape():
+        scraper = SemanticScholarScraper(max_papers=5, use_cache=False, incremental=True, result_cache=cache)
+        return asyncio.run(scraper.scrape_profile("123"))
+
+    scrape()
+    listing[0].citationCount = 35
+    listing[1].externalIds = {"DOI": "10.1/b", "ArXiv": "2101.00001"}
+    listing.append(SimpleNamespace(paperId="c", title="C", citationCount=10, externalIds={}, openAccessPdf=None))
+    papers = scrape()
+
+    assert enriched == ["a", "b", "b", "c"]
+    assert papers[0] == {"title": "A", "citations": "35", "download_link": "run-1"}
+    assert [p["download_link"] for p in papers[1:]] == ["run-3", "run-4"]
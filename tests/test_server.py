@@ -0,0 +1,235 @@
+import asyncio
+import json
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+import result_cache
+import server
+import validation_cache
+import worker
+from result_cache import AuthorResultCache
+from semantic_scholar_scraper import SemanticScholarScraper
+from server import ScrapeRequest
+from validation_cache import INVALID, VALID, ValidationCache
+
+
+class FakeScraper:
+    def __init__(self, max_papers, **kwargs):
+        self.max_papers = max_papers
+        self.selected_count = 0
+
+    async def iter_profile(self, author_id):
+        self.selected_count = self.max_papers
+        for index in range(self.max_papers):
+            await asyncio.sleep(0)
+            yield {
+                "index": index,
+                "paper_id": f"p{index}",
+                "paper": {"title": f"Paper {index}", "citations": str(100 - index)},
+                "error": None,
+                "elapsed": 0.01,
+                "source": "scraped",
+            }
+
+    def build_debug_report(self, user_id):
+        return {"user_id": user_id}
+
+
+def test_duplicate_author_jobs_coalesce_onto_one_scrape(tmp_path, monkeypatch):
+    scrapers = []
+
+    def make_scraper(**kwargs):
+        scrapers.append(FakeScraper(**kwargs))
+        return scrapers[-1]
+
+    monkeypatch.setattr(worker, "SemanticScholarScraper", make_scraper)
+    monkeypatch.setattr(server, "HTML_DIR", tmp_path)
+    monkeypatch.setattr(server, "DEBUG_DIR", tmp_path)
+    url = "https://www.semanticscholar.org/author/Test/123"
+
+    async def run():
+        server.scheduler.start()
+        try:
+            leader = await server.start_scrape(ScrapeRequest(profile_url=url, max_papers=5))
+            follower = await server.start_scrape(ScrapeRequest(profile_url=url, max_papers=3))
+            bigger = await server.start_scrape(ScrapeRequest(profile_url=url, max_papers=8))
+            for _ in range(200):
+                if all(server.jobs[job["job_id"]]["status"] == "completed" for job in (leader, follower, bigger)):
+                    break
+                await asyncio.sleep(0.01)
+            return [server.jobs[job["job_id"]] for job in (leader, follower, bigger)]
+        finally:
+            await server.scheduler.stop()
+
+    leader, follower, bigger = asyncio.run(run())
+
+    assert len(scrapers) == 2
+    assert follower["coalesced_with"] is not None and bigger["coalesced_with"] is None
+    assert leader["result"]["total_papers"] == 5
+    assert follower["result"]["total_papers"] == 3
+    assert follower["papers_completed"] == 3 and follower["papers_total"] == 3
+    assert follower["result"]["html_url"] != leader["result"]["html_url"]
+    assert "Paper 2" in (tmp_path / follower["result"]["html_url"].rsplit("/", 1)[-1]).read_text()
+    assert server.inflight_jobs == {} and server.job_followers == {}
+
+
+def test_jobs_with_different_scrape_options_do_not_coalesce(tmp_path, monkeypatch):
+    scrapers = []
+
+    def make_scraper(**kwargs):
+        scrapers.append(FakeScraper(**kwargs))
+        scrapers[-1].use_cache = kwargs["use_cache"]
+        return scrapers[-1]
+
+    monkeypatch.setattr(worker, "SemanticScholarScraper", make_scraper)
+    monkeypatch.setattr(server, "HTML_DIR", tmp_path)
+    monkeypatch.setattr(server, "DEBUG_DIR", tmp_path)
+    url = "https://www.semanticscholar.org/author/Test/123"
+
+    async def run():
+        server.scheduler.start()
+        try:
+            cached = await server.start_scrape(ScrapeRequest(profile_url=url, max_papers=5))
+            fresh = await server.start_scrape(ScrapeRequest(profile_url=url, max_papers=3, use_cache=False))
+            for _ in range(200):
+                if all(server.jobs[job["job_id"]]["status"] == "completed" for job in (cached, fresh)):
+                    break
+                await asyncio.sleep(0.01)
+            return [server.jobs[job["job_id"]] for job in (cached, fresh)]
+        finally:
+            await server.scheduler.stop()
+
+    cached, fresh = asyncio.run(run())
+
+    assert [scraper.use_cache for scraper in scrapers] == [True, False]
+    assert fresh["coalesced_with"] is None
+    assert fresh["result"]["total_papers"] == 3
+    assert server.inflight_jobs == {} and server.job_followers == {}
+
+
+def _read_events(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_event_stream_sends_progress_then_terminal_event_and_closes(tmp_path, monkeypatch):
+    class FailingScraper(FakeScraper):
+        async def iter_profile(self, author_id):
+            yield {"index": 0, "paper_id": "p0", "paper": None, "error": "boom", "elapsed": 0.01, "source": "scraped"}
+            raise RuntimeError("upstream down")
+
+    def make_scraper(**kwargs):
+        return FailingScraper(**kwargs) if kwargs["max_papers"] == 2 else FakeScraper(**kwargs)
+
+    monkeypatch.setattr(worker, "SemanticScholarScraper", make_scraper)
+    monkeypatch.setattr(server, "HTML_DIR", tmp_path)
+    monkeypatch.setattr(server, "DEBUG_DIR", tmp_path)
+
+    async def run():
+        ok = await server.start_scrape(ScrapeRequest(profile_url="https://www.semanticscholar.org/author/A/123", max_papers=3))
+        bad = await server.start_scrape(ScrapeRequest(profile_url="https://www.semanticscholar.org/author/B/456", max_papers=2))
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            requests = [
+                asyncio.create_task(client.get(f"/api/events/{job['job_id']}")) for job in (ok, bad)
+            ]
+            # Subscribe both streams before the jobs start so every event is seen
+            while len(server.job_subscribers) < 2:
+                await asyncio.sleep(0.01)
+            server.scheduler.start()
+            try:
+                # Each request only returns once its stream has closed
+                return await asyncio.wait_for(asyncio.gather(*requests), 10)
+            finally:
+                await server.scheduler.stop()
+
+    ok_response, bad_response = asyncio.run(run())
+
+    assert ok_response.headers["content-type"].startswith("text/event-stream")
+    ok_events = _read_events(ok_response.text)
+    assert ok_events[0][0] == "progress" and ok_events[0][1]["status"] == "queued"
+    assert any(event == "progress" and data["status"] == "running" for event, data in ok_events)
+    assert [data["papers_completed"] for event, data in ok_events if event == "paper"] == [1, 2, 3]
+    assert ok_events[-1][0] == "result"
+    assert ok_events[-1][1]["result"]["total_papers"] == 3
+
+    bad_events = _read_events(bad_response.text)
+    assert bad_events[0][0] == "progress"
+    assert bad_events[-1] == ("failed", {"error": "upstream down", "message": "Scrape failed. Check server logs for details."})
+    assert server.job_subscribers == {}
+
+
+def test_worker_jobs_apply_every_relayed_event_before_completing(tmp_path, monkeypatch):
+    class LaggingQueue(queue.Queue):
+        def get(self, block=True, timeout=None):
+            item = super().get(block, timeout)
+            # The relay thread falls behind the worker
+            time.sleep(0.02)
+            return item
+
+    events = LaggingQueue()
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(worker, "SemanticScholarScraper", FakeScraper)
+    monkeypatch.setattr(server, "HTML_DIR", tmp_path)
+    monkeypatch.setattr(server, "DEBUG_DIR", tmp_path)
+    monkeypatch.setattr(server, "worker_pool", executor)
+    monkeypatch.setattr(server, "worker_events", events)
+    worker._init_worker(events)
+
+    async def run():
+        relay = asyncio.create_task(server._relay_worker_events())
+        published = asyncio.Queue()
+        try:
+            job = await server.start_scrape(ScrapeRequest(profile_url="https://www.semanticscholar.org/author/W/789", max_papers=5))
+            server.job_subscribers[job["job_id"]] = [published]
+            server.scheduler.start()
+            for _ in range(300):
+                if server.jobs[job["job_id"]]["status"] == "completed":
+                    break
+                await asyncio.sleep(0.01)
+            # Anything still in flight would land now
+            await asyncio.sleep(0.2)
+            return server.jobs[job["job_id"]], [published.get_nowait()[0] for _ in range(published.qsize())]
+        finally:
+            server.job_subscribers.clear()
+            await server.scheduler.stop()
+            relay.cancel()
+            await asyncio.gather(relay, return_exceptions=True)
+
+    try:
+        job, published = asyncio.run(run())
+    finally:
+        worker._shutdown_worker()
+        executor.shutdown()
+
+    assert job["status"] == "completed"
+    assert job["papers_completed"] == 5
+    assert job["message"] == "Scrape complete. Collected 5 papers."
+    assert published.count("paper") == 5
+    assert published[-1] == "result"
+
+
+def test_cache_purge_drops_expired_validation_entries_and_stale_results(tmp_path, monkeypatch):
+    cache = ValidationCache(tmp_path / "validation.sqlite3", negative_ttl=0)
+    cache.put("https://example.org/gone.pdf", INVALID, 404)
+    cache.put("https://arxiv.org/pdf/1.pdf", VALID, 200)
+    monkeypatch.setattr(validation_cache, "_default_cache", cache)
+    results = AuthorResultCache(tmp_path / "results.sqlite3")
+    results.put("old", 10, {"papers": []})
+    results.put("new", 10, {"papers": []})
+    results._connect().execute(
+        "UPDATE author_results SET created_at = ? WHERE author_id = 'old'",
+        (time.time() - SemanticScholarScraper.CACHE_STALE_TTL_SECONDS - 60,),
+    )
+    monkeypatch.setattr(result_cache, "_default_cache", results)
+
+    assert server._purge_caches() == {"validation": 1, "results": 1}
+    assert cache.get("https://arxiv.org/pdf/1.pdf") == VALID
+    assert results.latest("old") is None
+    assert results.latest("new") is not None
@@ -0,0 +1,110 @@
+import asyncio
+import queue
+import threading
+
+import semantic_scholar_scraper
+import worker
+from benchmarks.fake_upstream import Corpus, FakeUpstream, FaultProfile
+from worker import create_worker_pool, run_in_worker
+
+
+def test_run_in_worker_relays_progress_and_returns_ranked_papers(tmp_path, monkeypatch):
+    with FakeUpstream(Corpus({"9000008": 8}), FaultProfile()) as upstream:
+        # Spawned workers read their upstreams, caches and rate limit from the environment
+        for name, value in upstream.env().items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setenv("RESULT_CACHE_PATH", str(tmp_path / "results.sqlite3"))
+        monkeypatch.setenv("VALIDATION_CACHE_PATH", str(tmp_path / "validation.sqlite3"))
+        monkeypatch.setenv("S2_RATE_LIMIT_RPS", "100")
+        monkeypatch.setenv("S2_RATE_LIMIT_BURST", "10")
+
+        executor, events = create_worker_pool(1)
+        try:
+            results = []
+            for job_id, max_papers in (("job-1", 5), ("job-2", 8)):
+                params = {
+                    "author_id": "9000008",
+                    "max_papers": max_papers,
+                    "concurrency": 2,
+                    "use_cache": False,
+                    "race_strategies": False,
+                    "incremental": False,
+                    "html_path": str(tmp_path / f"{job_id}.html"),
+                    "debug_path": str(tmp_path / f"{job_id}.json"),
+                    "browser_available": False,
+                }
+                results.append(executor.submit(run_in_worker, job_id, params).result(timeout=60))
+        finally:
+            executor.shutdown()
+
+        relayed = []
+        while True:
+            try:
+                relayed.append(events.get(timeout=1))
+            except queue.Empty:
+                break
+
+    assert [len(ranked) for ranked in results] == [5, 8]
+    assert [index for index, _ in results[1]] == list(range(8))
+    citations = [int(paper["citations"].replace(",", "")) for _, paper in results[1]]
+    assert citations == sorted(citations, reverse=True)
+    assert (tmp_path / "job-2.html").exists() and (tmp_path / "job-2.json").exists()
+    assert upstream.requests["s2"] == 6
+
+    for job_id, total in (("job-1", 5), ("job-2", 8)):
+        job_events = [(event, data, fields) for relayed_id, event, data, fields in relayed if relayed_id == job_id]
+        assert any(event == "progress" for event, _, _ in job_events)
+        papers = [fields for event, _, fields in job_events if event == "paper"]
+        assert len(papers) == total
+        assert papers[-1] == {"papers_completed": total, "papers_total": total}
+
+
+def test_run_in_worker_returns_before_a_stale_cache_refresh_finishes(tmp_path, monkeypatch):
+    refresh_may_finish = threading.Event()
+    refreshed = threading.Event()
+
+    async def refresh():
+        await asyncio.to_thread(refresh_may_finish.wait, 5)
+        refreshed.set()
+
+    class StaleCacheScraper:
+        def __init__(self, max_papers, **kwargs):
+            self.selected_count = 0
+
+        async def iter_profile(self, author_id):
+            # Like a stale cache hit: serve the cached paper and refresh in the background
+            task = asyncio.create_task(refresh())
+            semantic_scholar_scraper._background_refreshes[(author_id, 1)] = task
+            task.add_done_callback(lambda _: semantic_scholar_scraper._background_refreshes.pop((author_id, 1), None))
+            self.selected_count = 1
+            yield {"index": 0, "paper_id": "p0", "paper": {"title": "Cached", "citations": "3"},
+                   "error": None, "elapsed": 0.0, "source": "cache"}
+
+        def build_debug_report(self, user_id):
+            return {"user_id": user_id}
+
+    monkeypatch.setattr(worker, "SemanticScholarScraper", StaleCacheScraper)
+    events = queue.Queue()
+    worker._init_worker(events)
+    try:
+        params = {
+            "author_id": "123",
+            "max_papers": 1,
+            "concurrency": 1,
+            "use_cache": True,
+            "race_strategies": False,
+            "incremental": False,
+            "html_path": str(tmp_path / "job.html"),
+            "debug_path": str(tmp_path / "job.json"),
+        }
+        ranked = worker.run_in_worker("job", params)
+
+        assert [paper["title"] for _, paper in ranked] == ["Cached"]
+        assert not refreshed.is_set()
+        # The refresh carries on on the worker's loop after the job has returned
+        refresh_may_finish.set()
+        assert refreshed.wait(5)
+        relayed = [events.get_nowait() for _ in range(events.qsize())]
+        assert relayed[-1] == ("job", worker.DONE_EVENT, None, {})
+    finally:
+        worker._shutdown_worker()
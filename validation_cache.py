@@ -0,0 +1,125 @@
+"""
+Persistent PDF link validation cache shared across jobs and processes.
+"""
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+VALID = "valid"
+INVALID = "invalid"  # definitive answer, e.g. 404 or not a PDF
+TRANSIENT = "transient"  # timeouts, connection errors, 5xx, 429
+
+
+class ValidationCache:
+    """SQLite-backed store of link validation outcomes with per-outcome TTLs.
+
+    Definitive answers are kept for ``positive_ttl``/``negative_ttl``. Transient
+    failures are recorded separately with a short ``transient_ttl`` so a flaky
+    host is retried on a later job instead of being blacklisted.
+    """
+
+    DEFAULT_PATH = Path(__file__).parent / ".cache" / "validation_cache.sqlite3"
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        positive_ttl: float = 7 * 24 * 60 * 60,
+        negative_ttl: float = 24 * 60 * 60,
+        transient_ttl: float = 10 * 60,
+    ):
+        self.path = Path(path) if path else self.DEFAULT_PATH
+        self.ttls = {
+            VALID: positive_ttl,
+            INVALID: negative_ttl,
+            TRANSIENT: transient_ttl,
+        }
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=5,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            # WAL lets other worker processes read while one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS validations ("
+                " url TEXT PRIMARY KEY,"
+                " outcome TEXT NOT NULL,"
+                " status INTEGER,"
+                " checked_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the cached outcome for ``url`` if it has not expired."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT outcome, checked_at FROM validations WHERE url = ?", (url,)
+                ).fetchone()
+        except sqlite3.Error as exc:
+            print(f"⚠️ Validation cache read failed: {exc}")
+            return None
+        if not row:
+            return None
+        outcome, checked_at = row
+        if time.time() - checked_at > self.ttls.get(outcome, 0):
+            return None
+        return outcome
+
+    def put(self, url: str, outcome: str, status: Optional[int] = None) -> None:
+        """Record the outcome of validating ``url``."""
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO validations (url, outcome, status, checked_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (url, outcome, status, time.time()),
+                )
+        except sqlite3.Error as exc:
+            print(f"⚠️ Validation cache write failed: {exc}")
+
+    def purge_expired(self) -> int:
+        """Delete expired rows and return how many were removed."""
+        now = time.time()
+        removed = 0
+        try:
+            with self._lock:
+                conn = self._connect()
+                for outcome, ttl in self.ttls.items():
+                    cursor = conn.execute(
+                        "DELETE FROM validations WHERE outcome = ? AND checked_at < ?",
+                        (outcome, now - ttl),
+                    )
+                    removed += cursor.rowcount
+        except sqlite3.Error as exc:
+            print(f"⚠️ Validation cache purge failed: {exc}")
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache: Optional[ValidationCache] = None
+
+
+def default_validation_cache() -> ValidationCache:
+    """Return the process-wide cache, stored at ``VALIDATION_CACHE_PATH`` if set."""
+    global _default_cache
+    if _default_cache is None:
+        path = os.getenv("VALIDATION_CACHE_PATH")
+        _default_cache = ValidationCache(Path(path) if path else None)
+    return _default_cache
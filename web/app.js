@@ -9,6 +9,10 @@ const htmlLink = document.getElementById("html-link");
 const debugLink = document.getElementById("debug-link");
 
 let pollTimer = null;
+let eventSource = null;
+
+// Reconnect attempts the browser may make before we give up on the stream
+const MAX_STREAM_RECONNECTS = 3;
 
 function showStatus(message, stage, percentage) {
   statusCard.classList.remove("hidden");
@@ -20,6 +24,19 @@ function showStatus(message, stage, percentage) {
   progressBar.style.width = `${value}%`;
 }
 
+function showProgress(status) {
+  let stage = status.stage || "";
+  if (status.papers_total) {
+    stage = `${stage} (${status.papers_completed}/${status.papers_total} papers)`;
+  }
+  showStatus(status.message, stage, status.percentage || 0);
+}
+
+function showError(error) {
+  statusText.textContent = `Error: ${error || "Unknown failure"}`;
+  stageText.textContent = "";
+}
+
 function showResult(data) {
   resultCard.classList.remove("hidden");
   resultSummary.textContent = `Fetched ${data.total_papers} papers.`;
@@ -27,11 +44,19 @@ function showResult(data) {
   debugLink.href = data.debug_url;
 }
 
-function resetUI() {
+function stopWatching() {
   if (pollTimer) {
     clearInterval(pollTimer);
     pollTimer = null;
   }
+  if (eventSource) {
+    eventSource.close();
+    eventSource = null;
+  }
+}
+
+function resetUI() {
+  stopWatching();
   statusCard.classList.add("hidden");
   resultCard.classList.add("hidden");
   progressBar.style.width = "0%";
@@ -46,6 +71,12 @@ async function startScrape(payload) {
     body: JSON.stringify(payload),
   });
 
+  if (response.status === 429) {
+    const retryAfter = response.headers.get("Retry-After");
+    const wait = retryAfter ? ` Try again in about ${retryAfter} seconds.` : "";
+    throw new Error(`The server is busy with other scrapes.${wait}`);
+  }
+
   if (!response.ok) {
     const text = await response.text();
     throw new Error(text || "Failed to start scrape");
@@ -62,6 +93,82 @@ async function fetchStatus(jobId) {
   return response.json();
 }
 
+function pollJob(jobId) {
+  pollTimer = setInterval(async () => {
+    try {
+      const status = await fetchStatus(jobId);
+      showProgress(status);
+
+      if (status.status === "completed") {
+        stopWatching();
+        showResult(status.result);
+      } else if (status.status === "failed" || status.status === "interrupted") {
+        stopWatching();
+        showError(status.error || status.message);
+      }
+    } catch (err) {
+      console.error(err);
+    }
+  }, 1500);
+}
+
+function watchJob(jobId) {
+  if (!window.EventSource) {
+    pollJob(jobId);
+    return;
+  }
+
+  let finished = false;
+  let reconnects = 0;
+  eventSource = new EventSource(`/api/events/${jobId}`);
+
+  eventSource.onopen = () => {
+    reconnects = 0;
+  };
+
+  eventSource.addEventListener("progress", (event) => {
+    reconnects = 0;
+    showProgress(JSON.parse(event.data));
+  });
+
+  eventSource.addEventListener("paper", (event) => {
+    reconnects = 0;
+    const paper = JSON.parse(event.data);
+    stageText.textContent = `Processed ${paper.papers_completed}/${paper.papers_total} papers`;
+  });
+
+  eventSource.addEventListener("result", (event) => {
+    finished = true;
+    stopWatching();
+    showStatus("Scrape complete", "Completed", 100);
+    showResult(JSON.parse(event.data).result);
+  });
+
+  eventSource.addEventListener("failed", (event) => {
+    finished = true;
+    stopWatching();
+    const data = JSON.parse(event.data);
+    showError(data.error || data.message);
+  });
+
+  eventSource.onerror = () => {
+    if (finished || !eventSource) {
+      return;
+    }
+    // A dropped connection is retried by the browser (readyState CONNECTING);
+    // poll only once it gives up or keeps failing, e.g. behind a buffering proxy
+    reconnects += 1;
+    if (eventSource.readyState !== EventSource.CLOSED && reconnects <= MAX_STREAM_RECONNECTS) {
+      console.warn(`Progress stream interrupted, reconnecting (${reconnects}/${MAX_STREAM_RECONNECTS})`);
+      return;
+    }
+    console.warn("Progress stream unavailable, falling back to polling");
+    eventSource.close();
+    eventSource = null;
+    pollJob(jobId);
+  };
+}
+
 form.addEventListener("submit", async (event) => {
   event.preventDefault();
   resetUI();
@@ -75,25 +182,7 @@ form.addEventListener("submit", async (event) => {
     const job = await startScrape({ profile_url: profileUrl, max_papers: maxPapers });
     showStatus("Scrape scheduled", "Waiting for progress…", 10);
 
-    pollTimer = setInterval(async () => {
-      try {
-        const status = await fetchStatus(job.job_id);
-        showStatus(status.message, status.stage || "", status.percentage || 0);
-
-        if (status.status === "completed") {
-          clearInterval(pollTimer);
-          pollTimer = null;
-          showResult(status.result);
-        } else if (status.status === "failed") {
-          clearInterval(pollTimer);
-          pollTimer = null;
-          statusText.textContent = `Error: ${status.error || "Unknown failure"}`;
-          stageText.textContent = "";
-        }
-      } catch (err) {
-        console.error(err);
-      }
-    }, 1500);
+    watchJob(job.job_id);
   } catch (error) {
     statusCard.classList.remove("hidden");
     statusText.textContent = `Error: ${error.message}`;
@@ -0,0 +1,200 @@
+"""
+Scrape job execution, either on the server's event loop or in worker processes.
+"""
+import asyncio
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from artifacts import ArtifactWriter, write_json_artifact
+from browser_pool import BrowserPool
+from extractor import PaperExtractor
+from html_generator import HTMLGenerator
+from semantic_scholar_scraper import SemanticScholarScraper
+
+# emit(job_id, event, data, fields): event is "progress" or "paper"
+Emitter = Callable[[str, str, Optional[Dict[str, Any]], Dict[str, Any]], None]
+Ranked = List[Tuple[int, Dict[str, Any]]]
+
+
+async def execute_scrape(
+    job_id: str,
+    params: Dict[str, Any],
+    emit: Emitter,
+    browser_pool: Optional[BrowserPool] = None,
+) -> Ranked:
+    """Scrape one author and write its HTML checklist and debug report,
+    each with precompressed siblings.
+
+    Returns ``(citation_rank, paper)`` pairs for the papers that made it into
+    the checklist, or an empty list if nothing was found. Rows are written
+    (in a thread) as papers complete, so the rendered HTML is never held in
+    memory; the paper records themselves are kept, since they are returned
+    for coalesced followers.
+    """
+    def progress_handler(stage: str, current: int, total: int, percentage: float) -> None:
+        percent_value = round(min(100.0, max(0.0, percentage)))
+        emit(job_id, "progress", None, {
+            "stage": stage,
+            "percentage": percent_value,
+            "message": f"{stage}… {percent_value}% complete",
+        })
+
+    author_id = params["author_id"]
+    scraper = SemanticScholarScraper(
+        api_key=os.getenv("SEMANTIC_SCHOLAR_API_KEY"),
+        max_papers=params["max_papers"],
+        verbose=False,
+        collect_debug=True,
+        progress_handler=progress_handler,
+        concurrency=params["concurrency"],
+        browser_pool=browser_pool,
+        use_cache=params["use_cache"],
+        race_strategies=params["race_strategies"],
+        incremental=params["incremental"],
+    )
+
+    # Rows are streamed to disk in citation order: a paper is written as soon
+    # as every higher-ranked paper has finished, so only out-of-order
+    # stragglers are buffered and the checklist is never held in memory.
+    ranked: Ranked = []
+    pending: Dict[int, Optional[Dict[str, Any]]] = {}
+    completed = next_index = 0
+
+    def take(index: int) -> Optional[Dict[str, Any]]:
+        paper = pending.pop(index)
+        if paper is None:
+            return None
+        validated = PaperExtractor.validate_paper_data(paper)
+        ranked.append((index, validated))
+        return validated
+
+    async def ordered_papers():
+        nonlocal completed, next_index
+        async for record in scraper.iter_profile(author_id):
+            completed += 1
+            paper = record["paper"] or {}
+            progress = {"papers_completed": completed, "papers_total": scraper.selected_count}
+            emit(job_id, "paper", {
+                "index": record["index"],
+                "title": paper.get("title", ""),
+                "ok": record["paper"] is not None,
+                "elapsed": record["elapsed"],
+                "source": record["source"],
+                **progress,
+            }, progress)
+            pending[record["index"]] = record["paper"]
+            while next_index in pending:
+                validated = take(next_index)
+                next_index += 1
+                if validated is not None:
+                    yield validated
+        for index in sorted(pending):
+            validated = take(index)
+            if validated is not None:
+                yield validated
+
+    writer = ArtifactWriter(Path(params["html_path"]))
+    papers = ordered_papers()
+    try:
+        await HTMLGenerator.write_html_async(
+            lambda chunk: asyncio.to_thread(writer.write, chunk),
+            papers,
+            author_id,
+            params.get("asset_urls"),
+        )
+    except BaseException:
+        writer.abort()
+        raise
+    finally:
+        await papers.aclose()
+    if not ranked:
+        await asyncio.to_thread(writer.abort)
+        return ranked
+    await asyncio.to_thread(writer.commit)
+
+    debug_report = scraper.build_debug_report(user_id=author_id)
+    await asyncio.to_thread(write_json_artifact, Path(params["debug_path"]), debug_report)
+    return ranked
+
+
+# Relayed after a job's last progress event, so the server knows all of them have arrived
+DONE_EVENT = "done"
+
+# Set in each worker process by _init_worker. The loop runs for the life of the
+# process in its own thread, so the shared rate limiter (one per loop) keeps its
+# tokens and 429 cooldown from job to job, the browser pool keeps its Chromium
+# running, and stale-cache refreshes carry on after their job has returned.
+_event_queue = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_browser_pool: Optional[BrowserPool] = None
+
+
+def _init_worker(event_queue) -> None:
+    global _event_queue, _loop, _browser_pool
+    _event_queue = event_queue
+    _loop = asyncio.new_event_loop()
+    threading.Thread(target=_loop.run_forever, name="worker-loop", daemon=True).start()
+    _browser_pool = BrowserPool.from_env()
+    # Enabled per job once the server's readiness check has passed
+    _browser_pool.available = False
+    atexit.register(_shutdown_worker)
+
+
+def _shutdown_worker() -> None:
+    global _loop
+    loop, _loop = _loop, None
+    if loop is None:
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_browser_pool.close(), loop).result(timeout=10)
+    except Exception:  # pylint: disable=broad-except
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def _relay(job_id: str, event: str, data: Optional[Dict[str, Any]], fields: Dict[str, Any]) -> None:
+    _event_queue.put((job_id, event, data, fields))
+
+
+async def _execute(job_id: str, params: Dict[str, Any]) -> Ranked:
+    try:
+        if _browser_pool.available and _browser_pool.warm_start:
+            # Replace a browser that died since the last job before relying on it
+            await _browser_pool.health_check()
+            await _browser_pool.warm()
+        return await execute_scrape(job_id, params, _relay, browser_pool=_browser_pool)
+    finally:
+        _relay(job_id, DONE_EVENT, None, {})
+
+
+def run_in_worker(job_id: str, params: Dict[str, Any]) -> Ranked:
+    """Process-pool entry point. Runs the job on the worker's long-lived loop
+    with its own browser pool, which is enabled only if ``params["browser_available"]``
+    says the server's Playwright readiness check passed. Returns as soon as
+    the checklist is written; a stale-cache refresh keeps running on the loop."""
+    _browser_pool.available = bool(params.get("browser_available"))
+    return asyncio.run_coroutine_threadsafe(_execute(job_id, params), _loop).result()
+
+
+def create_worker_pool(workers: int) -> Tuple[ProcessPoolExecutor, Any]:
+    """Start a process pool and the queue its workers relay progress through.
+
+    Workers are spawned rather than forked so they don't inherit the
+    server's event loop, threads or open browser connections. Each one
+    keeps a single event loop and browser pool for all of its jobs, and
+    relays ``DONE_EVENT`` after each job's last progress event.
+    """
+    context = multiprocessing.get_context("spawn")
+    event_queue = context.Queue()
+    executor = ProcessPoolExecutor(
+        max_workers=max(1, workers),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(event_queue,),
+    )
+    return executor, event_queue